@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Benchmark the README / SVG generation pipeline on synthetic data.
+
+Builds synthetic resource tables (1k / 10k / 100k rows, at a narrow and a wide
+category / sub-category fan-out) and repo-ticker CSVs, then times the hot paths:
+render_readme (serially and, with --jobs N, in N worker processes), build_toc,
+build_list, format_entry (memo warm and cold), iter_rows (CSV parse vs. column
+sidecar), generate_ticker_svg, and generate_recently_added_svg.build_svg. Each
+case reports the best of --repeat runs (the least noisy estimator on a shared
+machine).
+
+Results are compared against / recorded to a JSON baseline
+(benchmarks/baseline.json). With --check, any case slower than its baseline by
+more than --threshold (a fraction; default 0.30) fails the run with exit 1.
+Timings are machine-specific, so the baseline is local and not committed: the
+first --check on a machine records one instead of comparing, and --save
+re-records it. Don't run --check in CI, where every runner is a new machine.
+
+Run:  venv/bin/python benchmarks/bench_pipeline.py [--check] [--save]   (or `make bench`)
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+sys.path.insert(0, str(BASE / "ticker"))
+
+import generate_readme as gen  # noqa: E402
+import generate_recently_added_svg as recently_added  # noqa: E402
+import generate_ticker_svg as ticker  # noqa: E402
+from resources import resource_utils  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+SIZES = (1_000, 10_000, 100_000)
+# name -> (categories, sub-categories per category)
+FANOUTS = {"narrow": (6, 2), "wide": (40, 8)}
+TICKER_REPOS = 1_000
+TABLE_HEADER = (
+    "ID,Display Name,Category,Sub-Category,Link,Author Name,Author Link,Active,Date Added,Last Checked,Description,Stale"
+).split(",")
+DEFAULT_THRESHOLD = 0.30
+# Cases faster than this are all noise; never flag them as regressions.
+NOISE_FLOOR = 0.002
+
+
+# --------------------------------------------------------------------------- #
+# Synthetic inputs
+# --------------------------------------------------------------------------- #
+def synthetic_table(
+    n_rows: int, n_categories: int, n_subs: int, seed: int = 0
+) -> tuple[list[dict[str, str]], list[dict[str, Any]]]:
+    """(active rows projected to RENDER_COLUMNS, categories in load_config's shape)."""
+    rng = random.Random(seed)
+    categories = [
+        {
+            "name": f"Category {c:02d}",
+            "description": f"Things in category {c}.",
+            "subcategories": [{"name": f"Sub {c:02d}-{s}", "description": ""} for s in range(n_subs)],
+        }
+        for c in range(n_categories)
+    ]
+    rows = []
+    for i in range(n_rows):
+        cat = categories[rng.randrange(n_categories)]
+        # ~1 in 5 rows has no sub-category (renders under the bare category).
+        sub = rng.choice(cat["subcategories"])["name"] if rng.random() > 0.2 else ""
+        owner, repo = f"owner{rng.randrange(n_rows)}", f"tool-{i}"
+        github = rng.random() < 0.7
+        rows.append(
+            {
+                "ID": f"syn-{i:08x}",
+                "Display Name": f"Tool {i} {rng.choice(['alpha', 'beta', 'Gamma', 'delta'])}",
+                "Category": cat["name"],
+                "Sub-Category": sub,
+                "Link": f"https://github.com/{owner}/{repo}" if github else f"https://example.com/{repo}",
+                "Author Name": owner,
+                "Author Link": f"https://github.com/{owner}",
+                "Description": f"A synthetic resource number {i} for *benchmarking* [the] renderer.",
+            }
+        )
+    return rows, categories
+
+
+def synthetic_ticker_csv(path: Path, n_repos: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["full_name", "stars", "watchers", "forks", "stars_delta", "watchers_delta", "forks_delta", "url"]
+        )
+        for i in range(n_repos):
+            name, stars = f"owner{i}/repo-{i}", rng.randrange(100_000)
+            writer.writerow(
+                [name, stars, stars, stars // 7, rng.randrange(-5, 500), 0, 0, f"https://github.com/{name}"]
+            )
+
+
+def write_table_csv(path: Path, rows: list[dict[str, str]]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=TABLE_HEADER, lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, "Active": "TRUE", "Stale": "FALSE"})
+
+
+def _card_rows(rows: list[dict[str, str]]) -> list[dict[str, str]]:
+    return [
+        {
+            "Display Name": r["Display Name"],
+            "Author Name": r["Author Name"],
+            "Category": r["Category"],
+            "Description": r["Description"],
+            "Date Added": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}:00-00-00",
+            "Active": "TRUE",
+        }
+        for i, r in enumerate(rows)
+    ]
+
+
+# --------------------------------------------------------------------------- #
+# Timing
+# --------------------------------------------------------------------------- #
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_cases(sizes: tuple[int, ...], fanouts: list[str], repeat: int, jobs: int = 1) -> dict[str, float]:
+    """Time every case; returns {case key: best seconds}. jobs > 1 adds --jobs render cases."""
+    template = gen.TEMPLATE_PATH.read_text(encoding="utf-8")
+    results: dict[str, float] = {}
+
+    for size in sizes:
+        for fanout in fanouts:
+            rows, categories = synthetic_table(size, *FANOUTS[fanout])
+            groups = gen.group_rows(rows)
+            tag = f"[{size},{fanout}]"
+            # Loop values are bound as defaults so each case times its own inputs.
+            results[f"render_readme{tag}"] = best_of(
+                lambda rows=rows, categories=categories: gen.render_readme(template, rows, categories), repeat
+            )
+            if jobs > 1:
+                results[f"render_readme_jobs{jobs}{tag}"] = best_of(
+                    lambda rows=rows, categories=categories: gen.render_readme(template, rows, categories, jobs=jobs),
+                    repeat,
+                )
+            results[f"build_toc{tag}"] = best_of(
+                lambda rows=rows, categories=categories, groups=groups: gen.build_toc(rows, categories, groups), repeat
+            )
+            results[f"build_list{tag}"] = best_of(
+                lambda rows=rows, categories=categories, groups=groups: gen.build_list(rows, categories, groups), repeat
+            )
+        rows, _ = synthetic_table(size, *FANOUTS[fanouts[0]])
+        results[f"format_entry[{size}]"] = best_of(
+            lambda rows=rows: [gen.formatter.format_entry(r) for r in rows], repeat
+        )
+
+        def format_cold(rows: list[dict[str, str]] = rows) -> None:
+            gen.formatter.clear_memo()
+            for r in rows:
+                gen.formatter.format_entry(r)
+
+        results[f"format_entry_cold[{size}]"] = best_of(format_cold, repeat)
+        cards = _card_rows(rows)
+
+        def carousel(cards: list[dict[str, str]] = cards) -> None:
+            recent = recently_added.select_recent(cards, recently_added.RECENT_COUNT)
+            for theme in ("dark", "light"):
+                recently_added.build_svg(recent, theme)
+
+        results[f"recently_added.build_svg[{size}]"] = best_of(carousel, repeat)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            table_csv = Path(tmp) / "table.csv"
+            write_table_csv(table_csv, rows)
+            sidecar = resource_utils.cache_path(table_csv, "columns.json")
+
+            def load(cold: bool, sidecar: Path = sidecar, table_csv: Path = table_csv) -> None:
+                if cold:
+                    sidecar.unlink(missing_ok=True)
+                rows = resource_utils.iter_rows(gen.RENDER_COLUMNS, active_only=True, csv_path=table_csv, cached=True)
+                for _ in rows:
+                    pass
+
+            results[f"iter_rows_parse[{size}]"] = best_of(lambda load=load: load(cold=True), repeat)
+            results[f"iter_rows_sidecar[{size}]"] = best_of(lambda load=load: load(cold=False), repeat)
+
+    # No token: generate_ticker_svg must not reach the network while being timed.
+    token = os.environ.pop("GITHUB_TOKEN", None)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ticker_csv = Path(tmp) / "repo-ticker.csv"
+            synthetic_ticker_csv(ticker_csv, TICKER_REPOS)
+            random.seed(0)
+            results[f"generate_ticker_svg[{TICKER_REPOS}]"] = best_of(
+                lambda: ticker.generate_ticker_svg(ticker.load_repos(ticker_csv)), repeat
+            )
+    finally:
+        if token is not None:
+            os.environ["GITHUB_TOKEN"] = token
+    return results
+
+
+# --------------------------------------------------------------------------- #
+# Baseline
+# --------------------------------------------------------------------------- #
+def find_regressions(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[tuple[str, float, float]]:
+    """(case, baseline s, current s) for every case slower than baseline * (1 + threshold)."""
+    out = []
+    for case, seconds in results.items():
+        base = baseline.get(case)
+        if base is None or seconds < NOISE_FLOOR:
+            continue
+        if seconds > base * (1 + threshold):
+            out.append((case, base, seconds))
+    return out
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("results", {})
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {case: round(seconds, 6) for case, seconds in sorted(results.items())},
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Row counts to benchmark.")
+    p.add_argument("--fanout", choices=sorted(FANOUTS), nargs="+", default=sorted(FANOUTS))
+    p.add_argument("--repeat", type=int, default=5, help="Runs per case; the best is reported.")
+    p.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    p.add_argument("--save", action="store_true", help="Record these results as the new baseline.")
+    p.add_argument("--check", action="store_true", help="Exit 1 if any case regressed past --threshold.")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    p.add_argument("--jobs", type=int, default=1, help="Also time render_readme with this many worker processes.")
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    baseline = load_baseline(args.baseline)
+    results = run_cases(tuple(args.sizes), args.fanout, args.repeat, args.jobs)
+
+    width = max(len(case) for case in results)
+    for case, seconds in results.items():
+        base = baseline.get(case)
+        vs = f"  ({seconds / base:5.2f}x baseline)" if base else ""
+        print(f"{case:<{width}}  {seconds * 1000:10.2f} ms{vs}")
+
+    if args.save or (args.check and not baseline):
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"Saved baseline to {args.baseline}")
+    if args.check and not baseline:
+        print("No baseline on this machine yet; recorded one. Rerun to compare against it.")
+    elif args.check:
+        regressions = find_regressions(results, baseline, args.threshold)
+        for case, base, seconds in regressions:
+            print(f"REGRESSION {case}: {base * 1000:.2f} ms -> {seconds * 1000:.2f} ms", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,18 +13,38 @@ Properties:
     config.yaml, generation aborts with a non-zero exit and writes nothing.
 
 Run:  venv/bin/python generate_readme.py   (or `make generate`)
+      venv/bin/python generate_readme.py --incremental   (what `make readme` runs:
+      re-renders only the category sections whose inputs changed)
+      venv/bin/python generate_readme.py --jobs 8   (renders category sections in
+      8 worker processes; output is identical)
+      venv/bin/python generate_readme.py --json resources.json --ndjson resources.ndjson
+          (also writes a machine-readable index of the same active rows)
+      venv/bin/python generate_readme.py --shard-dir categories   (one markdown page
+          per category; README.md keeps only a TOC linking to them. The directory
+          must not be README.md's own; files not listed in its .generated-pages.json
+          are never overwritten or deleted)
+      venv/bin/python generate_readme.py --static-badges   (badge lines point at the
+          local SVGs in assets/badges/ instead of img.shields.io)
 """
 
 from __future__ import annotations
 
-import csv
+import argparse
+import hashlib
 import importlib.util
+import json
+import os
 import re
 import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
+from resources.categories import load_config as load_category_config
+from resources.resource_utils import iter_rows
+from resources.safe_io import atomic_open, atomic_write_text, locked
 
 BASE = Path(__file__).resolve().parent
 CSV_PATH = BASE / "THE_RESOURCES_TABLE_NEW.csv"
@@ -36,6 +56,8 @@ TOC_TOKEN = "{{TABLE_OF_CONTENTS}}"
 LIST_TOKEN = "{{THE_LIST}}"
 TICKER_TOKEN = "{{CLAUDE_CODE_TICKER}}"
 RECENTLY_ADDED_TOKEN = "{{RECENTLY_ADDED}}"
+# Any {{UPPER_SNAKE}} placeholder; unrecognized ones are left in the output verbatim.
+TOKEN_RE = re.compile(r"(\{\{[A-Z][A-Z0-9_]*\}\})")
 
 # Ticker SVG asset, relative to README.md at the repo root. The "awesome" (clean,
 # minimal) style is the canonical plain look for this list; produced out-of-band
@@ -47,19 +69,59 @@ TICKER_SVG = "assets/repo-ticker.svg"
 RECENTLY_ADDED_SVG = "assets/recently-added.svg"
 RECENTLY_ADDED_SVG_LIGHT = "assets/recently-added-light.svg"
 
+# Per-repo badge SVGs for --static-badges, produced out-of-band from the cached
+# repo metadata by resources/generate_badge_svgs.py (`make badges`).
+BADGE_DIR = BASE / "assets" / "badges"
+
+# The CSV columns rendering needs (validation, grouping, format_entry); the rest
+# (dates, Active/Stale flags) are never read, so they're not loaded.
+RENDER_COLUMNS = (
+    "ID",
+    "Display Name",
+    "Category",
+    "Sub-Category",
+    "Link",
+    "Author Name",
+    "Author Link",
+    "Description",
+)
+
 
 def _load_formatter() -> Any:
-    """Import the hyphen-named formatter module by path."""
+    """Import the hyphen-named formatter module by path, once per process.
+
+    Loaded on first use rather than at import time, and registered in sys.modules
+    so later callers (and `generate_readme.formatter`) share the same module and
+    its memo. The source loader caches the compiled bytecode in __pycache__.
+    """
+    module = sys.modules.get("awesome_formatter")
+    if module is not None:
+        return module
     path = BASE / "resources" / "awesome-list-entry-formatter.py"
     spec = importlib.util.spec_from_file_location("awesome_formatter", path)
     if spec is None or spec.loader is None:  # pragma: no cover - defensive
         raise ImportError(f"cannot load formatter module from {path}")
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    sys.modules["awesome_formatter"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules["awesome_formatter"]
+        raise
     return module
 
 
-formatter = _load_formatter()
+def available_badges(badge_dir: Path | None = None) -> list[str]:
+    """"owner/repo" for every badge SVG under `badge_dir` (default BADGE_DIR)."""
+    badge_dir = badge_dir or BADGE_DIR
+    return sorted(f"{path.parent.name}/{path.stem}" for path in badge_dir.glob("*/*.svg"))
+
+
+def __getattr__(name: str) -> Any:
+    # `generate_readme.formatter` is loaded lazily (PEP 562 module __getattr__).
+    if name == "formatter":
+        return _load_formatter()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # --------------------------------------------------------------------------- #
@@ -69,35 +131,19 @@ def load_config() -> list[dict[str, Any]]:
     """Return the ordered list of category mappings from config.yaml.
 
     Each item is normalized to {name, description, subcategories} where
-    subcategories is a list of {name, description}.
+    subcategories is a list of {name, description}. Parsed once per process and
+    cached on disk by resources.categories.load_config.
     """
-    data = yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8")) or {}
-    raw_categories = data.get("categories", []) or []
-    categories: list[dict[str, Any]] = []
-    for raw in raw_categories:
-        if isinstance(raw, str):
-            raw = {"name": raw}
-        subs_out: list[dict[str, str]] = []
-        for sub in raw.get("subcategories", []) or []:
-            if isinstance(sub, str):
-                sub = {"name": sub}
-            subs_out.append(
-                {"name": sub["name"], "description": (sub.get("description") or "").strip()}
-            )
-        categories.append(
-            {
-                "name": raw["name"],
-                "description": (raw.get("description") or "").strip(),
-                "subcategories": subs_out,
-            }
-        )
-    return categories
+    return load_category_config(CONFIG_PATH).categories
 
 
 def load_active_rows() -> list[dict[str, str]]:
-    with CSV_PATH.open(encoding="utf-8", newline="") as fh:
-        rows = list(csv.DictReader(fh))
-    return [r for r in rows if (r.get("Active") or "").strip().upper() == "TRUE"]
+    """Active rows, projected to RENDER_COLUMNS (read through the CSV's column sidecar,
+    since the whole projection is held in memory anyway)."""
+    return [
+        dict(zip(RENDER_COLUMNS, values))
+        for values in iter_rows(RENDER_COLUMNS, active_only=True, csv_path=CSV_PATH, cached=True)
+    ]
 
 
 def validate_categories(rows: list[dict[str, str]], categories: list[dict[str, Any]]) -> None:
@@ -141,73 +187,156 @@ def _sort_key(row: dict[str, str]) -> str:
     return row["Display Name"].casefold()
 
 
-def _render_entries(rows: list[dict[str, str]]) -> str:
-    """Alphabetical (case-insensitive) entries, blank line between each."""
-    ordered = sorted(rows, key=_sort_key)
-    return "\n\n".join(formatter.format_entry(r) for r in ordered)
+# Category -> Sub-Category ("" = none) -> that bucket's rows, already in render order.
+Groups = dict[str, dict[str, list[dict[str, str]]]]
+
 
+def group_rows(rows: list[dict[str, str]]) -> Groups:
+    """Bucket rows by (Category, Sub-Category) in one pass, each bucket pre-sorted.
 
-def build_list(rows: list[dict[str, str]], categories: list[dict[str, Any]]) -> str:
+    Built once per render and shared by build_toc / build_list, so rendering is
+    linear in the row count instead of rescanning every row once per category and
+    sub-category. Sorting is stable, so ties keep their CSV order exactly as a
+    per-section sorted() would.
+    """
+    groups: Groups = {}
+    for row in rows:
+        category = (row.get("Category") or "").strip()
+        sub = (row.get("Sub-Category") or "").strip()
+        groups.setdefault(category, {}).setdefault(sub, []).append(row)
+    for subs in groups.values():
+        for bucket in subs.values():
+            bucket.sort(key=_sort_key)
+    return groups
+
+
+def _ordered_subs(cat: dict[str, Any], subs: dict[str, list[dict[str, str]]]) -> list[dict[str, str]]:
+    """Sub-categories present on entries: config order first, then any leftover
+    (lenient) sub-categories alphabetically. The "" (none) bucket is excluded."""
+    configured_names = {s["name"] for s in cat["subcategories"]}
+    leftover = sorted(n for n in subs if n and n not in configured_names)
+    return [s for s in cat["subcategories"] if s["name"] in subs] + [
+        {"name": n, "description": ""} for n in leftover
+    ]
+
+
+def _iter_entries(ordered: list[dict[str, str]]) -> Iterator[str]:
+    """Entries (already sorted by group_rows), each preceded by its blank-line separator."""
+    format_entry = _load_formatter().format_entry
+    for row in ordered:
+        yield "\n\n" + format_entry(row)
+
+
+def iter_category(cat: dict[str, Any], subs: dict[str, list[dict[str, str]]]) -> Iterator[str]:
+    """Render one `## Category` section from its group_rows bucket, chunk by chunk."""
+    yield f"## {cat['name']}"
+    if cat["description"]:
+        yield "\n\n" + cat["description"]
+
+    if not subs.keys() - {""} and not cat["subcategories"]:
+        # Flat category: render entries directly under the heading.
+        yield from _iter_entries(subs.get("", []))
+        return
+    # Entries with no sub-category come first, then ordered sub-sections.
+    yield from _iter_entries(subs.get("", []))
+    for sub in _ordered_subs(cat, subs):
+        yield f"\n\n### {sub['name']}"
+        if sub.get("description"):
+            yield "\n\n" + sub["description"]
+        yield from _iter_entries(subs[sub["name"]])
+
+
+def render_category(cat: dict[str, Any], subs: dict[str, list[dict[str, str]]]) -> str:
+    """Render one `## Category` section from its group_rows bucket."""
+    return "".join(iter_category(cat, subs))
+
+
+def iter_sections(
+    categories: list[dict[str, Any]],
+    groups: Groups,
+    reuse: dict[str, str] | None = None,
+    jobs: int = 1,
+) -> Iterator[tuple[str, Iterator[str]]]:
+    """(category name, chunks of its block) for every non-empty category, in config order.
+
+    `reuse` maps a category name to an already-rendered block (see the incremental
+    mode below) that is spliced in verbatim instead of being re-rendered. With
+    jobs > 1 the remaining sections are rendered up front in that many worker
+    processes; otherwise each is rendered lazily as its chunks are consumed.
+    """
+    reuse = reuse or {}
+    # Skip categories with no active entries (mirrors build_toc) so a category
+    # declared ahead of its first resource doesn't render as a bare heading. It
+    # stays in config.yaml for ordering + validation.
+    present = [cat for cat in categories if groups.get(cat["name"])]
+    todo = [cat for cat in present if cat["name"] not in reuse]
+    rendered = _render_parallel(todo, groups, jobs) if jobs > 1 and len(todo) > 1 else {}
+    for cat in present:
+        block = reuse.get(cat["name"], rendered.get(cat["name"]))
+        yield cat["name"], iter((block,)) if block is not None else iter_category(cat, groups[cat["name"]])
+
+
+def render_sections(
+    categories: list[dict[str, Any]],
+    groups: Groups,
+    reuse: dict[str, str] | None = None,
+    jobs: int = 1,
+) -> list[tuple[str, str]]:
+    """iter_sections with each block joined: [(category name, rendered block)]."""
+    return [(name, "".join(chunks)) for name, chunks in iter_sections(categories, groups, reuse, jobs)]
+
+
+def _render_parallel(todo: list[dict[str, Any]], groups: Groups, jobs: int) -> dict[str, str]:
+    """render_category for each of `todo` in a process pool; {category name: block}.
+
+    Each section is a pure function of its (cat, subs) arguments, so where it is
+    rendered can't change its bytes. The largest sections are submitted first so
+    one big category doesn't start last and leave the other workers idle.
+    """
+    by_size = sorted(todo, key=lambda cat: -sum(map(len, groups[cat["name"]].values())))
+    static = _load_formatter().static_badges()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(todo)), initializer=_init_worker, initargs=(static,)) as pool:
+        futures = {cat["name"]: pool.submit(render_category, cat, groups[cat["name"]]) for cat in by_size}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _init_worker(static_badges: frozenset[str] | None) -> None:
+    # Workers don't inherit the formatter's badge mode under the spawn start method.
+    _load_formatter().use_static_badges(static_badges)
+
+
+def build_list(
+    rows: list[dict[str, str]],
+    categories: list[dict[str, Any]],
+    groups: Groups | None = None,
+    jobs: int = 1,
+) -> str:
     """Render the full categorized list for {{THE_LIST}}."""
-    blocks: list[str] = []
-    for cat in categories:
-        cat_rows = [r for r in rows if (r.get("Category") or "").strip() == cat["name"]]
-        if not cat_rows:
-            # Skip categories with no active entries (mirrors build_toc) so a
-            # category declared ahead of its first resource doesn't render as a
-            # bare heading. It stays in config.yaml for ordering + validation.
-            continue
-        section: list[str] = [f"## {cat['name']}"]
-        if cat["description"]:
-            section.append(cat["description"])
-
-        configured_subs = cat["subcategories"]
-        configured_names = [s["name"] for s in configured_subs]
-        # Sub-categories actually present on entries, in config order first, then
-        # any leftover (lenient) sub-categories alphabetically; finally "" (none).
-        present = {(r.get("Sub-Category") or "").strip() for r in cat_rows}
-        leftover = sorted(n for n in present if n and n not in configured_names)
-
-        if not present - {""} and not configured_subs:
-            # Flat category: render entries directly under the heading.
-            body = _render_entries(cat_rows)
-            if body:
-                section.append(body)
-        else:
-            # Entries with no sub-category come first, then ordered sub-sections.
-            no_sub = [r for r in cat_rows if not (r.get("Sub-Category") or "").strip()]
-            if no_sub:
-                section.append(_render_entries(no_sub))
-            for sub in configured_subs + [{"name": n, "description": ""} for n in leftover]:
-                sub_rows = [
-                    r for r in cat_rows if (r.get("Sub-Category") or "").strip() == sub["name"]
-                ]
-                if not sub_rows:
-                    continue
-                sub_block = [f"### {sub['name']}"]
-                if sub.get("description"):
-                    sub_block.append(sub["description"])
-                sub_block.append(_render_entries(sub_rows))
-                section.append("\n\n".join(sub_block))
-
-        blocks.append("\n\n".join(section))
-    return "\n\n".join(blocks)
-
-
-def build_toc(rows: list[dict[str, str]], categories: list[dict[str, Any]]) -> str:
-    """Render the nested Table of Contents for {{TABLE_OF_CONTENTS}}."""
+    groups = group_rows(rows) if groups is None else groups
+    return "\n\n".join(block for _, block in render_sections(categories, groups, jobs=jobs))
+
+
+def build_toc(
+    rows: list[dict[str, str]],
+    categories: list[dict[str, Any]],
+    groups: Groups | None = None,
+    pages: dict[str, str] | None = None,
+) -> str:
+    """Render the nested Table of Contents for {{TABLE_OF_CONTENTS}}.
+
+    `pages` maps a category name to the page its section lives on (see
+    --shard-dir); without it every link is an anchor in the README itself.
+    """
+    groups = group_rows(rows) if groups is None else groups
     lines: list[str] = []
     for cat in categories:
-        cat_rows = [r for r in rows if (r.get("Category") or "").strip() == cat["name"]]
-        if not cat_rows:
+        subs = groups.get(cat["name"])
+        if not subs:
             continue
-        lines.append(f"- [{cat['name']}](#{github_slug(cat['name'])})")
-        configured_names = [s["name"] for s in cat["subcategories"]]
-        present = {(r.get("Sub-Category") or "").strip() for r in cat_rows}
-        leftover = sorted(n for n in present if n and n not in configured_names)
-        for name in configured_names + leftover:
-            if any((r.get("Sub-Category") or "").strip() == name for r in cat_rows):
-                lines.append(f"  - [{name}](#{github_slug(name)})")
+        page = (pages or {}).get(cat["name"], "")
+        lines.append(f"- [{cat['name']}]({page or '#' + github_slug(cat['name'])})")
+        for sub in _ordered_subs(cat, subs):
+            lines.append(f"  - [{sub['name']}]({page}#{github_slug(sub['name'])})")
     return "\n".join(lines)
 
 
@@ -244,31 +373,433 @@ def recently_added_markup() -> str:
     )
 
 
+# --------------------------------------------------------------------------- #
+# Template substitution
+#
+# The template is split once on its {{TOKEN}} placeholders and the output is the
+# literal pieces and token values joined in a single pass, so the document is
+# built once rather than copied per token. TOC / THE_LIST values come from the
+# render; every other token is looked up in TOKEN_RENDERERS.
+# --------------------------------------------------------------------------- #
+# token -> zero-argument renderer for tokens that don't depend on the rows.
+TOKEN_RENDERERS: dict[str, Callable[[], str]] = {
+    TICKER_TOKEN: ticker_markup,
+    RECENTLY_ADDED_TOKEN: recently_added_markup,
+}
+
+
+def register_token(token: str, render: Callable[[], str]) -> None:
+    """Substitute `token` (a {{UPPER_SNAKE}} placeholder) with render()'s output."""
+    if not TOKEN_RE.fullmatch(token):
+        raise ValueError(f"not a template token: {token!r}")
+    TOKEN_RENDERERS[token] = render
+
+
+@lru_cache(maxsize=8)
+def split_template(template: str) -> tuple[str, ...]:
+    """(literal, token, literal, ..., literal): tokens sit at the odd indices."""
+    return tuple(TOKEN_RE.split(template))
+
+
+def template_parts(template: str, values: dict[str, str]) -> list[str]:
+    """The template's pieces with each token resolved from `values`, then TOKEN_RENDERERS."""
+    parts = list(split_template(template))
+    for i in range(1, len(parts), 2):
+        token = parts[i]
+        if token in values:
+            parts[i] = values[token]
+        elif token in TOKEN_RENDERERS:
+            parts[i] = TOKEN_RENDERERS[token]()
+    return parts
+
+
+def _substitute(template: str, toc: str, the_list: str) -> str:
+    return "".join(template_parts(template, {TOC_TOKEN: toc, LIST_TOKEN: the_list}))
+
+
+def iter_readme(
+    template: str,
+    rows: list[dict[str, str]],
+    categories: list[dict[str, Any]],
+    *,
+    groups: Groups | None = None,
+    reuse: dict[str, str] | None = None,
+    jobs: int = 1,
+    spans: list[tuple[str, int, int]] | None = None,
+    pages: dict[str, str] | None = None,
+) -> Iterator[str]:
+    """render_readme's output as a stream of chunks (template pieces, headings, entries).
+
+    The list is never joined into one string, so a consumer writing the chunks
+    out holds at most one section's worth of text (with jobs > 1, the rendered
+    sections). If `spans` is given and the template has exactly one {{THE_LIST}},
+    (category name, start, end) character offsets of each section are appended
+    to it as the stream passes them. With `pages` (see build_toc) the sections
+    live elsewhere: the TOC links to them and {{THE_LIST}} is left empty.
+    """
+    groups = group_rows(rows) if groups is None else groups
+    pieces = split_template(template)
+    values = {TOC_TOKEN: build_toc(rows, categories, groups, pages)}
+    if pages is not None:
+        values[LIST_TOKEN] = ""
+    parts = template_parts(template, values)
+    track = spans is not None and pieces.count(LIST_TOKEN) == 1
+    pos = 0
+    for i, part in enumerate(parts):
+        if i % 2 == 0 or pieces[i] != LIST_TOKEN or pages is not None:
+            pos += len(part)
+            yield part
+            continue
+        for n, (name, chunks) in enumerate(iter_sections(categories, groups, reuse, jobs)):
+            if n:
+                pos += 2
+                yield "\n\n"
+            start = pos
+            for chunk in chunks:
+                pos += len(chunk)
+                yield chunk
+            if track:
+                spans.append((name, start, pos))
+
+
 def render_readme(
-    template: str, rows: list[dict[str, str]], categories: list[dict[str, Any]]
+    template: str, rows: list[dict[str, str]], categories: list[dict[str, Any]], jobs: int = 1
 ) -> str:
     """Pure render: substitute the TOC, list, ticker, and carousel tokens.
 
     Deterministic in (template, rows, categories) — the basis of idempotency.
+    `jobs` only changes how the sections are rendered (see iter_sections).
     """
-    return (
-        template.replace(TOC_TOKEN, build_toc(rows, categories))
-        .replace(LIST_TOKEN, build_list(rows, categories))
-        .replace(TICKER_TOKEN, ticker_markup())
-        .replace(RECENTLY_ADDED_TOKEN, recently_added_markup())
+    return "".join(iter_readme(template, rows, categories, jobs=jobs))
+
+
+# --------------------------------------------------------------------------- #
+# Incremental regeneration
+#
+# A sidecar manifest records, per category section, a hash of its inputs (the
+# category's config entry + its rows) and the span the section occupies in the
+# README it describes. With --incremental, sections whose hash is unchanged are
+# sliced out of the existing README instead of being re-rendered; everything else
+# (TOC, template, changed sections) is rendered as usual, so the result is the
+# same bytes a full render produces. The manifest is trusted only if README.md
+# still hashes to what it recorded and the template + renderer code are unchanged;
+# otherwise the run silently falls back to a full render.
+# --------------------------------------------------------------------------- #
+MANIFEST_PATH = BASE / ".cache" / "readme-manifest.json"
+MANIFEST_VERSION = 1
+# format_entry's memo, carried across --incremental runs (see the formatter).
+FORMAT_MEMO_PATH = BASE / ".cache" / "format-entry-memo.json"
+
+
+def _sha256(data: str | bytes) -> str:
+    return hashlib.sha256(data.encode("utf-8") if isinstance(data, str) else data).hexdigest()
+
+
+def render_fingerprint(template: str) -> str:
+    """Hash of everything that shapes a section besides its own inputs."""
+    sources = [template, Path(__file__).read_text(encoding="utf-8")]
+    sources.append((BASE / "resources" / "awesome-list-entry-formatter.py").read_text(encoding="utf-8"))
+    sources.append(_load_formatter().badge_mode())
+    return _sha256("\0".join(sources))
+
+
+def section_hashes(categories: list[dict[str, Any]], groups: Groups) -> dict[str, str]:
+    """Input hash per non-empty category: its config entry + its grouped rows."""
+    return {
+        cat["name"]: _sha256(json.dumps([cat, groups[cat["name"]]], sort_keys=True))
+        for cat in categories
+        if groups.get(cat["name"])
+    }
+
+
+def load_manifest(fingerprint: str) -> tuple[dict[str, Any], str] | None:
+    """(manifest, current README text) if the manifest still describes README.md."""
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        raw = OUTPUT_PATH.read_bytes()
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("fingerprint") != fingerprint
+        or manifest.get("output_sha256") != _sha256(raw)
+    ):
+        return None
+    return manifest, raw.decode("utf-8")
+
+
+def save_manifest(manifest: dict[str, Any]) -> None:
+    """Best effort: the manifest is a cache, so failing to write it is not an error."""
+    try:
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(MANIFEST_PATH, json.dumps(manifest, indent=1) + "\n")
+    except OSError as e:
+        print(f"note: could not write {MANIFEST_PATH.name}: {e}", file=sys.stderr)
+
+
+def _reusable(previous: tuple[dict[str, Any], str] | None, hashes: dict[str, str]) -> dict[str, str]:
+    """Blocks of `previous` (see load_manifest) whose section hash is unchanged."""
+    reuse: dict[str, str] = {}
+    if previous is not None:
+        manifest, text = previous
+        for sec in manifest.get("sections", []):
+            if hashes.get(sec["name"]) == sec["hash"]:
+                reuse[sec["name"]] = text[sec["start"] : sec["end"]]
+    return reuse
+
+
+def stream_readme_incremental(
+    write: Callable[[bytes], object],
+    template: str,
+    rows: list[dict[str, str]],
+    categories: list[dict[str, Any]],
+    fingerprint: str,
+    previous: tuple[dict[str, Any], str] | None = None,
+    jobs: int = 1,
+    *,
+    groups: Groups | None = None,
+    pages: dict[str, str] | None = None,
+) -> tuple[dict[str, Any], int]:
+    """Pass the README to `write` as UTF-8 chunks, reusing unchanged sections from
+    `previous`; returns (manifest describing it, number of sections rendered)."""
+    groups = group_rows(rows) if groups is None else groups
+    hashes = section_hashes(categories, groups)
+    reuse = _reusable(previous, hashes) if pages is None else {}
+    spans: list[tuple[str, int, int]] = []
+    digest = hashlib.sha256()
+    chunks = iter_readme(template, rows, categories, groups=groups, reuse=reuse, jobs=jobs, spans=spans, pages=pages)
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        digest.update(data)
+        write(data)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "fingerprint": fingerprint,
+        "output_sha256": digest.hexdigest(),
+        "sections": [{"name": name, "hash": hashes[name], "start": start, "end": end} for name, start, end in spans],
+    }
+    return manifest, (len(hashes) - len(reuse)) if pages is None else 0
+
+
+def render_readme_incremental(
+    template: str,
+    rows: list[dict[str, str]],
+    categories: list[dict[str, Any]],
+    fingerprint: str,
+    previous: tuple[dict[str, Any], str] | None = None,
+    jobs: int = 1,
+) -> tuple[str, dict[str, Any], int]:
+    """stream_readme_incremental, collected: (rendered README, manifest, sections rendered)."""
+    chunks: list[bytes] = []
+    manifest, n_rendered = stream_readme_incremental(
+        chunks.append, template, rows, categories, fingerprint, previous, jobs
     )
+    return b"".join(chunks).decode("utf-8"), manifest, n_rendered
 
 
-def main() -> None:
+# --------------------------------------------------------------------------- #
+# Other outputs: JSON / NDJSON index, per-category pages
+#
+# Written by the same run, from the same loaded rows and group_rows pass as
+# README.md, so every output describes the same table. Each is streamed to a
+# temp file and swapped in atomically, like the README.
+# --------------------------------------------------------------------------- #
+INDEX_VERSION = 1
+# CSV column -> key in index records.
+INDEX_FIELDS = {
+    "ID": "id",
+    "Display Name": "name",
+    "Category": "category",
+    "Sub-Category": "subcategory",
+    "Link": "link",
+    "Author Name": "author_name",
+    "Author Link": "author_link",
+    "Description": "description",
+}
+
+
+def iter_index_records(categories: list[dict[str, Any]], groups: Groups) -> Iterator[dict[str, str]]:
+    """One record per active row, in the order the README lists them."""
+    for cat in categories:
+        subs = groups.get(cat["name"])
+        if not subs:
+            continue
+        for bucket in ("", *(sub["name"] for sub in _ordered_subs(cat, subs))):
+            for row in subs.get(bucket, []):
+                yield {key: row.get(column, "") for column, key in INDEX_FIELDS.items()}
+
+
+def write_index(path: Path, categories: list[dict[str, Any]], groups: Groups, *, ndjson: bool = False) -> int:
+    """Write the index as NDJSON (one record per line) or as one JSON document
+    {version, categories, resources}; returns the number of records."""
+    n = 0
+    with atomic_open(path) as out:
+        if not ndjson:
+            outline = [
+                {
+                    "name": cat["name"],
+                    "description": cat["description"],
+                    "subcategories": [sub["name"] for sub in cat["subcategories"]],
+                }
+                for cat in categories
+                if groups.get(cat["name"])
+            ]
+            head = json.dumps({"version": INDEX_VERSION, "categories": outline}, ensure_ascii=False)
+            # Open the resources array inside the document and stream the records into it.
+            out.write(f'{head[:-1]}, "resources": ['.encode("utf-8"))
+        for record in iter_index_records(categories, groups):
+            line = json.dumps(record, ensure_ascii=False)
+            out.write((line + "\n" if ndjson else ("," if n else "") + "\n" + line).encode("utf-8"))
+            n += 1
+        if not ndjson:
+            out.write(b"\n]}\n")
+    return n
+
+
+def shard_pages(categories: list[dict[str, Any]], groups: Groups, shard_dir: Path) -> dict[str, Path]:
+    """{category name: its page under `shard_dir`} for every non-empty category."""
+    return {
+        cat["name"]: shard_dir / f"{github_slug(cat['name'])}.md" for cat in categories if groups.get(cat["name"])
+    }
+
+
+# Names of the pages the last --shard-dir run wrote, kept in the shard directory.
+# Only these are ever deleted, so unrelated files that share the directory survive.
+SHARD_MANIFEST = ".generated-pages.json"
+
+
+def load_shard_manifest(shard_dir: Path) -> set[str]:
+    """Page file names recorded by the previous run into `shard_dir` (none if unreadable)."""
+    try:
+        names = json.loads((shard_dir / SHARD_MANIFEST).read_text(encoding="utf-8"))["pages"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+    # Bare file names only: a hand-edited manifest must not reach outside the directory.
+    return {name for name in names if isinstance(name, str) and name == Path(name).name and name.endswith(".md")}
+
+
+def shard_dir_problem(pages: dict[str, Path]) -> str | None:
+    """Why the pages can't be written where shard_pages() put them, or None.
+
+    Refuses the README's own directory, and any page that would overwrite a file
+    the generator didn't write (one missing from the shard manifest).
+    """
+    for shard_dir in {page.parent for page in pages.values()}:
+        if shard_dir == OUTPUT_PATH.resolve().parent:
+            return f"{shard_dir} holds {OUTPUT_PATH.name}; pick a directory of its own (e.g. categories)"
+        owned = load_shard_manifest(shard_dir)
+        clashes = sorted(p.name for p in pages.values() if p.parent == shard_dir and p.exists() and p.name not in owned)
+        if clashes:
+            return f"{shard_dir} already has {', '.join(clashes)}, not written by this generator; refusing to overwrite"
+    return None
+
+
+def write_shards(
+    categories: list[dict[str, Any]], groups: Groups, pages: dict[str, Path], jobs: int = 1
+) -> None:
+    """Write each category section to its page (from shard_pages), with a link back
+    to the README. Pages the previous run wrote (per the directory's SHARD_MANIFEST)
+    whose category is gone are removed; nothing else in the directory is touched."""
+    shard_dirs = {page.parent for page in pages.values()}
+    previous = {shard_dir: load_shard_manifest(shard_dir) for shard_dir in shard_dirs}
+    for shard_dir in shard_dirs:
+        shard_dir.mkdir(parents=True, exist_ok=True)
+    badge_src = f'src="{_load_formatter().STATIC_BADGE_DIR}/'
+    for name, chunks in iter_sections(categories, groups, jobs=jobs):
+        page = pages[name]
+        back = Path(os.path.relpath(OUTPUT_PATH, page.parent)).as_posix()
+        # Local badge paths are relative to README.md; re-anchor them to the page.
+        relocated = f'src="{Path(os.path.relpath(BADGE_DIR, page.parent)).as_posix()}/'
+        with atomic_open(page) as out:
+            out.write(f"[Back to the list]({back})\n\n".encode("utf-8"))
+            for chunk in chunks:
+                out.write(chunk.replace(badge_src, relocated).encode("utf-8"))
+            out.write(b"\n")
+    for shard_dir in shard_dirs:
+        current = sorted(page.name for page in pages.values() if page.parent == shard_dir)
+        atomic_write_text(shard_dir / SHARD_MANIFEST, json.dumps({"pages": current}, indent=1) + "\n")
+        for stale in previous[shard_dir] - set(current):
+            (shard_dir / stale).unlink(missing_ok=True)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-render only the sections whose inputs changed since the last run.",
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Render category sections in N worker processes (0 = one per CPU). Output is identical.",
+    )
+    p.add_argument("--json", type=Path, metavar="PATH", help="Also write the active resources as a JSON index.")
+    p.add_argument("--ndjson", type=Path, metavar="PATH", help="Also write the index as NDJSON, one resource per line.")
+    p.add_argument(
+        "--shard-dir",
+        type=Path,
+        metavar="DIR",
+        help="Write each category to DIR/<category>.md and keep only a linked TOC in README.md.",
+    )
+    p.add_argument(
+        "--static-badges",
+        action="store_true",
+        help="Use the local badge SVGs in assets/badges/ (see `make badges`) instead of img.shields.io.",
+    )
+    return p
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = _build_parser()
+    args = parser.parse_args(argv or [])
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    jobs = args.jobs or os.cpu_count() or 1
+    if args.static_badges:
+        _load_formatter().use_static_badges(available_badges())
     categories = load_config()
     rows = load_active_rows()
     validate_categories(rows, categories)
+    groups = group_rows(rows)
+
+    page_paths = shard_pages(categories, groups, args.shard_dir.resolve()) if args.shard_dir else None
+    problem = shard_dir_problem(page_paths) if page_paths else None
+    if problem:
+        parser.error(f"--shard-dir: {problem}")
+    pages = None
+    if page_paths is not None:
+        write_shards(categories, groups, page_paths, jobs)
+        pages = {
+            name: Path(os.path.relpath(path, OUTPUT_PATH.parent)).as_posix() for name, path in page_paths.items()
+        }
+    for path, ndjson in ((args.json, False), (args.ndjson, True)):
+        if path is not None:
+            n = write_index(path, categories, groups, ndjson=ndjson)
+            print(f"Wrote {path} ({n} resources)")
 
     template = TEMPLATE_PATH.read_text(encoding="utf-8")
-    rendered = render_readme(template, rows, categories)
-    OUTPUT_PATH.write_text(rendered, encoding="utf-8")
-    print(f"Wrote {OUTPUT_PATH.name} ({len(rows)} active entries, {len(categories)} categories)")
+    fingerprint = render_fingerprint(template)
+    # README.md and its manifest are read and replaced as a pair, under one lock.
+    # The README is streamed into a temp file and swapped in atomically, so the
+    # whole document is never held in memory (see resources/safe_io.py).
+    with locked(OUTPUT_PATH):
+        previous = load_manifest(fingerprint) if args.incremental and pages is None else None
+        if args.incremental:
+            _load_formatter().load_memo(FORMAT_MEMO_PATH)
+        with atomic_open(OUTPUT_PATH) as out:
+            manifest, n_rendered = stream_readme_incremental(
+                out.write, template, rows, categories, fingerprint, previous, jobs, groups=groups, pages=pages
+            )
+        save_manifest(manifest)
+    if args.incremental:
+        _load_formatter().save_memo(FORMAT_MEMO_PATH)
+    note = f", re-rendered {n_rendered}/{len(manifest['sections'])} sections" if previous else ""
+    print(f"Wrote {OUTPUT_PATH.name} ({len(rows)} active entries, {len(categories)} categories{note})")
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
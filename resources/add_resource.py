@@ -13,60 +13,144 @@ and placement without writing.
 This is the local, single-entry counterpart to resources/create_resource_pr.py
 (which runs the full approve -> branch -> commit -> PR flow in CI).
 
+--from-file imports a curated batch (JSONL, or CSV with a header row) in one
+transaction: config.yaml and the dedupe index are loaded once, every entry is
+validated and ALL errors are reported up front, and only if the whole batch is clean
+are the rows appended in a single write. Each record uses the flag names as keys
+(display_name, category, link, author_name, author_link, description, subcategory;
+CSV headers may also use the table's own column names, e.g. "Display Name").
+`make add-resources FILE=...` chains one README regeneration after the import.
+
 Usage:
     add_resource.py --display-name "cctop" --category "Session Monitors" \
         --link https://github.com/stefanprodan/cctop \
         --author-name stefanprodan --author-link https://github.com/stefanprodan \
         --description "A live top-style terminal monitor for Claude Code sessions." \
         [--subcategory "..."] [--dry-run] [--allow-duplicate]
+    add_resource.py --from-file batch.jsonl [--dry-run] [--allow-duplicate]
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
 import sys
 from pathlib import Path
 
-import yaml
-
 BASE = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE))
 
-from resources.categories import category_names  # noqa: E402
+from resources.categories import category_names, subcategories_for  # noqa: E402
 from resources.ids import generate_resource_id  # noqa: E402
-from resources.resource_utils import CSV_PATH, append_to_csv  # noqa: E402
-
-CONFIG_PATH = BASE / "config.yaml"
+from resources.dedupe_index import load_index, normalize_link  # noqa: E402
+from resources.resource_utils import (  # noqa: E402
+    CSV_PATH,
+    append_rows_to_csv,
+    append_to_csv,
+    csv_lock,
+    read_batch,
+)
 
+def link_exists(link: str) -> bool:
+    """True if any existing row already has this Link, compared normalized (dedupe guard)."""
+    return bool(load_index(CSV_PATH).by_link(link))
+
+
+# Record keys accepted by --from-file, in CSV-append order (see resource_utils.read_batch).
+BATCH_FIELDS = (
+    "display_name",
+    "category",
+    "subcategory",
+    "link",
+    "author_name",
+    "author_link",
+    "description",
+)
+BATCH_REQUIRED = ("display_name", "category", "link")
+
+
+def validate_batch(
+    records: list[dict[str, str]], *, allow_duplicate: bool = False
+) -> tuple[list[str], list[str]]:
+    """Return (errors, notes) for the whole batch; config and the dedupe index are
+    loaded once, and links repeated *within* the batch count as duplicates too."""
+    known = set(category_names())
+    declared: dict[str, list[str]] = {}
+    index = load_index(CSV_PATH)
+    seen: dict[str, int] = {}
+    errors: list[str] = []
+    notes: list[str] = []
+    for n, rec in enumerate(records, 1):
+        where = f"entry {n} ({rec.get('display_name') or '?'!r})"
+        unknown = sorted(set(rec) - set(BATCH_FIELDS))
+        if unknown:
+            errors.append(f"{where}: unknown field(s) {', '.join(unknown)}")
+        missing = [k for k in BATCH_REQUIRED if not rec.get(k)]
+        if missing:
+            errors.append(f"{where}: missing required field(s) {', '.join(missing)}")
+        category, sub = rec.get("category", ""), rec.get("subcategory", "")
+        if category and category not in known:
+            errors.append(f"{where}: category {category!r} is not declared in config.yaml")
+        elif category and sub:
+            if category not in declared:
+                declared[category] = subcategories_for(category)
+            if sub not in declared[category]:
+                notes.append(f"{where}: sub-category {sub!r} is not declared under {category!r}")
+        link = rec.get("link", "")
+        if link and not allow_duplicate:
+            key = normalize_link(link)
+            if index.by_link(link):
+                errors.append(f"{where}: a row with link {link!r} already exists")
+            elif key in seen:
+                errors.append(f"{where}: link {link!r} repeats entry {seen[key]}")
+            seen.setdefault(key, n)
+    return errors, notes
+
+
+def main_batch(path: Path, *, dry_run: bool = False, allow_duplicate: bool = False) -> int:
+    """--from-file: validate everything first, then append all rows in one write."""
+    try:
+        records = read_batch(path)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: cannot read {path}: {e}", file=sys.stderr)
+        return 1
+    if not records:
+        print(f"ERROR: {path} holds no entries.", file=sys.stderr)
+        return 1
 
-def subcategories_for(category: str) -> list[str]:
-    """Declared sub-category names under `category` in config.yaml (may be empty)."""
-    data = yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8")) or {}
-    for c in data.get("categories") or []:
-        if isinstance(c, dict) and c.get("name") == category:
-            return [
-                s["name"]
-                for s in (c.get("subcategories") or [])
-                if isinstance(s, dict) and s.get("name")
-            ]
-    return []
+    errors, notes = validate_batch(records, allow_duplicate=allow_duplicate)
+    for note in notes:
+        print(f"note: {note}", file=sys.stderr)
+    if errors:
+        print(f"ERROR: {len(errors)} problem(s) in {path}; nothing was added:", file=sys.stderr)
+        for error in errors:
+            print(f"  - {error}", file=sys.stderr)
+        return 1
 
+    rows = [{"id": generate_resource_id(), **{k: rec.get(k, "") for k in BATCH_FIELDS}} for rec in records]
+    for row in rows:
+        placement = row["category"] + (f" / {row['subcategory']}" if row["subcategory"] else "")
+        print(f"{'[dry-run] would add' if dry_run else 'Adding'} {row['id']}: {row['display_name']!r} -> {placement}")
+    if dry_run:
+        return 0
+    if not append_rows_to_csv(rows):
+        print("ERROR: failed to append the rows to the CSV.", file=sys.stderr)
+        return 1
 
-def link_exists(link: str) -> bool:
-    """True if any existing row already has this Link (dedupe guard)."""
-    if not CSV_PATH.exists():
-        return False
-    target = link.strip()
-    with CSV_PATH.open(encoding="utf-8", newline="") as fh:
-        return any((row.get("Link") or "").strip() == target for row in csv.DictReader(fh))
+    print(f"Added {len(rows)} resource(s) to THE_RESOURCES_TABLE_NEW.csv.")
+    print("Run `make generate` (chained by the make add-resources target) to update README.md.")
+    return 0
 
 
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
-    p.add_argument("--display-name", required=True, help="Resource display name.")
-    p.add_argument("--category", required=True, help="Category (must exist in config.yaml).")
-    p.add_argument("--link", required=True, help="Canonical URL (drives the resource ID).")
+    p.add_argument(
+        "--from-file",
+        type=Path,
+        help="Import a batch of resources from a .jsonl or .csv file (replaces the per-field flags).",
+    )
+    p.add_argument("--display-name", help="Resource display name.")
+    p.add_argument("--category", help="Category (must exist in config.yaml).")
+    p.add_argument("--link", help="Canonical URL (drives the resource ID).")
     p.add_argument("--author-name", default="", help="Author / owner name.")
     p.add_argument("--author-link", default="", help="Author profile URL.")
     p.add_argument("--description", default="", help="One-line descriptive blurb.")
@@ -85,7 +169,19 @@ def _build_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = _build_parser().parse_args(argv)
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    # Hold the CSV lock from the duplicate check through the append, so two
+    # concurrent adds can't both pass the check.
+    with csv_lock(CSV_PATH):
+        if args.from_file:
+            return main_batch(args.from_file, dry_run=args.dry_run, allow_duplicate=args.allow_duplicate)
+        return _main_single(parser, args)
+
+
+def _main_single(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if not (args.display_name and args.category and args.link):
+        parser.error("--display-name, --category, and --link are required (or pass --from-file)")
 
     known = category_names()
     if args.category not in known:
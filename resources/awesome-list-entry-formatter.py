@@ -3,13 +3,29 @@
 Turns a single CSV row (see THE_RESOURCES_TABLE_NEW.csv) into an Awesome-formatted
 markdown entry, complete with live Shields.io badges for GitHub-hosted resources.
 The orchestrator generate_readme.py imports format_entry() from this module.
+
+use_static_badges() switches the badge line to the pre-rendered local SVG from
+resources/generate_badge_svgs.py, for the repos that have one.
+
+Rendering is memoized: format_entry() keeps a bounded LRU of finished entries
+keyed on the row fields it actually renders, and the badge line is built once
+per (owner, repo). Re-rendering an unchanged list is therefore mostly cache
+hits. load_memo()/save_memo() optionally carry the memo across runs.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import urlparse
 
+from resources.safe_io import atomic_write_text
+
 # A github owner/repo segment. Anything outside this set (quotes, angle brackets,
 # spaces) in a submitted Link could break out of the badge <img src="..."> and
 # inject HTML attributes/handlers, so a non-matching link simply gets NO badge.
@@ -37,6 +53,42 @@ _BADGE_SPECS: list[tuple[str, str, str]] = [
 _BADGE_STYLE = "style=flat-square&labelColor=2b2b2b&color=6b6b6b"
 
 
+def generate_shields_badges(owner: str, repo: str) -> dict[str, str]:
+    """Return shields.io badge <img> tags keyed by type.
+
+    Keys: created, last_commit, license, stars.
+    """
+    badges: dict[str, str] = {}
+    for key, alt, url_tmpl in _BADGE_SPECS:
+        url = url_tmpl.format(owner=owner, repo=repo)
+        badges[key] = f'<img src="{url}?{_BADGE_STYLE}" alt="{alt}">'
+    return badges
+
+
+# The full badge line as one template, compiled once from generate_shields_badges
+# (with literal "{owner}" / "{repo}" placeholders): a badge line costs a single
+# str.format per (owner, repo) instead of four formats plus a join. Badges only,
+# no prose labels: each shields badge already renders its own label ("created" /
+# "last commit" / "license" / "stars"), so a "Created:"/"Stars:" prefix just
+# duplicates it. Joined with two non-breaking spaces for a small margin between
+# badges — GitHub's markdown sanitizer strips inline `style`, so &nbsp; is the
+# reliable way to add horizontal spacing.
+_BADGE_LINE_TEMPLATE = "&nbsp;&nbsp;".join(generate_shields_badges("{owner}", "{repo}").values())
+
+# Static badge mode: one local SVG per repo (assets/badges/<owner>/<repo>.svg, names
+# lower-cased) replaces the four shields images. Paths are relative to README.md.
+STATIC_BADGE_DIR = "assets/badges"
+_STATIC_BADGE_ALT = "created, last commit, license, stars"
+
+# Lower-cased "owner/repo" of every repo with a local badge; None = shields mode.
+_static_badges: frozenset[str] | None = None
+
+# LRU bounds: large enough that a 100k-entry list re-renders entirely from cache.
+ENTRY_MEMO_SIZE = 200_000
+MEMO_VERSION = 1
+
+
+@lru_cache(maxsize=ENTRY_MEMO_SIZE)
 def parse_github(url: str) -> tuple[str, str] | None:
     """Return (owner, repo) for a github.com repo URL, else None.
 
@@ -60,16 +112,37 @@ def parse_github(url: str) -> tuple[str, str] | None:
     return owner, repo
 
 
-def generate_shields_badges(owner: str, repo: str) -> dict[str, str]:
-    """Return shields.io badge <img> tags keyed by type.
+@lru_cache(maxsize=ENTRY_MEMO_SIZE)
+def badge_line(owner: str, repo: str) -> str:
+    """The rendered badge line for a repo (see _BADGE_LINE_TEMPLATE), or its local
+    badge in static mode when one exists."""
+    key = f"{owner}/{repo}".lower()
+    if _static_badges is not None and key in _static_badges:
+        return f'<img src="{STATIC_BADGE_DIR}/{key}.svg" alt="{_STATIC_BADGE_ALT}">'
+    return _BADGE_LINE_TEMPLATE.format(owner=owner, repo=repo)
 
-    Keys: created, last_commit, license, stars.
+
+def use_static_badges(available: Iterable[str] | None) -> None:
+    """Render local badges for the "owner/repo" keys in `available` (None = shields).
+
+    Changing the mode drops every memoized entry rendered under the old one.
     """
-    badges: dict[str, str] = {}
-    for key, alt, url_tmpl in _BADGE_SPECS:
-        url = url_tmpl.format(owner=owner, repo=repo)
-        badges[key] = f'<img src="{url}?{_BADGE_STYLE}" alt="{alt}">'
-    return badges
+    global _static_badges
+    static = None if available is None else frozenset(key.lower() for key in available)
+    if static != _static_badges:
+        _static_badges = static
+        clear_memo()
+
+
+def static_badges() -> frozenset[str] | None:
+    return _static_badges
+
+
+def badge_mode() -> str:
+    """Identifies the badge mode, for fingerprints of anything that caches entries."""
+    if _static_badges is None:
+        return "shields"
+    return "static:" + hashlib.sha256("\n".join(sorted(_static_badges)).encode("utf-8")).hexdigest()
 
 
 def _author_md(name: str, link: str) -> str:
@@ -86,8 +159,95 @@ def _author_md(name: str, link: str) -> str:
     return f"[{name}]({link})" if link else name
 
 
+class _EntryMemo:
+    """Bounded LRU of rendered entries, keyed on the row's rendered fields."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: str) -> None:
+        self.entries[key] = entry
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+_memo = _EntryMemo(ENTRY_MEMO_SIZE)
+
+
+def _memo_key(row: dict[str, str]) -> str:
+    # Exactly the fields format_entry reads; a separator no CSV field contains.
+    return "\x1f".join(
+        (
+            row["Display Name"],
+            row["Link"],
+            row.get("Description", ""),
+            row.get("Author Name", ""),
+            row.get("Author Link", ""),
+        )
+    )
+
+
+def _source_fingerprint() -> str:
+    """A persisted memo is only valid for the formatter code and badge mode that produced it."""
+    return hashlib.sha256(Path(__file__).read_bytes() + b"\0" + badge_mode().encode("utf-8")).hexdigest()
+
+
+def clear_memo() -> None:
+    _memo.entries.clear()
+    parse_github.cache_clear()
+    badge_line.cache_clear()
+
+
+def load_memo(path: Path) -> int:
+    """Seed the entry memo from `path`; returns the number of entries loaded.
+
+    A missing, unreadable, malformed, or stale (different formatter source) file
+    loads nothing.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(data, dict):
+        return 0
+    if data.get("version") != MEMO_VERSION or data.get("fingerprint") != _source_fingerprint():
+        return 0
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return 0
+    for key, entry in list(entries.items())[-_memo.maxsize :]:
+        _memo.put(key, entry)
+    return len(entries)
+
+
+def save_memo(path: Path) -> None:
+    """Best effort: the memo is a cache, so failing to write it is not an error."""
+    payload = {"version": MEMO_VERSION, "fingerprint": _source_fingerprint(), "entries": _memo.entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps(payload))
+    except OSError:
+        pass
+
+
 def format_entry(row: dict[str, str]) -> str:
-    """Render one CSV row as an Awesome-list markdown entry."""
+    """Render one CSV row as an Awesome-list markdown entry (memoized)."""
+    key = _memo_key(row)
+    entry = _memo.get(key)
+    if entry is None:
+        entry = _render_entry(row)
+        _memo.put(key, entry)
+    return entry
+
+
+def _render_entry(row: dict[str, str]) -> str:
     # Display Name / Description come from submitted issue forms — escape them so
     # they render as text, never as live HTML. The Link's scheme is validated at
     # submission time; angle brackets are neutralized defensively for the md target.
@@ -103,17 +263,7 @@ def format_entry(row: dict[str, str]) -> str:
     parsed = parse_github(link)
     if parsed is None:
         return bullet
-
-    badges = generate_shields_badges(*parsed)
-    # Badges only, no prose labels: each shields badge already renders its own
-    # label ("created" / "last commit" / "license" / "stars"), so a "Created:"/
-    # "Stars:" prefix just duplicates it. Join with two non-breaking spaces for a
-    # small margin between badges — GitHub's markdown sanitizer strips inline
-    # `style`, so &nbsp; is the reliable way to add horizontal spacing.
-    badge_line = "&nbsp;&nbsp;".join(
-        badges[key] for key in ("created", "last_commit", "license", "stars")
-    )
     # Two trailing spaces = a CommonMark hard break, so the badge line renders on
     # its own line under the bullet (a single newline is only a soft break in a
     # GitHub README file, which would otherwise collapse onto the description).
-    return f"{bullet}  \n{badge_line}"
+    return f"{bullet}  \n{badge_line(*parsed)}"
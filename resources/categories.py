@@ -1,25 +1,123 @@
 """Category lookups backed by config.yaml (the single source of truth).
 
-config.yaml is also consumed by generate_readme.py for ordering; here we read the
-category names, used to validate the Category column on add / move / submit. The
-per-category `prefix` key is vestigial and deliberately not read — resource IDs are
-opaque hex (see ids.py), not {prefix}-{hash}.
+config.yaml is parsed once per process by load_config() into a normalized,
+indexed CategoryConfig shared by every reader: generate_readme.py (ordering),
+add / move / submit (validation of the Category and Sub-Category columns). The
+normalized result is also cached on disk beside config.yaml (see
+resource_utils.cache_path), keyed to the file's signature, so repeated CLI runs
+skip YAML parsing entirely; when parsing is needed it goes through libyaml's
+CSafeLoader if PyYAML was built with it.
+
+The per-category `prefix` key is vestigial and deliberately not read — resource
+IDs are opaque hex (see ids.py), not {prefix}-{hash}.
 """
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from typing import Any
 
-import yaml
+from resources.resource_utils import cache_path, file_signature
+from resources.safe_io import atomic_write_text
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CONFIG_PATH = REPO_ROOT / "config.yaml"
 
+CACHE_VERSION = 1
+
+
+def parse_yaml(text: str) -> Any:
+    """yaml.safe_load, using the C (libyaml) safe loader when it's available."""
+    import yaml  # deferred: keeps --help / import-only startup free of PyYAML
+
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def normalize_categories(data: Any) -> list[dict[str, Any]]:
+    """Ordered {name, description, subcategories: [{name, description}]} mappings.
+
+    A bare string is shorthand for {name: <string>}; entries without a name are
+    skipped.
+    """
+    raw_categories = (data.get("categories") if isinstance(data, dict) else None) or []
+    categories: list[dict[str, Any]] = []
+    for raw in raw_categories:
+        if isinstance(raw, str):
+            raw = {"name": raw}
+        if not isinstance(raw, dict) or not raw.get("name"):
+            continue
+        subs_out: list[dict[str, str]] = []
+        for sub in raw.get("subcategories", []) or []:
+            if isinstance(sub, str):
+                sub = {"name": sub}
+            if not isinstance(sub, dict) or not sub.get("name"):
+                continue
+            subs_out.append({"name": sub["name"], "description": (sub.get("description") or "").strip()})
+        categories.append(
+            {
+                "name": raw["name"],
+                "description": (raw.get("description") or "").strip(),
+                "subcategories": subs_out,
+            }
+        )
+    return categories
+
+
+class CategoryConfig:
+    """Normalized config.yaml: ordered categories plus name-keyed lookups."""
+
+    def __init__(self, categories: list[dict[str, Any]]) -> None:
+        self.categories = categories
+        self.by_name = {c["name"]: c for c in categories}
+        self._subcategories = {c["name"]: [s["name"] for s in c["subcategories"]] for c in categories}
 
-def _categories() -> list[dict]:
-    data = yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8")) or {}
-    return [c for c in (data.get("categories") or []) if isinstance(c, dict) and c.get("name")]
+    def names(self) -> list[str]:
+        return [c["name"] for c in self.categories]
+
+    def subcategories(self, category: str) -> list[str]:
+        """Declared sub-category names under `category`, in order (may be empty)."""
+        return list(self._subcategories.get(category, []))
+
+
+# Per-process memo: {(resolved path, signature): CategoryConfig}.
+_memo: dict[tuple[str, tuple[int, ...]], CategoryConfig] = {}
+
+
+def load_config(config_path: Path | None = None) -> CategoryConfig:
+    """The parsed config, from memory, the on-disk cache, or (if stale) the YAML."""
+    path = config_path or CONFIG_PATH
+    signature = file_signature(path)
+    key = (str(path.resolve()), tuple(signature))
+    if key in _memo:
+        return _memo[key]
+
+    cache = cache_path(path, "parsed.json")
+    categories = None
+    try:
+        data = json.loads(cache.read_text(encoding="utf-8"))
+        if data.get("version") == CACHE_VERSION and data.get("signature") == signature:
+            categories = data["categories"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    if categories is None:
+        categories = normalize_categories(parse_yaml(path.read_text(encoding="utf-8")))
+        payload = {"version": CACHE_VERSION, "signature": signature, "categories": categories}
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(cache, json.dumps(payload))
+        except OSError:
+            pass  # best effort: the cache only saves a parse
+
+    config = CategoryConfig(categories)
+    _memo[key] = config
+    return config
 
 
 def category_names() -> list[str]:
-    return [c["name"] for c in _categories()]
+    return load_config().names()
+
+
+def subcategories_for(category: str) -> list[str]:
+    """Declared sub-category names under `category` in config.yaml (may be empty)."""
+    return load_config().subcategories(category)
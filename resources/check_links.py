@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Check every resource Link and record the outcome in Last Checked / Stale.
+
+Links are checked concurrently with asyncio: each request runs on a worker thread
+through a per-host pooled `requests.Session`, under a global concurrency bound and
+a per-host one, with a minimum delay between requests to the same host so one
+busy host (github.com) isn't hammered. A HEAD is tried first; hosts that reject
+HEAD get a streamed GET whose body is never read. Validators from earlier runs
+(ETag / Last-Modified, cached in the CSV's `.cache/`) are sent as If-None-Match /
+If-Modified-Since, so an unchanged page answers with a bodiless 304.
+
+Verdicts:
+  * alive (2xx/3xx, or 304)  -> Last Checked = now, Stale = FALSE
+  * dead  (404 / 410)        -> Last Checked = now, Stale = TRUE
+  * anything else (timeouts, 403/429, 5xx) is inconclusive and leaves the row alone.
+
+The network pass runs without the CSV lock; the results are then applied with the
+in-place row editor (resource_utils.RowTable) under the lock, so only the two
+columns of checked rows change and every other byte of the file is kept.
+
+Usage:
+    check_links.py [--all] [--concurrency N] [--per-host N] [--delay S] [--timeout S] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+BASE = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE))
+
+from resources import resource_utils  # noqa: E402
+from resources.resource_utils import (  # noqa: E402
+    COL_DISPLAY,
+    COL_LAST_CHECKED,
+    COL_STALE,
+    RowTable,
+    cache_path,
+    csv_lock,
+    iter_rows,
+)
+from resources.safe_io import atomic_write_text  # noqa: E402
+
+CACHE_VERSION = 1
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 2
+DEFAULT_DELAY = 0.5  # minimum seconds between two requests to one host
+DEFAULT_TIMEOUT = 15.0
+USER_AGENT = "awesome-claude-code-link-check (+https://github.com/hesreallyhim/awesome-claude-code)"
+
+DEAD_STATUSES = {404, 410}
+# Hosts that answer HEAD with these are asked again with a GET.
+HEAD_REJECTED = {403, 405, 501}
+
+ALIVE, DEAD, UNKNOWN = "alive", "dead", "unknown"
+Outcome = tuple[str, int | None, str]  # (verdict, HTTP status or None, detail)
+
+
+class LinkChecker:
+    """Bounded-concurrency link checker with per-host pools and politeness limits.
+
+    `validators` maps a URL to the {"etag", "last_modified"} it last answered with;
+    check_all() sends them as conditional headers and updates them in place.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host: int = DEFAULT_PER_HOST,
+        delay: float = DEFAULT_DELAY,
+        timeout: float = DEFAULT_TIMEOUT,
+        validators: dict[str, dict[str, str]] | None = None,
+    ) -> None:
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.delay = delay
+        self.timeout = timeout
+        self.validators = validators if validators is not None else {}
+        self._sessions: dict[str, requests.Session] = {}
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._host_last: dict[str, float] = {}
+
+    def _session(self, host: str) -> requests.Session:
+        # Created on the event loop thread (see check), used from workers.
+        session = self._sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            self._sessions[host] = session
+        return session
+
+    def _request(self, session: requests.Session, url: str) -> Outcome:
+        """Blocking HEAD (then GET if needed) for one URL; runs on a worker thread."""
+        headers = {}
+        cached = self.validators.get(url, {})
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            response = session.head(url, headers=headers, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in HEAD_REJECTED:
+                response = session.get(url, headers=headers, timeout=self.timeout, allow_redirects=True, stream=True)
+                response.close()  # the status is all we need; never download the body
+        except requests.exceptions.RequestException as e:
+            return UNKNOWN, None, type(e).__name__
+
+        status = response.status_code
+        if status == 304 or 200 <= status < 400:
+            fresh = {
+                key: value
+                for key, value in (
+                    ("etag", response.headers.get("ETag")),
+                    ("last_modified", response.headers.get("Last-Modified")),
+                )
+                if value
+            }
+            if fresh:
+                self.validators[url] = fresh
+            return ALIVE, status, "not modified" if status == 304 else response.reason or ""
+        if status in DEAD_STATUSES:
+            self.validators.pop(url, None)
+            return DEAD, status, response.reason or ""
+        return UNKNOWN, status, response.reason or ""
+
+    async def _polite_turn(self, host: str) -> None:
+        """Wait until `delay` has passed since the previous request to `host` started."""
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._host_last.get(host, float("-inf")) + self.delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_last[host] = time.monotonic()
+
+    async def check(self, url: str, slots: asyncio.Semaphore, pool: ThreadPoolExecutor) -> Outcome:
+        host = urlsplit(url).netloc.lower()
+        host_slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        session = self._session(host)
+        async with slots, host_slots:
+            await self._polite_turn(host)
+            return await asyncio.get_running_loop().run_in_executor(pool, self._request, session, url)
+
+    async def _check_all(self, urls: list[str]) -> dict[str, Outcome]:
+        slots = asyncio.Semaphore(self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            outcomes = await asyncio.gather(*(self.check(url, slots, pool) for url in urls))
+        return dict(zip(urls, outcomes))
+
+    def check_all(self, urls: Iterable[str]) -> dict[str, Outcome]:
+        """{url: outcome} for every distinct URL in `urls`."""
+        try:
+            return asyncio.run(self._check_all(list(dict.fromkeys(urls))))
+        finally:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._host_slots.clear()
+            self._host_locks.clear()
+
+
+# --------------------------------------------------------------------------- #
+# Validator cache (ETag / Last-Modified per URL)
+# --------------------------------------------------------------------------- #
+def _cache_file(csv_path: Path) -> Path:
+    return cache_path(csv_path, "links.json")
+
+
+def load_validators(csv_path: Path) -> dict[str, dict[str, str]]:
+    try:
+        data = json.loads(_cache_file(csv_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("links") or {}
+
+
+def save_validators(csv_path: Path, validators: dict[str, dict[str, str]]) -> None:
+    """Best effort: the validators only make the next run cheaper."""
+    path = _cache_file(csv_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps({"version": CACHE_VERSION, "links": validators}, indent=1))
+    except OSError:
+        pass
+
+
+# --------------------------------------------------------------------------- #
+# Write-back
+# --------------------------------------------------------------------------- #
+def apply_outcomes(table: RowTable, outcomes: dict[str, Outcome], checked_at: str) -> list[tuple[str, str]]:
+    """Set Last Checked / Stale on every row whose Link got a conclusive verdict.
+
+    Returns (display name, new Stale value) for rows whose Stale flag flipped.
+    """
+    flipped: list[tuple[str, str]] = []
+    for url, (verdict, _, _) in outcomes.items():
+        if verdict == UNKNOWN:
+            continue
+        stale = "TRUE" if verdict == DEAD else "FALSE"
+        for i in table.find(link=url):
+            fields = table.fields(i)
+            if fields[COL_STALE].strip().upper() != stale:
+                flipped.append((fields[COL_DISPLAY], stale))
+            fields[COL_LAST_CHECKED], fields[COL_STALE] = checked_at, stale
+            table.set_fields(i, fields)
+    return flipped
+
+
+def links_to_check(*, include_inactive: bool = False) -> list[str]:
+    """Distinct http(s) Links in the CSV (Active rows only unless include_inactive)."""
+    links = (link.strip() for (link,) in iter_rows(("Link",), active_only=not include_inactive))
+    return list(dict.fromkeys(link for link in links if urlsplit(link).scheme in ("http", "https")))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--all", action="store_true", help="Also check inactive rows.")
+    p.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Requests in flight overall.")
+    p.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="Requests in flight per host.")
+    p.add_argument(
+        "--delay", type=float, default=DEFAULT_DELAY, help="Minimum seconds between requests to one host."
+    )
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-request timeout in seconds.")
+    p.add_argument("--dry-run", action="store_true", help="Report verdicts without writing the CSV.")
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.concurrency < 1 or args.per_host < 1 or args.delay < 0:
+        parser.error("--concurrency and --per-host must be >= 1 and --delay >= 0")
+
+    csv_path = resource_utils.CSV_PATH
+    urls = links_to_check(include_inactive=args.all)
+    checker = LinkChecker(
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        delay=args.delay,
+        timeout=args.timeout,
+        validators=load_validators(csv_path),
+    )
+    started = time.monotonic()
+    outcomes = checker.check_all(urls)
+    checked_at = datetime.now().strftime("%Y-%m-%d:%H-%M-%S")
+
+    counts = {ALIVE: 0, DEAD: 0, UNKNOWN: 0}
+    for url, (verdict, status, detail) in outcomes.items():
+        counts[verdict] += 1
+        if verdict != ALIVE:
+            print(f"{verdict.upper():<8} {status or '-':>4}  {url}  {detail}".rstrip())
+    print(
+        f"Checked {len(outcomes)} link(s) in {time.monotonic() - started:.1f}s: "
+        f"{counts[ALIVE]} alive, {counts[DEAD]} dead, {counts[UNKNOWN]} inconclusive."
+    )
+    if args.dry_run:
+        return 0
+
+    save_validators(csv_path, checker.validators)
+    if not counts[ALIVE] + counts[DEAD]:
+        return 0
+    # The CSV may have been edited while the checks ran: re-read it under the lock.
+    with csv_lock():
+        try:
+            table = RowTable.read()
+        except ValueError as e:
+            print(f"ERROR: {e}. Refusing to edit — handle it manually.", file=sys.stderr)
+            return 1
+        flipped = apply_outcomes(table, outcomes, checked_at)
+        table.write()
+    for display, stale in flipped:
+        print(f"{display!r}: Stale -> {stale}")
+    print("Updated Last Checked / Stale in THE_RESOURCES_TABLE_NEW.csv.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
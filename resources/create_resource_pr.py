@@ -18,7 +18,6 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT))
 
-import generate_readme  # noqa: E402
 from resources.ids import generate_resource_id  # noqa: E402
 from resources.resource_utils import append_to_csv, generate_pr_content  # noqa: E402
 
@@ -94,6 +93,10 @@ def main() -> int:
         if not append_to_csv(resource):
             raise RuntimeError("Failed to append resource to CSV")
 
+        # Imported here, not at module level: the renderer (and its config/formatter
+        # loading) is only needed once the CSV append has succeeded.
+        import generate_readme
+
         with contextlib.redirect_stdout(sys.stderr):  # keep stdout clean for the JSON result
             generate_readme.main()
 
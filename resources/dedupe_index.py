@@ -0,0 +1,123 @@
+"""Persistent link / display-name index for duplicate checks.
+
+Submission validation (parse_issue_form), add_resource, and update_resource's
+link-clash guard all ask "does this link / name already exist?". Answering that
+with a full CSV scan per question makes a burst of N submissions cost N table
+scans, so the answers come from an index instead: normalized link -> rows and
+casefolded display name -> rows. The index is persisted as JSON in the CSV's
+`.cache/` sidecar directory, keyed to the CSV's (mtime, size), and rebuilt only
+when the CSV changes; within one process it is also memoized.
+
+Links are compared in a normalized form (see normalize_link) so trivially
+different spellings of the same URL — `https://www.GitHub.com/o/r.git/` vs
+`https://github.com/o/r` — count as duplicates.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from resources import resource_utils
+from resources.safe_io import atomic_write_text
+
+INDEX_VERSION = 2
+
+# (row number, ID, Display Name) — the row number is the 1-based data-row ordinal,
+# which identifies a row even when its ID is blank or duplicated.
+Hit = tuple[int, str, str]
+
+_memo: dict[str, tuple[list[int], DedupeIndex]] = {}
+
+
+def normalize_link(url: str) -> str:
+    """Canonical form of a link for duplicate matching.
+
+    Case-insensitive throughout, like the original whole-link comparison, so
+    `/Doc` and `/doc` on any host count as one link. A leading `www.`, a trailing
+    slash, and a `.git` suffix are dropped.
+    """
+    parts = urlsplit(url.strip().lower())
+    host = parts.netloc.removeprefix("www.")
+    path = parts.path.rstrip("/")
+    if path.endswith(".git"):
+        path = path[:-4].rstrip("/")
+    return urlunsplit((parts.scheme, host, path, parts.query, parts.fragment))
+
+
+def normalize_name(name: str) -> str:
+    return name.strip().casefold()
+
+
+class DedupeIndex:
+    """Normalized link -> hits and normalized display name -> hits."""
+
+    def __init__(self, links: dict[str, list[Hit]], names: dict[str, list[Hit]]) -> None:
+        self.links = links
+        self.names = names
+
+    @classmethod
+    def build(cls, csv_path: Path) -> DedupeIndex:
+        links: dict[str, list[Hit]] = {}
+        names: dict[str, list[Hit]] = {}
+        columns = ("ID", "Display Name", "Link")
+        for n, (rid, name, link) in enumerate(resource_utils.iter_rows(columns, csv_path=csv_path), 1):
+            hit = (n, rid, name)
+            if link.strip():
+                links.setdefault(normalize_link(link), []).append(hit)
+            if name.strip():
+                names.setdefault(normalize_name(name), []).append(hit)
+        return cls(links, names)
+
+    def by_link(self, link: str) -> list[Hit]:
+        return self.links.get(normalize_link(link), []) if link.strip() else []
+
+    def by_name(self, name: str) -> list[Hit]:
+        return self.names.get(normalize_name(name), []) if name.strip() else []
+
+
+def _read(path: Path, signature: list[int]) -> DedupeIndex | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != INDEX_VERSION or data.get("signature") != signature:
+        return None
+
+    def hits(table: dict[str, list[list]]) -> dict[str, list[Hit]]:
+        return {key: [(n, rid, name) for n, rid, name in rows] for key, rows in table.items()}
+
+    return DedupeIndex(hits(data["links"]), hits(data["names"]))
+
+
+def _write(path: Path, signature: list[int], index: DedupeIndex) -> None:
+    """Best effort: the index is a cache, so failing to persist it is not an error."""
+    payload = {"version": INDEX_VERSION, "signature": signature, "links": index.links, "names": index.names}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps(payload, ensure_ascii=False))
+    except OSError:
+        pass
+
+
+def load_index(csv_path: Path | None = None) -> DedupeIndex:
+    """The index for `csv_path` (default: the resource table), rebuilding it only
+    if the CSV changed since it was last persisted. A missing CSV is empty."""
+    path = csv_path or resource_utils.CSV_PATH
+    try:
+        signature = resource_utils.file_signature(path)
+    except OSError:
+        return DedupeIndex({}, {})
+    key = str(path.resolve())
+    cached = _memo.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    sidecar = resource_utils.cache_path(path, "dedupe.json")
+    index = _read(sidecar, signature)
+    if index is None:
+        index = DedupeIndex.build(path)
+        _write(sidecar, signature, index)
+    _memo[key] = (signature, index)
+    return index
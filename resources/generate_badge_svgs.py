@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Render a local badge SVG per GitHub-linked resource from cached repo metadata.
+
+The README's default badge line embeds four live img.shields.io images per
+entry, so a page view costs four external fetches per listed repo (and rate-
+limited badges fail to load). This pre-renders the same four facts — created,
+last commit, license, stars — as ONE compact SVG per repo, from
+data/github-metadata.json (resources/github_metadata.py), into
+assets/badges/<owner>/<repo>.svg. `generate_readme.py --static-badges` then
+points each entry at its file instead of at shields.io; a repo without a file
+keeps its shields badges.
+
+Dates are shown to the month ("Mar 2025") rather than shields' relative "3 days
+ago": a static file can't age, and month precision keeps a scheduled refresh
+from rewriting every badge every day. Files are only rewritten when their bytes
+change, and badges of repos no longer listed are removed.
+
+Run:  venv/bin/python resources/generate_badge_svgs.py   (or `make badges`)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+BASE = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE))
+
+from resources.github_metadata import METADATA_PATH, MetadataCache, Repo, github_repos  # noqa: E402
+from resources.safe_io import atomic_write_text  # noqa: E402
+from ticker.svg_minify import minify_svg  # noqa: E402
+
+BADGE_DIR = BASE / "assets" / "badges"
+# "<owner>/<repo>.svg" of every badge the last run wrote, kept in the badge
+# directory. Only these are ever deleted, so other files under --out-dir survive.
+BADGE_MANIFEST = ".generated-badges.json"
+
+# Same monochrome palette as the shields badge line (_BADGE_STYLE in the formatter).
+LABEL_COLOR = "#2b2b2b"
+MESSAGE_COLOR = "#6b6b6b"
+TEXT_COLOR = "#fff"
+HEIGHT = 20
+PAD = 6  # horizontal padding on each side of a text run
+GAP = 4  # space between two badges
+
+# Approximate advance widths (px) of 11px Verdana, the shields font: close enough
+# that text never overflows its box, without shipping font metrics.
+_NARROW = set("fijlrtI1.,:;!|'()[] ")
+_WIDE = set("mwMW@%")
+_CHAR_W, _NARROW_W, _WIDE_W = 7.0, 4.0, 10.0
+
+
+def _esc(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def text_width(text: str) -> int:
+    return round(sum(_NARROW_W if c in _NARROW else _WIDE_W if c in _WIDE else _CHAR_W for c in text))
+
+
+def format_count(num: int) -> str:
+    """Shields-style counts: 999, 1.2k, 12k, 1.5M."""
+    if num >= 1_000_000:
+        return f"{num / 1_000_000:.1f}M".replace(".0M", "M")
+    if num >= 10_000:
+        return f"{num // 1000}k"
+    if num >= 1000:
+        return f"{num / 1000:.1f}k".replace(".0k", "k")
+    return str(num)
+
+
+def format_month(value: str | None) -> str:
+    try:
+        return datetime.fromisoformat((value or "").replace("Z", "+00:00")).strftime("%b %Y")
+    except ValueError:
+        return "unknown"
+
+
+def badge_fields(entry: dict[str, Any]) -> list[tuple[str, str]]:
+    """(label, message) pairs in the shields badge line's order."""
+    license_id = entry.get("license")
+    return [
+        ("created", format_month(entry.get("created_at"))),
+        ("last commit", format_month(entry.get("last_commit") or entry.get("pushed_at"))),
+        ("license", "other" if license_id == "NOASSERTION" else license_id or "not specified"),
+        ("stars", format_count(int(entry.get("stars") or 0))),
+    ]
+
+
+def build_badge_svg(fields: Iterable[tuple[str, str]]) -> str:
+    """One flat-square SVG holding a label/message badge per field, left to right."""
+    shapes: list[str] = []
+    texts: list[str] = []
+    titles: list[str] = []
+    x = 0
+    for label, message in fields:
+        for text, fill in ((label, LABEL_COLOR), (message, MESSAGE_COLOR)):
+            w = text_width(text) + 2 * PAD
+            shapes.append(f'<rect x="{x}" width="{w}" height="{HEIGHT}" fill="{fill}"/>')
+            texts.append(f'<text x="{x + w / 2:g}" y="14">{_esc(text)}</text>')
+            x += w
+        titles.append(f"{label}: {message}")
+        x += GAP
+    width = max(x - GAP, 0)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{HEIGHT}" role="img" '
+        f'aria-label="{_esc(", ".join(titles))}">'
+        f"<title>{_esc(', '.join(titles))}</title>"
+        f"{''.join(shapes)}"
+        f'<g fill="{TEXT_COLOR}" text-anchor="middle" font-family="Verdana,DejaVu Sans,sans-serif" font-size="11">'
+        f"{''.join(texts)}</g></svg>\n"
+    )
+
+
+def badge_path(owner: str, repo: str, badge_dir: Path = BADGE_DIR) -> Path | None:
+    """Where a repo's badge lives (lower-cased, like repo_key), or None for a name
+    that can't safely be a path segment."""
+    owner, repo = owner.lower(), repo.lower()
+    if {owner, repo} & {"", ".", ".."}:
+        return None
+    return badge_dir / owner / f"{repo}.svg"
+
+
+def load_badge_manifest(badge_dir: Path) -> set[str]:
+    """Badges ("<owner>/<repo>.svg") recorded by the previous run (none if unreadable)."""
+    try:
+        names = json.loads((badge_dir / BADGE_MANIFEST).read_text(encoding="utf-8"))["badges"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+    # Only names badge_path() could have produced: a hand-edited manifest must not
+    # reach outside the directory.
+    return {name for name in names if isinstance(name, str) and _is_badge_name(name)}
+
+
+def _is_badge_name(name: str) -> bool:
+    owner, _, rest = name.partition("/")
+    return name.endswith(".svg") and "/" not in rest and badge_path(owner, rest[:-4], Path()) == Path(name)
+
+
+def write_badges(repos: Iterable[Repo], cache: MetadataCache, badge_dir: Path = BADGE_DIR) -> tuple[int, int, int]:
+    """Render a badge for every repo with metadata; returns (written, unchanged, removed).
+
+    Badges the previous run wrote (per the directory's BADGE_MANIFEST) for repos no
+    longer in `repos` (or without metadata) are deleted, along with owner
+    directories they leave empty; nothing else under `badge_dir` is touched.
+    """
+    previous = load_badge_manifest(badge_dir)
+    written = unchanged = 0
+    keep: set[Path] = set()
+    for owner, repo in repos:
+        entry = cache.get(owner, repo)
+        path = badge_path(owner, repo, badge_dir)
+        if entry is None or path is None or path in keep:
+            continue
+        keep.add(path)
+        svg = minify_svg(build_badge_svg(badge_fields(entry)))
+        try:
+            if path.read_text(encoding="utf-8") == svg:
+                unchanged += 1
+                continue
+        except OSError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, svg)
+        written += 1
+    current = sorted(path.relative_to(badge_dir).as_posix() for path in keep)
+    badge_dir.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(badge_dir / BADGE_MANIFEST, json.dumps({"badges": current}, indent=1) + "\n")
+    removed = 0
+    for stale in sorted(previous - set(current)):
+        path = badge_dir / stale
+        if path.exists():
+            path.unlink()
+            removed += 1
+        if path.parent.is_dir() and not any(path.parent.iterdir()):
+            path.parent.rmdir()
+    return written, unchanged, removed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--out-dir", type=Path, default=BADGE_DIR, help="Badge directory (default: assets/badges).")
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    cache = MetadataCache.load(METADATA_PATH)
+    if not cache.entries:
+        print(f"✗ No repo metadata in {METADATA_PATH.relative_to(BASE)}; run `make github-metadata`", file=sys.stderr)
+        return 1
+    repos = github_repos()
+    written, unchanged, removed = write_badges(repos, cache, args.out_dir)
+    print(
+        f"✓ Badges for {written + unchanged}/{len(repos)} GitHub repos in {args.out_dir}: "
+        f"{written} written, {unchanged} unchanged, {removed} removed"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
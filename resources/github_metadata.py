@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Fetch GitHub repository metadata for every GitHub-linked resource, in batches.
+
+Every Active row whose Link parse_github() recognizes (the same test that decides
+whether format_entry draws badges) is resolved through GitHub's GraphQL API, up to
+BATCH_SIZE repositories per aliased query, with a few queries in flight at once over
+one pooled session (ticker/github_graphql.py). The results land in
+`data/github-metadata.json`, so the generator and other tooling can read stars,
+license, creation and last-commit dates locally instead of per entry over the
+network.
+
+Each entry carries its own `fetched_at`; only entries older than the TTL (or
+missing) are refetched, so a scheduled run costs a query per ~100 *stale* repos.
+An expired entry is still served until a refresh succeeds. Repositories GitHub
+doesn't resolve (deleted, renamed, private) are recorded as `missing` so they
+aren't re-queried until they expire.
+
+A run where some batches fail still saves what it fetched and exits 0 with a
+warning (the scheduled workflow commits its other outputs after this step); it
+fails only when repos were due and none could be fetched.
+
+Needs GITHUB_TOKEN. Run:  venv/bin/python resources/github_metadata.py [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+BASE = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE))
+
+from resources.resource_utils import iter_rows  # noqa: E402
+from resources.safe_io import atomic_write_text  # noqa: E402
+from ticker.github_graphql import GraphQLClient, aliased_repo_query  # noqa: E402
+
+METADATA_PATH = BASE / "data" / "github-metadata.json"
+METADATA_TTL = timedelta(hours=24)
+METADATA_VERSION = 1
+
+# Repos per aliased query, and how many such queries may be in flight at once.
+BATCH_SIZE = 100
+FETCH_WORKERS = 4
+
+_REPO_SELECTION = (
+    "nameWithOwner stargazerCount forkCount isArchived createdAt pushedAt "
+    "licenseInfo { spdxId name } "
+    "defaultBranchRef { target { ... on Commit { committedDate } } }"
+)
+
+Repo = tuple[str, str]  # (owner, name) as parse_github returns it
+
+
+def repo_key(owner: str, name: str) -> str:
+    """Cache key for a repo: GitHub owner/repo names are case-insensitive."""
+    return f"{owner}/{name}".lower()
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def _parse_ts(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _record(repository: dict[str, Any] | None, fetched_at: str) -> dict[str, Any]:
+    """Flatten one `repository` result (None = unresolved) into a cache entry."""
+    if repository is None:
+        return {"fetched_at": fetched_at, "missing": True}
+    license_info = repository.get("licenseInfo") or {}
+    target = (repository.get("defaultBranchRef") or {}).get("target") or {}
+    return {
+        "fetched_at": fetched_at,
+        "name_with_owner": repository.get("nameWithOwner"),
+        "stars": repository.get("stargazerCount"),
+        "forks": repository.get("forkCount"),
+        "archived": bool(repository.get("isArchived")),
+        "created_at": repository.get("createdAt"),
+        "pushed_at": repository.get("pushedAt"),
+        "last_commit": target.get("committedDate"),
+        "license": license_info.get("spdxId") or license_info.get("name"),
+    }
+
+
+class MetadataCache:
+    """{"version": 1, "repos": {"owner/repo": entry}} with a per-entry TTL.
+
+    Entries are keyed by repo_key(). `path=None` keeps the cache in memory only.
+    """
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None, path: Path | None = None) -> None:
+        self.entries = entries or {}
+        self.path = path
+
+    @classmethod
+    def load(cls, path: Path = METADATA_PATH) -> MetadataCache:
+        """Read the cache; unreadable or from another version = empty."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        entries = {}
+        if isinstance(data, dict) and data.get("version") == METADATA_VERSION:
+            entries = {k: v for k, v in (data.get("repos") or {}).items() if isinstance(v, dict)}
+        return cls(entries, path)
+
+    def get(self, owner: str, name: str) -> dict[str, Any] | None:
+        """The entry for a repo (possibly expired), or None if unknown or missing."""
+        entry = self.entries.get(repo_key(owner, name))
+        return None if entry is None or entry.get("missing") else entry
+
+    def due(self, repos: Iterable[Repo], now: datetime, ttl: timedelta = METADATA_TTL) -> list[Repo]:
+        """The distinct repos whose entry is absent or older than `ttl`."""
+        out: dict[str, Repo] = {}
+        for owner, name in repos:
+            key = repo_key(owner, name)
+            entry = self.entries.get(key)
+            try:
+                fresh = entry is not None and now - _parse_ts(entry["fetched_at"]) <= ttl
+            except (KeyError, TypeError, ValueError):
+                fresh = False
+            if not fresh:
+                out.setdefault(key, (owner, name))
+        return list(out.values())
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        payload = {"version": METADATA_VERSION, "repos": dict(sorted(self.entries.items()))}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.path, json.dumps(payload, indent=1, sort_keys=True) + "\n")
+        except OSError as e:
+            print(f"⚠ Could not write {self.path.name}: {e}")
+
+
+def _fetch_batch(client: GraphQLClient, batch: list[Repo], fetched_at: str) -> dict[str, dict[str, Any]] | None:
+    """One aliased query for a batch of repos; None if the query failed."""
+    query, variables = aliased_repo_query(_REPO_SELECTION, [(owner, name, None) for owner, name in batch])
+    data = client.execute(query, variables)
+    if data is None:
+        return None
+    return {repo_key(owner, name): _record(data.get(f"r{i}"), fetched_at) for i, (owner, name) in enumerate(batch)}
+
+
+def fetch_metadata(
+    repos: Iterable[Repo],
+    token: str,
+    cache: MetadataCache | None = None,
+    client: GraphQLClient | None = None,
+    *,
+    now: datetime | None = None,
+    ttl: timedelta = METADATA_TTL,
+) -> int:
+    """Refresh `cache` for every repo in `repos` that is due (see MetadataCache.due).
+
+    Repos are batched BATCH_SIZE to a query and the batches run on a bounded
+    thread pool; a failed batch leaves its repos' previous entries in place.
+    Returns the number of entries refreshed.
+    """
+    cache = cache if cache is not None else MetadataCache()
+    client = client or GraphQLClient(token, pool_size=FETCH_WORKERS)
+    now = now or datetime.now(UTC)
+    due = cache.due(repos, now, ttl)
+    batches = [due[i : i + BATCH_SIZE] for i in range(0, len(due), BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        results = list(pool.map(lambda batch: _fetch_batch(client, batch, _iso(now)), batches))
+    refreshed = 0
+    for result in results:
+        if result is not None:
+            cache.entries.update(result)
+            refreshed += len(result)
+    return refreshed
+
+
+def github_repos(parse_github: Callable[[str], Repo | None] | None = None) -> list[Repo]:
+    """(owner, name) for every Active row whose Link is a GitHub repo, deduplicated."""
+    if parse_github is None:
+        from generate_readme import _load_formatter  # the formatter's file name isn't importable
+
+        parse_github = _load_formatter().parse_github
+    repos: dict[str, Repo] = {}
+    for (link,) in iter_rows(("Link",), active_only=True):
+        parsed = parse_github(link)
+        if parsed is not None:
+            repos.setdefault(repo_key(*parsed), parsed)
+    return list(repos.values())
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--force", action="store_true", help="Refetch every repo, ignoring the TTL.")
+    p.add_argument(
+        "--ttl-hours", type=float, default=METADATA_TTL.total_seconds() / 3600, help="Refetch entries older than this."
+    )
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    token = os.environ.get("GITHUB_TOKEN", "").strip()
+    if not token:
+        print("✗ GITHUB_TOKEN environment variable not set", file=sys.stderr)
+        return 1
+
+    repos = github_repos()
+    cache = MetadataCache.load(METADATA_PATH)
+    ttl = timedelta(0) if args.force else timedelta(hours=args.ttl_hours)
+    now = datetime.now(UTC)
+    due = len(cache.due(repos, now, ttl))
+    refreshed = fetch_metadata(repos, token, cache, now=now, ttl=ttl)
+    cache.save()
+    missing = sum(1 for owner, name in repos if cache.get(owner, name) is None)
+    print(
+        f"✓ {len(repos)} GitHub repos: refreshed {refreshed}/{due} due "
+        f"({len(repos) - due} within TTL), {missing} unresolved -> {METADATA_PATH.relative_to(BASE)}"
+    )
+    if due and not refreshed:
+        print(f"✗ Could not fetch metadata for any of the {due} due repos", file=sys.stderr)
+        return 1
+    if refreshed < due:
+        print(f"⚠ {due - refreshed} due repos were not refreshed; keeping their previous entries", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
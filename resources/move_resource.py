@@ -10,64 +10,165 @@ sub-category rarely belongs under a new parent). Rendering README.md is
 generate_readme.py's job; the `make move-resource` target chains the two. Use
 --dry-run to preview without writing.
 
+--from-file re-files a batch (JSONL, or CSV with a header row; keys id or link,
+category, subcategory) in one transaction: the CSV is parsed once into an
+ID/link -> row map, every move is resolved and ALL errors are reported up front,
+and only if the whole batch is clean is the file written, once. Untouched rows
+stay byte-for-byte identical. `make move-resources FILE=...` chains one README
+regeneration after it.
+
 Usage:
     move_resource.py (--id ID | --link URL) --category "New Category" \
         [--subcategory "Sub"] [--dry-run]
+    move_resource.py --from-file moves.jsonl [--dry-run]
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
 import sys
 from pathlib import Path
 
-import yaml
-
 BASE = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE))
 
-from resources.categories import category_names  # noqa: E402
+from resources.categories import category_names, subcategories_for  # noqa: E402
 from resources.resource_utils import (  # noqa: E402
     COL_CATEGORY,
     COL_DISPLAY,
     COL_SUBCATEGORY,
-    find_row_indices,
-    read_lines,
-    serialize_row,
-    split_eol,
-    write_lines,
+    RowTable,
+    csv_lock,
+    read_batch,
 )
 
-CONFIG_PATH = BASE / "config.yaml"
+# Record keys accepted by --from-file.
+BATCH_FIELDS = ("id", "link", "category", "subcategory")
+
+
+def _fmt(cat: str, sub: str) -> str:
+    return cat + (f" / {sub}" if sub else "")
+
+
+def move_row(
+    table: RowTable, *, id: str = "", link: str = "", category: str, subcategory: str = ""
+) -> tuple[str, tuple[str, str]]:
+    """Re-file the row selected by `id` / `link` in `table` (in memory only).
+
+    Returns (display name, old (category, sub-category)). Raises LookupError if the
+    selector matches no row, or more than one.
+    """
+    selector = f"id {id!r}" if id else f"link {link!r}"
+    matches = table.find(id=id, link=link)
+    if not matches:
+        raise LookupError(f"no resource found with {selector}")
+    if len(matches) > 1:
+        raise LookupError(f"{len(matches)} rows match {selector}; refusing to move an ambiguous set")
+
+    fields = table.fields(matches[0])
+    old = (fields[COL_CATEGORY], fields[COL_SUBCATEGORY])
+    if old != (category, subcategory):
+        fields[COL_CATEGORY], fields[COL_SUBCATEGORY] = category, subcategory
+        table.set_fields(matches[0], fields)
+    return fields[COL_DISPLAY], old
+
+
+def main_batch(path: Path, *, dry_run: bool = False) -> int:
+    """--from-file: resolve and validate every move first, then write the CSV once."""
+    try:
+        records = read_batch(path)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: cannot read {path}: {e}", file=sys.stderr)
+        return 1
+    if not records:
+        print(f"ERROR: {path} holds no entries.", file=sys.stderr)
+        return 1
+    try:
+        table = RowTable.read()
+    except ValueError as e:
+        print(f"ERROR: {e}. Refusing to edit — handle it manually.", file=sys.stderr)
+        return 1
+
+    known = set(category_names())
+    declared: dict[str, list[str]] = {}
+    errors: list[str] = []
+    moves: list[tuple[str, tuple[str, str], tuple[str, str]]] = []
+    for n, rec in enumerate(records, 1):
+        where = f"entry {n}"
+        unknown = sorted(set(rec) - set(BATCH_FIELDS))
+        if unknown:
+            errors.append(f"{where}: unknown field(s) {', '.join(unknown)}")
+        category, sub = rec.get("category", ""), rec.get("subcategory", "")
+        if not (rec.get("id") or rec.get("link")) or not category:
+            errors.append(f"{where}: needs category and one of id / link")
+            continue
+        if category not in known:
+            errors.append(f"{where}: category {category!r} is not declared in config.yaml")
+            continue
+        if sub:
+            if category not in declared:
+                declared[category] = subcategories_for(category)
+            if sub not in declared[category]:
+                print(f"note: {where}: sub-category {sub!r} is not declared under {category!r}", file=sys.stderr)
+        try:
+            display, old = move_row(
+                table, id=rec.get("id", ""), link=rec.get("link", ""), category=category, subcategory=sub
+            )
+        except LookupError as e:
+            errors.append(f"{where}: {e}")
+            continue
+        moves.append((display, old, (category, sub)))
+
+    if errors:
+        print(f"ERROR: {len(errors)} problem(s) in {path}; nothing was moved:", file=sys.stderr)
+        for error in errors:
+            print(f"  - {error}", file=sys.stderr)
+        return 1
 
+    changed = [m for m in moves if m[1] != m[2]]
+    for display, old, new in moves:
+        if old == new:
+            print(f"note: {display!r} is already in {_fmt(*new)}; nothing to do.")
+        else:
+            print(f"{'[dry-run] ' if dry_run else ''}{display!r}: {_fmt(*old)}  ->  {_fmt(*new)}")
+    if dry_run or not changed:
+        return 0
 
-def subcategories_for(category: str) -> list[str]:
-    """Declared sub-category names under `category` in config.yaml (may be empty)."""
-    data = yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8")) or {}
-    for c in data.get("categories") or []:
-        if isinstance(c, dict) and c.get("name") == category:
-            return [
-                s["name"]
-                for s in (c.get("subcategories") or [])
-                if isinstance(s, dict) and s.get("name")
-            ]
-    return []
+    table.write()
+    print(f"Moved {len(changed)} resource(s) in THE_RESOURCES_TABLE_NEW.csv.")
+    print("Run `make generate` (chained by the make move-resources target) to update README.md.")
+    return 0
 
 
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
-    sel = p.add_mutually_exclusive_group(required=True)
+    sel = p.add_mutually_exclusive_group()
     sel.add_argument("--id", help="Resource ID to move.")
     sel.add_argument("--link", help="Resource Link to move (alternative to --id).")
-    p.add_argument("--category", required=True, help="Target Category (must exist in config.yaml).")
+    sel.add_argument(
+        "--from-file",
+        type=Path,
+        help="Apply a batch of moves from a .jsonl or .csv file (replaces --id/--link/--category).",
+    )
+    p.add_argument("--category", help="Target Category (must exist in config.yaml).")
     p.add_argument("--subcategory", default="", help="Target Sub-Category (default: cleared).")
     p.add_argument("--dry-run", action="store_true", help="Print the change without writing.")
     return p
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = _build_parser().parse_args(argv)
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    # Hold the CSV lock from the read to the write, so concurrent edits can't be lost.
+    with csv_lock():
+        if args.from_file:
+            return main_batch(args.from_file, dry_run=args.dry_run)
+        return _main_single(parser, args)
+
+
+def _main_single(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if not ((args.id or args.link) and args.category):
+        parser.error("one of --id / --link, and --category, are required (or pass --from-file)")
 
     known = category_names()
     if args.category not in known:
@@ -88,30 +189,18 @@ def main(argv: list[str] | None = None) -> int:
             file=sys.stderr,
         )
 
-    lines = read_lines()
-    selector = f"id {args.id!r}" if args.id else f"link {args.link!r}"
     try:
-        matches = find_row_indices(lines, id=args.id or "", link=args.link or "")
+        table = RowTable.read()
+        display, old = move_row(
+            table, id=args.id or "", link=args.link or "", category=args.category, subcategory=args.subcategory
+        )
     except ValueError as e:
         print(f"ERROR: {e}. Refusing to edit — handle it manually.", file=sys.stderr)
         return 1
-
-    if not matches:
-        print(f"ERROR: no resource found with {selector}.", file=sys.stderr)
-        return 1
-    if len(matches) > 1:
-        print(f"ERROR: {len(matches)} rows match {selector}; refusing to move an ambiguous set.", file=sys.stderr)
+    except LookupError as e:
+        print(f"ERROR: {e}.", file=sys.stderr)
         return 1
-
-    idx = matches[0]
-    content, eol = split_eol(lines[idx])
-    fields = next(csv.reader([content]))
-    old = (fields[COL_CATEGORY], fields[COL_SUBCATEGORY])
     new = (args.category, args.subcategory)
-    display = fields[COL_DISPLAY]
-
-    def _fmt(cat: str, sub: str) -> str:
-        return cat + (f" / {sub}" if sub else "")
 
     if old == new:
         print(f"note: {display!r} is already in {_fmt(*new)}; nothing to do.")
@@ -121,9 +210,7 @@ def main(argv: list[str] | None = None) -> int:
         print(f"[dry-run] {display!r}: {_fmt(*old)}  ->  {_fmt(*new)}")
         return 0
 
-    fields[COL_CATEGORY], fields[COL_SUBCATEGORY] = args.category, args.subcategory
-    lines[idx] = serialize_row(fields, eol)
-    write_lines(lines)
+    table.write()
 
     print(f"Moved {display!r}: {_fmt(*old)}  ->  {_fmt(*new)} in THE_RESOURCES_TABLE_NEW.csv.")
     print("Run `make generate` (chained by the make move-resource target) to update README.md.")
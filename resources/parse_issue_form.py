@@ -7,7 +7,6 @@ Reads the issue body from ISSUE_BODY. With --validate, returns
 
 from __future__ import annotations
 
-import csv
 import json
 import os
 import re
@@ -15,6 +14,7 @@ import sys
 from pathlib import Path
 
 from resources.categories import category_names
+from resources.dedupe_index import load_index
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CSV_PATH = REPO_ROOT / "THE_RESOURCES_TABLE_NEW.csv"
@@ -55,18 +55,22 @@ def parse_issue_body(issue_body: str) -> dict[str, str]:
 
 
 def check_for_duplicates(data: dict[str, str]) -> list[str]:
-    """Warn if the Link or Display Name already exists in the CSV."""
+    """Warn if the Link or Display Name already exists in the CSV.
+
+    Lookups go through the persistent dedupe index (links compared normalized), so
+    validating a burst of submissions doesn't rescan the table each time.
+    """
     warnings: list[str] = []
     if not CSV_PATH.exists():
         return warnings
-    link = data.get("link", "").strip().lower()
-    name = data.get("display_name", "").strip().lower()
-    with CSV_PATH.open(encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            if link and row.get("Link", "").strip().lower() == link:
-                warnings.append(f"A resource with this link already exists: {row.get('Display Name')}")
-            elif name and row.get("Display Name", "").strip().lower() == name:
-                warnings.append(f"A resource with the same name already exists: {row.get('Display Name')}")
+    index = load_index(CSV_PATH)
+    link_hits = index.by_link(data.get("link", ""))
+    for _, _, row_name in link_hits:
+        warnings.append(f"A resource with this link already exists: {row_name}")
+    seen = {n for n, _, _ in link_hits}
+    for n, _, row_name in index.by_name(data.get("display_name", "")):
+        if n not in seen:
+            warnings.append(f"A resource with the same name already exists: {row_name}")
     return warnings
 
 
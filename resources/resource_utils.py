@@ -1,4 +1,4 @@
-"""CSV append + PR body helpers for the new 12-column schema.
+"""CSV read/append + PR body helpers for the new 12-column schema.
 
 Schema (THE_RESOURCES_TABLE_NEW.csv):
   ID, Display Name, Category, Sub-Category, Link, Author Name, Author Link,
@@ -9,9 +9,15 @@ from __future__ import annotations
 
 import csv
 import io
+import json
+import os
+from collections.abc import Iterator, Sequence
+from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
 
+from resources.safe_io import atomic_write_text, locked, locked_write_text
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CSV_PATH = REPO_ROOT / "THE_RESOURCES_TABLE_NEW.csv"
 
@@ -33,6 +39,140 @@ CSV_PATH = REPO_ROOT / "THE_RESOURCES_TABLE_NEW.csv"
 N_COLS = 12
 
 
+# --------------------------------------------------------------------------- #
+# Derived-data caches
+#
+# Indexes built from a source file (the CSV, config.yaml) are persisted under a
+# `.cache/` directory beside that source and keyed to its signature, so they are
+# rebuilt only when the source changes. `.cache/` is gitignored; deleting it is
+# always safe.
+# --------------------------------------------------------------------------- #
+def cache_path(source: Path, name: str) -> Path:
+    """Sidecar cache file for `source`: <source dir>/.cache/<source stem>.<name>."""
+    return source.parent / ".cache" / f"{source.stem}.{name}"
+
+
+def file_signature(path: Path) -> list[int]:
+    """[mtime_ns, size] of `path`; any edit to the file changes it."""
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+# --------------------------------------------------------------------------- #
+# Streaming, projected reads
+#
+# Readers that only need a couple of columns shouldn't materialize a 12-key dict
+# per row (csv.DictReader) or the whole table (list(...)). iter_rows streams one
+# tuple per data row holding just the requested columns, and can apply the Active
+# filter on the fly, so peak memory stays flat however large the table grows.
+#
+# Callers that load the projection into memory anyway (the README render) can
+# pass cached=True: the requested columns are then also kept as a JSON sidecar in
+# the CSV's `.cache/`, keyed to the CSV's signature — per column, all of its
+# values joined with a unit separator, so loading is a handful of large strings.
+# Only columns a caller has asked for are stored; any edit to the CSV makes the
+# sidecar stale, and the next cached read rebuilds it.
+# --------------------------------------------------------------------------- #
+COLUMN_CACHE_VERSION = 1
+_SEP = "\x1f"
+
+
+def is_active(value: str | None) -> bool:
+    """The Active-column test every consumer uses ("TRUE", case/space-insensitive)."""
+    return (value or "").strip().upper() == "TRUE"
+
+
+def _stream_rows(path: Path, columns: Sequence[str], active_only: bool) -> Iterator[tuple[str, ...]]:
+    with path.open(encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None) or []
+        positions = {name: i for i, name in enumerate(header)}
+        missing = [c for c in (*columns, *(("Active",) if active_only else ())) if c not in positions]
+        if missing:
+            raise KeyError(f"CSV header missing columns {', '.join(missing)}")
+        wanted = [positions[c] for c in columns]
+        active_at = positions.get("Active", -1)
+        for fields in reader:
+            if not fields:
+                continue
+            n = len(fields)
+            if active_only and not (active_at < n and is_active(fields[active_at])):
+                continue
+            yield tuple(fields[i] if i < n else "" for i in wanted)
+
+
+def _pack(column: Sequence[str]) -> str | list[str]:
+    # A value containing the separator (never in practice) keeps its column as a list.
+    return list(column) if any(_SEP in v for v in column) else _SEP.join(column)
+
+
+def _unpack(packed: str | list[str], n_rows: int) -> list[str]:
+    if isinstance(packed, list):
+        return packed
+    return packed.split(_SEP) if n_rows else []
+
+
+def load_columns(names: Sequence[str], csv_path: Path | None = None) -> dict[str, list[str]]:
+    """{name: values} for each of `names`, via the JSON column sidecar.
+
+    Columns the sidecar doesn't hold yet are read with a streaming projection of
+    just those columns and added to it (best effort). Raises KeyError if the
+    header lacks a column.
+    """
+    path = csv_path or CSV_PATH
+    signature = file_signature(path)
+    sidecar = cache_path(path, "columns.json")
+    stored: dict[str, str | list[str]] = {}
+    n_rows = 0
+    try:
+        data = json.loads(sidecar.read_text(encoding="utf-8"))
+        if data["version"] == COLUMN_CACHE_VERSION and data["signature"] == signature:
+            stored, n_rows = data["columns"], data["rows"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    todo = [name for name in dict.fromkeys(names) if name not in stored]
+    if todo:
+        rows = list(_stream_rows(path, todo, active_only=False))
+        n_rows = len(rows)
+        values = list(zip(*rows)) if rows else [()] * len(todo)
+        stored = {**stored, **{name: _pack(column) for name, column in zip(todo, values)}}
+        payload = {"version": COLUMN_CACHE_VERSION, "signature": signature, "rows": n_rows, "columns": stored}
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(sidecar, json.dumps(payload))
+        except OSError:
+            pass  # best effort: the sidecar only saves a parse
+    return {name: _unpack(stored[name], n_rows) for name in names}
+
+
+def iter_rows(
+    columns: Sequence[str],
+    *,
+    active_only: bool = False,
+    csv_path: Path | None = None,
+    cached: bool = False,
+) -> Iterator[tuple[str, ...]]:
+    """Yield a tuple of `columns` (in the order given) for each data row.
+
+    Blank lines are skipped and short rows are padded with "" (mirroring what
+    csv.DictReader consumers saw). Raises KeyError if the header lacks a column.
+    cached=True reads through the column sidecar (see above) instead of streaming.
+    """
+    path = csv_path or CSV_PATH
+    if not cached:
+        yield from _stream_rows(path, columns, active_only)
+        return
+    table = load_columns((*columns, "Active") if active_only else columns, path)
+    rows = zip(*(table[c] for c in columns))
+    if not active_only:
+        yield from rows
+        return
+    for active, row in zip(table["Active"], rows):
+        if is_active(active):
+            yield row
+
+
 # --------------------------------------------------------------------------- #
 # In-place, line-oriented row edits (shared by move_resource / update_resource)
 #
@@ -61,7 +201,13 @@ def read_lines(csv_path: Path | None = None) -> list[str]:
 
 
 def write_lines(lines: list[str], csv_path: Path | None = None) -> None:
-    (csv_path or CSV_PATH).write_text("".join(lines), encoding="utf-8")
+    """Atomically replace the CSV with `lines` (under its lock; see safe_io)."""
+    locked_write_text(csv_path or CSV_PATH, "".join(lines))
+
+
+def csv_lock(csv_path: Path | None = None) -> AbstractContextManager[None]:
+    """Hold the CSV's lock across a read-modify-write (read_lines ... write_lines)."""
+    return locked(csv_path or CSV_PATH)
 
 
 def find_row_indices(lines: list[str], *, id: str = "", link: str = "") -> list[int]:
@@ -70,17 +216,132 @@ def find_row_indices(lines: list[str], *, id: str = "", link: str = "") -> list[
     Raises ValueError on a row that isn't N_COLS columns (multi-line value): callers
     should refuse rather than corrupt such a row.
     """
-    out: list[int] = []
-    for i, line in enumerate(lines[1:], start=1):  # skip header
-        content, _ = split_eol(line)
-        if not content.strip():
+    return RowTable(lines).find(id=id, link=link)
+
+
+class RowTable:
+    """The CSV's lines, parsed once, with ID / Link -> line-index maps.
+
+    Batch edits (move_resource / update_resource --from-file) look every row up in
+    the maps, apply all changes in memory with set_fields(), and write the file
+    once. Lines that are never set keep their original bytes. Raises ValueError,
+    like find_row_indices, if any row isn't N_COLS columns.
+
+    rows_with_link() answers "which rows hold this link, normalized?" from a map
+    that set_fields() keeps current, so a batch sees links taken or freed by its
+    own earlier edits.
+    """
+
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+        self._fields: dict[int, list[str]] = {}
+        self._by_id: dict[str, list[int]] = {}
+        self._by_link: dict[str, list[int]] = {}
+        self._by_normalized_link: dict[str, list[int]] | None = None  # built on first use
+        for i, line in enumerate(lines[1:], start=1):  # skip header
+            content, _ = split_eol(line)
+            if not content.strip():
+                continue
+            fields = next(csv.reader([content]))
+            if len(fields) != N_COLS:
+                raise ValueError(
+                    f"row {i + 1} has {len(fields)} columns (expected {N_COLS}); may span multiple lines"
+                )
+            self._fields[i] = fields
+            self._index(i, fields)
+
+    @classmethod
+    def read(cls, csv_path: Path | None = None) -> RowTable:
+        return cls(read_lines(csv_path))
+
+    def _index(self, i: int, fields: list[str]) -> None:
+        self._by_id.setdefault(fields[COL_ID], []).append(i)
+        self._by_link.setdefault(fields[COL_LINK].strip(), []).append(i)
+
+    def find(self, *, id: str = "", link: str = "") -> list[int]:
+        """Line indices of rows whose ID is `id` or whose Link is `link` (stripped)."""
+        hits = set(self._by_id.get(id, ())) if id else set()
+        if link:
+            hits.update(self._by_link.get(link.strip(), ()))
+        return sorted(hits)
+
+    @staticmethod
+    def _link_key(link: str) -> str:
+        # Imported here: dedupe_index itself imports this module.
+        from resources.dedupe_index import normalize_link
+
+        return normalize_link(link) if link.strip() else ""
+
+    def rows_with_link(self, link: str) -> list[int]:
+        """Line indices of rows whose Link matches `link` after normalize_link()."""
+        if not link.strip():
+            return []
+        if self._by_normalized_link is None:
+            self._by_normalized_link = {}
+            for i, fields in self._fields.items():
+                self._by_normalized_link.setdefault(self._link_key(fields[COL_LINK]), []).append(i)
+        return sorted(self._by_normalized_link.get(self._link_key(link), ()))
+
+    def fields(self, i: int) -> list[str]:
+        """A copy of row `i`'s fields, safe to modify and pass to set_fields()."""
+        return list(self._fields[i])
+
+    def set_fields(self, i: int, fields: list[str]) -> None:
+        """Replace row `i` in memory, re-serialized with its original line ending."""
+        old = self._fields[i]
+        self._by_id[old[COL_ID]].remove(i)
+        self._by_link[old[COL_LINK].strip()].remove(i)
+        self._fields[i] = list(fields)
+        self._index(i, self._fields[i])
+        if self._by_normalized_link is not None:
+            self._by_normalized_link[self._link_key(old[COL_LINK])].remove(i)
+            self._by_normalized_link.setdefault(self._link_key(fields[COL_LINK]), []).append(i)
+        _, eol = split_eol(self.lines[i])
+        self.lines[i] = serialize_row(fields, eol)
+
+    def write(self, csv_path: Path | None = None) -> None:
+        write_lines(self.lines, csv_path)
+
+
+# --------------------------------------------------------------------------- #
+# Batch input files (the --from-file modes of add / move / update_resource)
+# --------------------------------------------------------------------------- #
+# Record keys are the scripts' flag names (display_name, new_link, ...); headers may
+# also use the table's own column names, normalized by _field_key.
+_FIELD_ALIASES = {"sub_category": "subcategory"}
+
+
+def _field_key(header: str) -> str:
+    key = header.strip().lower().replace(" ", "_").replace("-", "_")
+    return _FIELD_ALIASES.get(key, key)
+
+
+def read_batch(path: Path) -> list[dict[str, str]]:
+    """Records from a .jsonl (one object per line) or .csv (header row) file.
+
+    Raises ValueError on malformed input (with the offending line number).
+    """
+    records: list[dict[str, str]] = []
+    if path.suffix.lower() == ".csv":
+        # Read with newline="" and let csv split the records: quoted fields keep
+        # their embedded line breaks byte-for-byte (\r\n stays \r\n; \x0b, \u2028
+        # ... aren't row breaks the way str.splitlines() would make them).
+        with path.open(encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                records.append({_field_key(k): (v or "").strip() for k, v in row.items() if k})
+        return records
+    text = path.read_text(encoding="utf-8")
+    for n, line in enumerate(text.split("\n"), 1):  # JSON may carry a raw \u2028 inside a string
+        if not line.strip():
             continue
-        fields = next(csv.reader([content]))
-        if len(fields) != N_COLS:
-            raise ValueError(f"row {i + 1} has {len(fields)} columns (expected {N_COLS}); may span multiple lines")
-        if (id and fields[COL_ID] == id) or (link and fields[COL_LINK].strip() == link.strip()):
-            out.append(i)
-    return out
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {n}: invalid JSON ({e.msg})") from e
+        if not isinstance(obj, dict):
+            raise ValueError(f"line {n}: expected a JSON object")
+        records.append({_field_key(k): str(v or "").strip() for k, v in obj.items()})
+    return records
 
 
 def _value_map(data: dict[str, str], now: str) -> dict[str, str]:
@@ -102,10 +363,27 @@ def _value_map(data: dict[str, str], now: str) -> dict[str, str]:
 
 def append_to_csv(data: dict[str, str], csv_path: Path | None = None) -> bool:
     """Append one resource row, honoring the existing header order."""
+    return append_rows_to_csv([data], csv_path)
+
+
+def append_rows_to_csv(rows: list[dict[str, str]], csv_path: Path | None = None) -> bool:
+    """Append resource rows in one buffered write, honoring the existing header order.
+
+    The append holds the CSV's lock (concurrent appends can't interleave) and only
+    reads the header and the last byte, so it costs O(new rows), not O(file). It is
+    a single write followed by fsync; if the write fails the file is truncated back
+    to its previous length. Edits that change existing rows use the atomic rewrite
+    in safe_io instead.
+    """
     path = csv_path or CSV_PATH
+    with locked(path):
+        return _append_rows(rows, path)
+
+
+def _append_rows(rows: list[dict[str, str]], path: Path) -> bool:
     try:
         with path.open(encoding="utf-8", newline="") as f:
-            headers = next(csv.reader(f), None)
+            headers = next(csv.reader([f.readline()]), None)
     except OSError as e:
         print(f"Error reading CSV header: {e}")
         return False
@@ -114,16 +392,29 @@ def append_to_csv(data: dict[str, str], csv_path: Path | None = None) -> bool:
         return False
 
     now = datetime.now().strftime("%Y-%m-%d:%H-%M-%S")
-    value_map = _value_map(data, now)
-    missing = [key for key in value_map if key not in headers]
+    value_maps = [_value_map(data, now) for data in rows]
+    missing = [key for key in _value_map({}, now) if key not in headers]
     if missing:
         print(f"Error: CSV header missing columns {', '.join(missing)}")
         return False
 
-    row = {header: value_map.get(header, "") for header in headers}
+    out = [{header: value_map.get(header, "") for header in headers} for value_map in value_maps]
+    buf = io.StringIO()
+    csv.DictWriter(buf, fieldnames=headers, lineterminator="\n").writerows(out)
+    data = buf.getvalue().encode("utf-8")
     try:
-        with path.open("a", newline="", encoding="utf-8") as f:
-            csv.DictWriter(f, fieldnames=headers, lineterminator="\n").writerow(row)
+        with path.open("r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            f.seek(end - 1)
+            if f.read(1) not in (b"\n", b"\r"):
+                data = b"\n" + data  # don't glue the first new row onto an unterminated last line
+            try:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            except BaseException:
+                f.truncate(end)
+                raise
         return True
     except OSError as e:
         print(f"Error writing to CSV: {e}")
@@ -0,0 +1,118 @@
+"""Crash-safe, locked writes for the files the tooling rewrites.
+
+Every rewrite of the CSV, README.md, config.yaml, and the issue form goes through
+atomic_write_text(): the new content is written to a temp file in the target's
+directory, fsynced, and swapped in with os.replace(), so a reader (or a crash)
+only ever sees the old file or the new one — never a truncated table. (Plain
+row appends to the CSV are a single locked write + fsync instead; see
+resource_utils.append_rows_to_csv.)
+
+locked() adds an advisory fcntl lock (a sidecar `.cache/<name>.lock`) so
+read-modify-write sequences from concurrent scripts or workflow runs serialize
+per file instead of losing each other's edits. Locks are re-entrant within a
+process (a batch edit can hold the CSV lock while the shared writers take it
+again). Where fcntl doesn't exist (Windows) locking is a no-op; the writes are
+still atomic.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+# Lock file -> (open fd, depth) for the locks this process currently holds.
+_held: dict[Path, tuple[int, int]] = {}
+_held_guard = threading.Lock()
+
+
+def lock_path(path: Path) -> Path:
+    return path.parent / ".cache" / f"{path.name}.lock"
+
+
+@contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on `path` for the duration of the block."""
+    if fcntl is None:  # pragma: no cover - non-POSIX
+        yield
+        return
+    lock = lock_path(path).resolve()
+    with _held_guard:
+        held = _held.get(lock)
+        if held is not None:
+            _held[lock] = (held[0], held[1] + 1)
+    if held is None:
+        lock.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        with _held_guard:
+            _held[lock] = (fd, 1)
+    try:
+        yield
+    finally:
+        with _held_guard:
+            fd, depth = _held[lock]
+            if depth > 1:
+                _held[lock] = (fd, depth - 1)
+            else:
+                del _held[lock]
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+
+def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    """Replace `path` with `text` via temp file + os.replace (keeps the file mode)."""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace `path` with `data` via temp file + os.replace (keeps the file mode)."""
+    with atomic_open(path) as f:
+        f.write(data)
+
+
+@contextmanager
+def atomic_open(path: Path) -> Iterator[BinaryIO]:
+    """A binary file that replaces `path` when the block exits without an error.
+
+    Writes go to a temp file in `path`'s directory, which is fsynced, given
+    `path`'s mode, and swapped in with os.replace(); on an exception it is
+    removed and `path` is left untouched. Lets a writer stream its output
+    instead of building it in memory first.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def locked_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    """atomic_write_text() while holding `path`'s lock."""
+    with locked(path):
+        atomic_write_text(path, text, encoding=encoding)
@@ -5,19 +5,26 @@ Identifies the row by --id or --link (the current link) and sets any of
 --new-link, --display-name, --author-name, --author-link, --description — rewriting
 only that one CSV line; the ID, Category/Sub-Category, dates, and Active/Stale flags
 are left untouched. Re-filing to a different category is move_resource.py's job. When
---new-link changes the link it is checked against the other rows so two resources can't
-collide on one link. Rendering README.md is generate_readme.py's job; the
-`make update-resource` target chains the two. Use --dry-run to preview.
+--new-link changes the link it is checked (normalized, as in resources/dedupe_index.py)
+against every other row of the table being edited, so two resources can't collide on
+one link. Rendering README.md is generate_readme.py's job; the `make update-resource`
+target chains the two. Use --dry-run to preview.
+
+--from-file applies a batch (JSONL, or CSV with a header row; keys id or link plus
+any of the setter flag names, e.g. new_link, description; blank values are skipped)
+in one transaction: the CSV is parsed once, every edit is resolved in memory and ALL
+errors are reported up front, and only a fully clean batch is written, once.
+`make update-resources FILE=...` chains one README regeneration after it.
 
 Usage:
     update_resource.py (--id ID | --link URL) [--new-link URL] [--display-name NAME] \
         [--author-name NAME] [--author-link URL] [--description TEXT] [--dry-run]
+    update_resource.py --from-file edits.jsonl [--dry-run]
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
 import sys
 from pathlib import Path
 
@@ -30,11 +37,9 @@ from resources.resource_utils import (  # noqa: E402
     COL_DESCRIPTION,
     COL_DISPLAY,
     COL_LINK,
-    find_row_indices,
-    read_lines,
-    serialize_row,
-    split_eol,
-    write_lines,
+    RowTable,
+    csv_lock,
+    read_batch,
 )
 
 # CLI flag -> (column index, human label). Order controls the dry-run/print order.
@@ -47,11 +52,120 @@ FIELD_COLS: dict[str, tuple[int, str]] = {
 }
 
 
+Change = tuple[str, str, str]  # (label, old value, new value)
+
+
+def update_row(
+    table: RowTable,
+    *,
+    id: str = "",
+    link: str = "",
+    setters: dict[str, str],
+) -> tuple[str, list[Change]]:
+    """Apply `setters` to the row selected by `id` / `link` in `table` (in memory).
+
+    Returns (display name, changes). Raises LookupError if the selector matches no
+    row or several, and ValueError if a new link belongs to a different row of
+    `table` — which, in a batch, already reflects the entries applied before it.
+    """
+    selector = f"id {id!r}" if id else f"link {link!r}"
+    matches = table.find(id=id, link=link)
+    if not matches:
+        raise LookupError(f"no resource found with {selector}")
+    if len(matches) > 1:
+        raise LookupError(f"{len(matches)} rows match {selector}; refusing to update an ambiguous set")
+
+    fields = table.fields(matches[0])
+    # A new link must not collide with a *different* row. Rows are compared by
+    # position, not ID, so blank or duplicated IDs can't mask or fake a clash.
+    if "new_link" in setters and any(i != matches[0] for i in table.rows_with_link(setters["new_link"])):
+        raise ValueError(
+            f"link {setters['new_link']!r} already belongs to another resource; refusing to create a duplicate"
+        )
+
+    changes: list[Change] = []
+    for key, value in setters.items():
+        col, label = FIELD_COLS[key]
+        if fields[col] != value:
+            changes.append((label, fields[col], value))
+            fields[col] = value
+    if changes:
+        table.set_fields(matches[0], fields)
+    return fields[COL_DISPLAY], changes
+
+
+def _print_changes(display: str, changes: list[Change]) -> None:
+    print(f"[dry-run] {display!r}:")
+    for label, old, new in changes:
+        print(f"    {label}: {old!r}  ->  {new!r}")
+
+
+def main_batch(path: Path, *, dry_run: bool = False) -> int:
+    """--from-file: resolve and validate every edit first, then write the CSV once."""
+    try:
+        records = read_batch(path)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: cannot read {path}: {e}", file=sys.stderr)
+        return 1
+    if not records:
+        print(f"ERROR: {path} holds no entries.", file=sys.stderr)
+        return 1
+    try:
+        table = RowTable.read()
+    except ValueError as e:
+        print(f"ERROR: {e}. Refusing to edit — handle it manually.", file=sys.stderr)
+        return 1
+
+    errors: list[str] = []
+    updates: list[tuple[str, list[Change]]] = []
+    for n, rec in enumerate(records, 1):
+        where = f"entry {n}"
+        unknown = sorted(set(rec) - {"id", "link", *FIELD_COLS})
+        if unknown:
+            errors.append(f"{where}: unknown field(s) {', '.join(unknown)}")
+        # Blank cells mean "leave as is" (a CSV batch has every column on every row).
+        setters = {key: rec[key] for key in FIELD_COLS if rec.get(key)}
+        if not (rec.get("id") or rec.get("link")) or not setters:
+            errors.append(f"{where}: needs one of id / link and at least one field to set")
+            continue
+        try:
+            updates.append(update_row(table, id=rec.get("id", ""), link=rec.get("link", ""), setters=setters))
+        except (LookupError, ValueError) as e:
+            errors.append(f"{where}: {e}")
+
+    if errors:
+        print(f"ERROR: {len(errors)} problem(s) in {path}; nothing was updated:", file=sys.stderr)
+        for error in errors:
+            print(f"  - {error}", file=sys.stderr)
+        return 1
+
+    changed = [(display, changes) for display, changes in updates if changes]
+    for display, changes in updates:
+        if not changes:
+            print(f"note: {display!r} already has those values; nothing to do.")
+        elif dry_run:
+            _print_changes(display, changes)
+        else:
+            print(f"Updating {display!r} ({', '.join(label for label, _, _ in changes)})")
+    if dry_run or not changed:
+        return 0
+
+    table.write()
+    print(f"Updated {len(changed)} resource(s) in THE_RESOURCES_TABLE_NEW.csv.")
+    print("Run `make generate` (chained by the make update-resources target) to update README.md.")
+    return 0
+
+
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
-    sel = p.add_mutually_exclusive_group(required=True)
+    sel = p.add_mutually_exclusive_group()
     sel.add_argument("--id", help="Resource ID to update.")
     sel.add_argument("--link", help="Current Link of the resource to update.")
+    sel.add_argument(
+        "--from-file",
+        type=Path,
+        help="Apply a batch of edits from a .jsonl or .csv file (replaces the per-field flags).",
+    )
     p.add_argument("--new-link", dest="new_link", help="Replacement canonical URL.")
     p.add_argument("--display-name", dest="display_name", help="Replacement display name.")
     p.add_argument("--author-name", dest="author_name", help="Replacement author name.")
@@ -62,7 +176,18 @@ def _build_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = _build_parser().parse_args(argv)
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    # Hold the CSV lock from the read to the write, so concurrent edits can't be lost.
+    with csv_lock():
+        if args.from_file:
+            return main_batch(args.from_file, dry_run=args.dry_run)
+        return _main_single(parser, args)
+
+
+def _main_single(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if not (args.id or args.link):
+        parser.error("one of --id / --link is required (or pass --from-file)")
 
     setters = {key: getattr(args, key) for key in FIELD_COLS if getattr(args, key) is not None}
     if not setters:
@@ -73,57 +198,26 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 1
 
-    lines = read_lines()
-    selector = f"id {args.id!r}" if args.id else f"link {args.link!r}"
     try:
-        matches = find_row_indices(lines, id=args.id or "", link=args.link or "")
+        table = RowTable.read()
     except ValueError as e:
         print(f"ERROR: {e}. Refusing to edit — handle it manually.", file=sys.stderr)
         return 1
-
-    if not matches:
-        print(f"ERROR: no resource found with {selector}.", file=sys.stderr)
-        return 1
-    if len(matches) > 1:
-        print(f"ERROR: {len(matches)} rows match {selector}; refusing to update an ambiguous set.", file=sys.stderr)
+    try:
+        display, changes = update_row(table, id=args.id or "", link=args.link or "", setters=setters)
+    except (LookupError, ValueError) as e:
+        print(f"ERROR: {e}.", file=sys.stderr)
         return 1
 
-    idx = matches[0]
-
-    # A new link must not collide with a *different* row.
-    if "new_link" in setters:
-        clashes = [i for i in find_row_indices(lines, link=setters["new_link"]) if i != idx]
-        if clashes:
-            print(
-                f"ERROR: link {setters['new_link']!r} already belongs to another resource; "
-                "refusing to create a duplicate.",
-                file=sys.stderr,
-            )
-            return 1
-
-    content, eol = split_eol(lines[idx])
-    fields = next(csv.reader([content]))
-    display = fields[COL_DISPLAY]
-
-    changes: list[tuple[str, str, str]] = []
-    for key, value in setters.items():
-        col, label = FIELD_COLS[key]
-        if fields[col] != value:
-            changes.append((label, fields[col], value))
-            fields[col] = value
-
     if not changes:
         print(f"note: {display!r} already has those values; nothing to do.")
         return 0
 
     if args.dry_run:
-        print(f"[dry-run] {display!r}:")
-        for label, old, new in changes:
-            print(f"    {label}: {old!r}  ->  {new!r}")
+        _print_changes(display, changes)
         return 0
 
-    lines[idx] = serialize_row(fields, eol)
-    write_lines(lines)
+    table.write()
 
     print(f"Updated {display!r} ({', '.join(label for label, _, _ in changes)}) in THE_RESOURCES_TABLE_NEW.csv.")
     print("Run `make generate` (chained by the make update-resource target) to update README.md.")
@@ -31,15 +31,18 @@ omitted to append; for `move` it is required.
 from __future__ import annotations
 
 import argparse
-import csv
 import re
 import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 BASE = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE))
+
+from resources.categories import parse_yaml  # noqa: E402
+from resources.resource_utils import iter_rows  # noqa: E402
+from resources.safe_io import atomic_write_text, locked, locked_write_text  # noqa: E402
+
 CONFIG_PATH = BASE / "config.yaml"
 CSV_PATH = BASE / "THE_RESOURCES_TABLE_NEW.csv"
 ISSUE_FORM_PATH = BASE / ".github" / "ISSUE_TEMPLATE" / "recommend-resource.yml"
@@ -87,7 +90,7 @@ def _unquote(value: str) -> str:
 
 def load_structure(text: str) -> dict[str, Any]:
     """Parse config.yaml text into its data structure (for validation only)."""
-    return yaml.safe_load(text) or {}
+    return parse_yaml(text) or {}
 
 
 def existing_categories(text: str) -> list[dict[str, Any]]:
@@ -99,13 +102,10 @@ def active_resource_count(category: str) -> int:
     """Count Active CSV rows in `category` (used to guard category removal)."""
     if not CSV_PATH.exists():
         return 0
-    with CSV_PATH.open(encoding="utf-8", newline="") as fh:
-        rows = list(csv.DictReader(fh))
     return sum(
         1
-        for r in rows
-        if (r.get("Active") or "").strip().upper() == "TRUE"
-        and (r.get("Category") or "").strip() == category
+        for (row_category,) in iter_rows(("Category",), active_only=True, csv_path=CSV_PATH)
+        if row_category.strip() == category
     )
 
 
@@ -343,7 +343,7 @@ LIST_ITEM_RE = re.compile(r"^(\s*)-\s+(.+?)\s*$")
 
 def current_form_options(form_text: str) -> list[str]:
     """The Category dropdown's current options (via YAML parse), for validation/tests."""
-    data = yaml.safe_load(form_text) or {}
+    data = parse_yaml(form_text) or {}
     for field in data.get("body", []) if isinstance(data, dict) else []:
         if (
             isinstance(field, dict)
@@ -551,7 +551,7 @@ def _sync_form(config_text: str) -> None:
         )
         return
     if updated != form_text:
-        ISSUE_FORM_PATH.write_text(updated, encoding="utf-8")
+        locked_write_text(ISSUE_FORM_PATH, updated)
         print("Updated the recommend-resource issue-form dropdown.")
 
 
@@ -560,7 +560,12 @@ def main(argv: list[str] | None = None) -> int:
     if args.order is not None and args.order < 1:
         print("ERROR: --order must be a positive (1-based) integer.", file=sys.stderr)
         return 2
+    # One lock from reading config.yaml to writing it (and the form synced from it).
+    with locked(CONFIG_PATH):
+        return _edit_config(args)
+
 
+def _edit_config(args: argparse.Namespace) -> int:
     text = CONFIG_PATH.read_text(encoding="utf-8")
     try:
         new_text, summary = _apply(args, text)
@@ -579,7 +584,7 @@ def main(argv: list[str] | None = None) -> int:
         sys.stdout.write(new_text)
         return 0
 
-    CONFIG_PATH.write_text(new_text, encoding="utf-8")
+    atomic_write_text(CONFIG_PATH, new_text)
     verb = {"add": "Added", "move": "Moved", "remove": "Removed"}[args.action]
     where = "" if args.order is None else f" to position {args.order}"
     print(f"{verb} {summary}{where} in config.yaml.")
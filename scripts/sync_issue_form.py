@@ -19,6 +19,7 @@ from pathlib import Path
 BASE = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE))
 
+from resources.safe_io import locked_write_text  # noqa: E402
 from scripts import manage_categories as mc  # noqa: E402
 
 
@@ -53,7 +54,7 @@ def main(argv: list[str] | None = None) -> int:
             file=sys.stderr,
         )
         return 1
-    mc.ISSUE_FORM_PATH.write_text(updated, encoding="utf-8")
+    locked_write_text(mc.ISSUE_FORM_PATH, updated)
     print(f"Updated {rel} from config.yaml.")
     return 0
 
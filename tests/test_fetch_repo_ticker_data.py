@@ -13,14 +13,16 @@ import requests
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import ticker.fetch_repo_ticker_data as fetch_repo_ticker_data  # noqa: E402
+from ticker.snapshot_store import SnapshotStore  # noqa: E402
 
 
 class DummyResponse:
-    """Minimal response stub for requests.get."""
+    """Minimal response stub for Session.get."""
 
-    def __init__(self, payload: dict, status_code: int = 200) -> None:
+    def __init__(self, payload: dict, status_code: int = 200, etag: str = "") -> None:
         self._payload = payload
         self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
 
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
@@ -94,7 +96,27 @@ def test_save_to_csv_writes_output(tmp_path: Path) -> None:
     assert rows[0]["stars_delta"] == "1"
 
 
-def test_fetch_repos_maps_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+class DummySession:
+    """Session stub: `handler(url, params, headers, timeout)` builds each response."""
+
+    def __init__(self, handler) -> None:
+        self.handler = handler
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        return self.handler(url, params, headers, timeout)
+
+
+def _item(name: str, stars: int = 1) -> dict:
+    return {
+        "full_name": name,
+        "stargazers_count": stars,
+        "watchers_count": stars,
+        "forks_count": 0,
+        "html_url": f"https://github.com/{name}",
+    }
+
+
+def test_fetch_repos_maps_fields() -> None:
     token = "token"
     payload = {
         "items": [
@@ -112,7 +134,7 @@ def test_fetch_repos_maps_fields(monkeypatch: pytest.MonkeyPatch) -> None:
     captured_headers: dict[str, str] | None = None
     captured_timeout: int | None = None
 
-    def fake_get(url, params=None, headers=None, timeout=None):
+    def fake_get(url, params, headers, timeout):
         nonlocal captured_url, captured_params, captured_headers, captured_timeout
         captured_url = url
         captured_params = params
@@ -120,9 +142,7 @@ def test_fetch_repos_maps_fields(monkeypatch: pytest.MonkeyPatch) -> None:
         captured_timeout = timeout
         return DummyResponse(payload)
 
-    monkeypatch.setattr(fetch_repo_ticker_data.requests, "get", fake_get)
-
-    repos = fetch_repo_ticker_data.fetch_repos(token)
+    repos = fetch_repo_ticker_data.fetch_repos(token, session=DummySession(fake_get), cache_path=None)
     assert repos == [
         {
             "full_name": "owner/repo",
@@ -140,16 +160,126 @@ def test_fetch_repos_maps_fields(monkeypatch: pytest.MonkeyPatch) -> None:
     assert captured_timeout == 30
 
 
-def test_fetch_repos_request_error_exits(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_get(*_args, **_kwargs):
+def test_fetch_repos_request_error_exits() -> None:
+    def fake_get(*_args):
         raise requests.exceptions.RequestException("boom")
 
-    monkeypatch.setattr(fetch_repo_ticker_data.requests, "get", fake_get)
     with pytest.raises(SystemExit):
-        fetch_repo_ticker_data.fetch_repos("token")
+        fetch_repo_ticker_data.fetch_repos("token", session=DummySession(fake_get), cache_path=None)
+
+
+def test_fetch_repos_paginates_and_merges_by_full_name(tmp_path: Path) -> None:
+    pages = {
+        1: [_item("a/one", 5), _item("b/two")],
+        2: [_item("b/two", 99), _item("c/three")],  # b/two drifted onto page 2 too
+        3: [_item("d/four")],
+    }
+    requested: list[int] = []
+
+    def fake_get(_url, params, _headers, _timeout):
+        requested.append(params["page"])
+        return DummyResponse({"total_count": 250, "items": pages[params["page"]]})
+
+    repos = fetch_repo_ticker_data.fetch_repos("t", session=DummySession(fake_get), cache_path=tmp_path / "c.json")
+
+    assert sorted(requested) == [1, 2, 3]
+    assert [r["full_name"] for r in repos] == ["a/one", "b/two", "c/three", "d/four"]
+    assert repos[1]["stars"] == 1  # first (highest-ranked) occurrence wins
+
+
+def test_fetch_repos_caps_pages_and_replays_not_modified(tmp_path: Path) -> None:
+    cache = tmp_path / "pages.json"
+    seen: list[tuple[int, str | None]] = []
+
+    def fresh(_url, params, headers, _timeout):
+        seen.append((params["page"], headers.get("If-None-Match")))
+        page = params["page"]
+        return DummyResponse({"total_count": 5000, "items": [_item(f"o/r{page}")]}, etag=f'"e{page}"')
+
+    first = fetch_repo_ticker_data.fetch_repos("t", session=DummySession(fresh), cache_path=cache)
+    assert len(first) == 10  # search API caps at 1000 results = 10 pages
+    assert all(etag is None for _, etag in seen)
+
+    seen.clear()
+
+    def unchanged(_url, params, headers, _timeout):
+        seen.append((params["page"], headers.get("If-None-Match")))
+        return DummyResponse({}, status_code=304)
+
+    second = fetch_repo_ticker_data.fetch_repos("t", session=DummySession(unchanged), cache_path=cache)
+    assert second == first
+    assert sorted(seen) == [(n, f'"e{n}"') for n in range(1, 11)]
 
 
 def test_main_missing_token_exits(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)
     with pytest.raises(SystemExit):
         fetch_repo_ticker_data.main()
+
+
+def _repo(name: str, stars: int, forks: int = 0) -> dict:
+    return {"full_name": name, "stars": stars, "watchers": stars, "forks": forks}
+
+
+def test_snapshot_store_appends_only_changes_and_answers_as_of(tmp_path: Path) -> None:
+    path = tmp_path / "history.csv"
+    store = SnapshotStore.load(path)
+    assert store.earliest is None
+
+    assert store.record([_repo("a/x", 10), _repo("b/y", 5)], 1000) == 2
+    assert store.record([_repo("a/x", 10), _repo("b/y", 7)], 2000) == 1  # a/x unchanged
+    assert store.record([_repo("a/x", 12), _repo("c/z", 1)], 3000) == 2
+
+    # Rows are appended, never rewritten: one per change.
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "timestamp,full_name,stars,watchers,forks"
+    assert len(lines) == 1 + 5
+
+    reloaded = SnapshotStore.load(path)
+    assert reloaded.earliest == 1000
+    assert reloaded.as_of("a/x", 999) is None
+    assert reloaded.as_of("a/x", 2500) == (10, 10, 0)  # carried forward from t=1000
+    assert reloaded.as_of("a/x", 3000) == (12, 12, 0)
+    assert reloaded.snapshot_as_of(2500) == {
+        "a/x": {"stars": 10, "watchers": 10, "forks": 0},
+        "b/y": {"stars": 7, "watchers": 7, "forks": 0},
+    }
+
+
+def test_snapshot_store_retention_keeps_the_last_row_before_the_window(tmp_path: Path) -> None:
+    path = tmp_path / "history.csv"
+    store = SnapshotStore.load(path)
+    for ts, stars in ((1000, 1), (2000, 2), (3000, 3), (4000, 4)):
+        store.record([_repo("a/x", stars)], ts)
+    store.record([_repo("b/y", 9)], 1500)
+
+    assert store.record([_repo("a/x", 5)], 5000, keep_since=3500) == 1
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[1:] == ["1500,b/y,9,9,0", "3000,a/x,3,3,0", "4000,a/x,4,4,0", "5000,a/x,5,5,0"]
+    reloaded = SnapshotStore.load(path)
+    assert reloaded.as_of("a/x", 3500) == (3, 3, 0)  # the window's baseline survives
+    assert reloaded.as_of("b/y", 3500) == (9, 9, 0)
+
+
+def test_main_computes_deltas_from_history_window(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 10 * 86400
+    history = tmp_path / "data" / "repo-ticker-history.csv"
+    SnapshotStore.load(history).record([_repo("a/x", 10), _repo("b/y", 3)], now - 2 * 86400)
+    SnapshotStore.load(history).record([_repo("a/x", 15)], now - 3600)  # inside the window
+
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setattr(fetch_repo_ticker_data, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(fetch_repo_ticker_data.time, "time", lambda: now)
+    monkeypatch.setattr(fetch_repo_ticker_data, "HISTORY_PATH", history)
+    monkeypatch.setattr(
+        fetch_repo_ticker_data,
+        "fetch_repos",
+        lambda _token: [_repo("a/x", 20), _repo("b/y", 3), _repo("n/ew", 4)],
+    )
+
+    fetch_repo_ticker_data.main()
+
+    with (tmp_path / "data" / "repo-ticker.csv").open(encoding="utf-8") as f:
+        deltas = {row["full_name"]: int(row["stars_delta"]) for row in csv.DictReader(f)}
+    assert deltas == {"a/x": 10, "b/y": 0, "n/ew": 4}
+    assert SnapshotStore.load(history).as_of("a/x", now) == (20, 20, 0)
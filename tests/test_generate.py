@@ -10,6 +10,7 @@ Run:  venv/bin/python -m pytest -q   (or `make test`)
 
 from __future__ import annotations
 
+import json
 import re
 import sys
 from pathlib import Path
@@ -144,6 +145,63 @@ def test_format_entry_non_github_has_no_badge_line() -> None:
     assert out == "- [Vid](https://youtu.be/abc) by A - d"
 
 
+def test_format_entry_memo_tracks_rendered_fields_and_persists(tmp_path: Path) -> None:
+    row = {"Display Name": "Memo", "Link": "https://github.com/o/memo", "Description": "one"}
+    first = fmt.format_entry(row)
+    assert fmt.format_entry(dict(row)) is first  # served from the memo
+    assert "two" in fmt.format_entry({**row, "Description": "two"})  # new key, re-rendered
+
+    path = tmp_path / "memo.json"
+    fmt.save_memo(path)
+    fmt.clear_memo()
+    assert fmt.load_memo(path) >= 2
+    assert fmt.format_entry(row) == first
+
+    # A memo written by different formatter code is ignored.
+    path.write_text(path.read_text().replace('"fingerprint": "', '"fingerprint": "x'))
+    fmt.clear_memo()
+    assert fmt.load_memo(path) == 0
+
+    for malformed in ("[]", '"memo"', "null"):  # valid JSON, but not a memo object
+        path.write_text(malformed, encoding="utf-8")
+        assert fmt.load_memo(path) == 0
+
+
+def test_static_badge_mode_uses_local_svgs_and_relocates_them_on_pages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    row = {"Display Name": "S", "Link": "https://github.com/Owner/Repo", "Description": "d"}
+    shields = fmt.format_entry(row)
+    try:
+        fmt.use_static_badges(["owner/repo"])
+        assert fmt.format_entry(row).split("\n")[1] == (
+            '<img src="assets/badges/owner/repo.svg" alt="created, last commit, license, stars">'
+        )
+        other = {**row, "Link": "https://github.com/o/no-badge"}
+        assert "img.shields.io" in fmt.format_entry(other)  # no local file -> shields
+        assert fmt.badge_mode().startswith("static:")
+    finally:
+        fmt.use_static_badges(None)
+    assert fmt.format_entry(row) == shields
+
+    # End to end: the first GitHub entry gets a badge file; its shard page points back up to it.
+    categories, rows = _load()
+    first = next(r for r in rows if fmt.parse_github(r["Link"]))
+    owner, repo = (part.lower() for part in fmt.parse_github(first["Link"]))
+    (tmp_path / "badges" / owner).mkdir(parents=True)
+    (tmp_path / "badges" / owner / f"{repo}.svg").write_text("<svg/>", encoding="utf-8")
+    monkeypatch.setattr(gen, "BADGE_DIR", tmp_path / "badges")
+    monkeypatch.setattr(gen, "OUTPUT_PATH", tmp_path / "README.md")
+    monkeypatch.setattr(gen, "MANIFEST_PATH", tmp_path / ".cache" / "m.json")
+    try:
+        gen.main(["--static-badges", "--shard-dir", str(tmp_path / "categories")])
+    finally:
+        fmt.use_static_badges(None)
+    page = (tmp_path / "categories" / f"{gen.github_slug(first['Category'])}.md").read_text(encoding="utf-8")
+    assert f'src="../badges/{owner}/{repo}.svg"' in page
+    assert page.count('alt="created, last commit, license, stars"') == 1  # the rest keep shields badges
+
+
 def test_parse_github() -> None:
     assert fmt.parse_github("https://github.com/o/r") == ("o", "r")
     assert fmt.parse_github("https://github.com/o/r.git") == ("o", "r")
@@ -194,6 +252,21 @@ def test_recently_added_markup_and_token_substitution() -> None:
     assert gen.RECENTLY_ADDED_SVG in out
 
 
+def test_template_tokens_substituted_in_one_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gen, "TOKEN_RENDERERS", dict(gen.TOKEN_RENDERERS))
+    gen.register_token("{{STAR_COUNT}}", lambda: "42 {{THE_LIST}}")
+    with pytest.raises(ValueError):
+        gen.register_token("{{lower}}", lambda: "")
+
+    template = "{{STAR_COUNT}} | {{TABLE_OF_CONTENTS}} | {{UNKNOWN}} | {{THE_LIST}}"
+    tokens = ("{{STAR_COUNT}}", "{{TABLE_OF_CONTENTS}}", "{{UNKNOWN}}", "{{THE_LIST}}")
+    assert gen.split_template(template)[1::2] == tokens
+    # Values are never rescanned for tokens; unknown tokens pass through untouched.
+    assert gen._substitute(template, "toc {{STAR_COUNT}}", "list") == (
+        "42 {{THE_LIST}} | toc {{STAR_COUNT}} | {{UNKNOWN}} | list"
+    )
+
+
 def test_empty_category_renders_no_heading() -> None:
     """A category declared in config but with no active rows is skipped in the body
     (mirrors the TOC), so declaring a category ahead of its first resource doesn't
@@ -205,3 +278,194 @@ def test_empty_category_renders_no_heading() -> None:
     ]
     body = gen.build_list(rows, categories)
     assert "Empty Zzz" not in body
+
+
+def test_group_rows_buckets_and_presorts_for_shared_render() -> None:
+    """One grouping pass feeds both renderers: buckets are keyed category ->
+    sub-category ("" = none), pre-sorted, and leftover sub-categories render after
+    the configured ones (alphabetically) in both the TOC and the body."""
+    rows = [
+        {"Display Name": "zeta", "Category": "C", "Sub-Category": "Zed", "Link": "https://x.io/z"},
+        {"Display Name": "Beta", "Category": "C", "Sub-Category": "Conf", "Link": "https://x.io/b"},
+        {"Display Name": "alpha", "Category": "C", "Sub-Category": "Conf", "Link": "https://x.io/a"},
+        {"Display Name": "loose", "Category": "C", "Sub-Category": "", "Link": "https://x.io/l"},
+        {"Display Name": "Amp", "Category": "C", "Sub-Category": "Apex", "Link": "https://x.io/p"},
+    ]
+    categories = [
+        {"name": "C", "description": "", "subcategories": [{"name": "Conf", "description": ""}]}
+    ]
+    groups = gen.group_rows(rows)
+    assert [r["Display Name"] for r in groups["C"]["Conf"]] == ["alpha", "Beta"]
+    assert set(groups["C"]) == {"", "Conf", "Zed", "Apex"}
+
+    toc = gen.build_toc(rows, categories, groups)
+    assert toc.splitlines() == [
+        "- [C](#c)",
+        "  - [Conf](#conf)",
+        "  - [Apex](#apex)",
+        "  - [Zed](#zed)",
+    ]
+    body = gen.build_list(rows, categories, groups)
+    assert body == gen.build_list(rows, categories)  # shared index == fresh index
+    headings = re.findall(r"^#{2,3} (.+)$", body, flags=re.M)
+    assert headings == ["C", "Conf", "Apex", "Zed"]
+    assert body.index("[loose]") < body.index("### Conf")  # no-sub entries first
+
+
+def test_parallel_render_is_byte_identical() -> None:
+    sys.path.insert(0, str(BASE / "benchmarks"))
+    import bench_pipeline as bench
+
+    template = gen.TEMPLATE_PATH.read_text(encoding="utf-8")
+    for rows, categories in (_load()[::-1], bench.synthetic_table(400, 7, 3)):
+        serial = gen.render_readme(template, rows, categories)
+        assert gen.render_readme(template, rows, categories, jobs=3) == serial
+        groups = gen.group_rows(rows)
+        reuse = {name: block for name, block in gen.render_sections(categories, groups)[:2]}
+        assert gen.render_sections(categories, groups, reuse, jobs=2) == gen.render_sections(categories, groups)
+
+
+# --------------------------------------------------------------------------- #
+# Incremental regeneration
+# --------------------------------------------------------------------------- #
+def test_incremental_render_rerenders_only_changed_sections_byte_identically(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(gen, "OUTPUT_PATH", tmp_path / "README.md")
+    monkeypatch.setattr(gen, "MANIFEST_PATH", tmp_path / ".cache" / "m.json")
+    categories, rows = _load()
+    template = gen.TEMPLATE_PATH.read_text(encoding="utf-8")
+    fingerprint = gen.render_fingerprint(template)
+
+    first, manifest, n_first = gen.render_readme_incremental(template, rows, categories, fingerprint)
+    assert first == gen.render_readme(template, rows, categories)
+    gen.OUTPUT_PATH.write_text(first, encoding="utf-8")
+    gen.save_manifest(manifest)
+
+    # Edit one row: only its category's section is re-rendered, bytes still match.
+    edited = [dict(r) for r in rows]
+    edited[0]["Description"] = "An edited description."
+    previous = gen.load_manifest(fingerprint)
+    assert previous is not None
+    second, _, n_second = gen.render_readme_incremental(
+        template, edited, categories, fingerprint, previous
+    )
+    assert n_first == len(manifest["sections"]) and n_second == 1
+    assert second == gen.render_readme(template, edited, categories)
+
+
+def test_incremental_manifest_ignored_when_readme_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(gen, "OUTPUT_PATH", tmp_path / "README.md")
+    monkeypatch.setattr(gen, "MANIFEST_PATH", tmp_path / ".cache" / "m.json")
+    categories, rows = _load()
+    template = gen.TEMPLATE_PATH.read_text(encoding="utf-8")
+    fingerprint = gen.render_fingerprint(template)
+    rendered, manifest, _ = gen.render_readme_incremental(template, rows, categories, fingerprint)
+    gen.OUTPUT_PATH.write_text(rendered + "hand edit\n", encoding="utf-8")
+    gen.save_manifest(manifest)
+    assert gen.load_manifest(fingerprint) is None
+    assert gen.load_manifest("other-fingerprint") is None
+
+
+def test_main_streams_readme_and_leaves_it_intact_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(gen, "OUTPUT_PATH", tmp_path / "README.md")
+    monkeypatch.setattr(gen, "MANIFEST_PATH", tmp_path / ".cache" / "m.json")
+    categories, rows = _load()
+    template = gen.TEMPLATE_PATH.read_text(encoding="utf-8")
+    chunks = list(gen.iter_readme(template, rows, categories))
+    assert len(chunks) > len(rows)  # entry-sized pieces, never one joined list
+    expected = "".join(chunks)
+
+    gen.main([])
+    assert gen.OUTPUT_PATH.read_text(encoding="utf-8") == expected
+
+    def fail_midway(cat, subs):
+        yield f"## {cat['name']}"
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(gen, "iter_category", fail_midway)
+    with pytest.raises(RuntimeError):
+        gen.main([])
+    assert gen.OUTPUT_PATH.read_text(encoding="utf-8") == expected
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".cache", "README.md"]
+
+
+def test_json_ndjson_and_shard_outputs_share_one_render(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(gen, "OUTPUT_PATH", tmp_path / "README.md")
+    monkeypatch.setattr(gen, "MANIFEST_PATH", tmp_path / ".cache" / "m.json")
+    shards = tmp_path / "categories"
+    shards.mkdir()
+    (shards / "removed-category.md").write_text("stale", encoding="utf-8")
+    categories, rows = _load()
+
+    json_path, ndjson_path = tmp_path / "r.json", tmp_path / "r.ndjson"
+    gen.main(["--json", str(json_path), "--ndjson", str(ndjson_path), "--shard-dir", str(shards)])
+
+    doc = json.loads(json_path.read_text(encoding="utf-8"))
+    lines = ndjson_path.read_text(encoding="utf-8").splitlines()
+    assert doc["version"] == gen.INDEX_VERSION
+    assert doc["resources"] == [json.loads(line) for line in lines]
+    assert sorted(r["id"] for r in doc["resources"]) == sorted(r["ID"] for r in rows)
+    used = {r["Category"] for r in rows}
+    assert [c["name"] for c in doc["categories"]] == [c["name"] for c in categories if c["name"] in used]
+
+    pages = sorted(f"{gen.github_slug(c['name'])}.md" for c in doc["categories"])
+    assert sorted(p.name for p in shards.glob("*.md")) == sorted([*pages, "removed-category.md"])  # not ours: kept
+    assert json.loads((shards / gen.SHARD_MANIFEST).read_text(encoding="utf-8")) == {"pages": pages}
+    page = (shards / pages[0]).read_text(encoding="utf-8")
+    assert page.startswith("[Back to the list](../README.md)\n\n## ")
+
+    readme = gen.OUTPUT_PATH.read_text(encoding="utf-8")
+    assert f"](categories/{pages[0]})" in readme
+    assert "\n## " not in readme.split("# Table of Contents", 1)[1]  # sections live on the pages
+
+    # A page the last run wrote whose category is gone is removed on the next run.
+    (shards / "gone.md").write_text("stale", encoding="utf-8")
+    (shards / gen.SHARD_MANIFEST).write_text(json.dumps({"pages": [*pages, "gone.md"]}), encoding="utf-8")
+    gen.main(["--shard-dir", str(shards)])
+    assert not (shards / "gone.md").exists() and (shards / "removed-category.md").exists()
+
+
+def test_shard_dir_refuses_readme_dir_and_foreign_pages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(gen, "OUTPUT_PATH", tmp_path / "README.md")
+    monkeypatch.setattr(gen, "MANIFEST_PATH", tmp_path / ".cache" / "m.json")
+    (tmp_path / "CONTRIBUTING.md").write_text("keep me", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        gen.main(["--shard-dir", str(tmp_path)])
+
+    shards = tmp_path / "docs"
+    shards.mkdir()
+    categories, _ = _load()
+    foreign = shards / f"{gen.github_slug(categories[0]['name'])}.md"
+    foreign.write_text("hand-written", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        gen.main(["--shard-dir", str(shards)])
+    assert foreign.read_text(encoding="utf-8") == "hand-written"
+    assert (tmp_path / "CONTRIBUTING.md").read_text(encoding="utf-8") == "keep me"
+    assert not (tmp_path / "README.md").exists()
+
+
+# --------------------------------------------------------------------------- #
+# Benchmark harness (smoke test only; timings are not asserted)
+# --------------------------------------------------------------------------- #
+def test_benchmark_harness_runs_and_flags_regressions(monkeypatch: pytest.MonkeyPatch) -> None:
+    sys.path.insert(0, str(BASE / "benchmarks"))
+    import bench_pipeline as bench
+
+    rows, categories = bench.synthetic_table(50, 3, 2)
+    gen.validate_categories(rows, categories)
+    monkeypatch.setattr(bench, "TICKER_REPOS", 20)
+    results = bench.run_cases((50,), ["narrow"], repeat=1)
+    assert {"render_readme[50,narrow]", "format_entry[50]", "generate_ticker_svg[20]"} <= set(results)
+
+    baseline = {"slow": 0.010, "steady": 0.010, "noise": 0.0001}
+    current = {"slow": 0.020, "steady": 0.011, "noise": 0.001, "new": 1.0}
+    assert [case for case, _, _ in bench.find_regressions(current, baseline, 0.30)] == ["slow"]
@@ -61,3 +61,230 @@ def test_truncate_repo_name_edge_cases() -> None:
     result = truncate_repo_name(very_long)
     assert len(result) == 23  # 20 chars + "..."
     assert result == "a" * 20 + "..."
+
+
+# --------------------------------------------------------------------------- #
+# Batched, rate-limit-aware star-delta fetching (fake GraphQL session, no network)
+# --------------------------------------------------------------------------- #
+from datetime import UTC, datetime, timedelta  # noqa: E402
+
+from ticker import generate_ticker_svg as gts  # noqa: E402
+from ticker.github_graphql import GraphQLClient  # noqa: E402
+
+NOW = datetime(2026, 1, 2, 12, tzinfo=UTC)
+
+
+def _iso(hours_ago: float) -> str:
+    return (NOW - timedelta(hours=hours_ago)).isoformat().replace("+00:00", "Z")
+
+
+class FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200, headers: dict | None = None) -> None:
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self) -> dict:
+        return self._payload
+
+
+class FakeSession:
+    """Serves aliased stargazer queries from per-repo pages of starredAt hours-ago."""
+
+    def __init__(self, pages: dict[str, list[list[float]]], rate_limited_first: bool = False) -> None:
+        self.pages = pages
+        self.calls: list[dict] = []
+        self.rate_limited_first = rate_limited_first
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        self.calls.append(json)
+        if self.rate_limited_first and len(self.calls) == 1:
+            return FakeResponse({}, status_code=429, headers={"Retry-After": "7"})
+        variables = json["variables"]
+        data = {}
+        i = 0
+        while f"o{i}" in variables:
+            full_name = f"{variables[f'o{i}']}/{variables[f'n{i}']}"
+            pages = self.pages.get(full_name)
+            if pages is None:
+                data[f"r{i}"] = None
+            else:
+                page = int(variables[f"c{i}"] or 0)
+                data[f"r{i}"] = {
+                    "stargazers": {
+                        "edges": [{"starredAt": _iso(h)} for h in pages[page]],
+                        "pageInfo": {"hasNextPage": page + 1 < len(pages), "endCursor": str(page + 1)},
+                    }
+                }
+            i += 1
+        return FakeResponse({"data": data})
+
+
+def test_star_deltas_batch_repos_into_one_query_and_page_only_as_needed() -> None:
+    session = FakeSession(
+        {
+            "a/one": [[1, 2, 30]],  # crosses the 24h cutoff on page 1
+            "b/two": [[1] * 3, [5, 6]],  # needs a second page
+            "c/three": [[]],
+        }
+    )
+    client = GraphQLClient("t", session=session, sleep=lambda s: None)
+    deltas = gts.fetch_recent_star_deltas(
+        ["a/one", "b/two", "c/three", "gone/repo"], "t", NOW - timedelta(days=1), client=client, now=NOW
+    )
+    assert deltas == {"a/one": 2, "b/two": 5, "c/three": 0}  # null alias -> no delta
+    assert len(session.calls) == 2  # round 1: all four repos; round 2: only b/two
+    assert "r3: repository" in session.calls[0]["query"]
+    assert "r1:" not in session.calls[1]["query"]
+
+
+def test_graphql_client_honors_retry_after() -> None:
+    waits: list[float] = []
+    session = FakeSession({"a/one": [[1]]}, rate_limited_first=True)
+    client = GraphQLClient("t", session=session, sleep=waits.append)
+    deltas = gts.fetch_recent_star_deltas(["a/one"], "t", NOW - timedelta(days=1), client=client, now=NOW)
+    assert deltas == {"a/one": 1}
+    assert waits == [7.0]
+
+
+def test_graphql_client_treats_a_non_json_200_as_a_failed_request() -> None:
+    class HtmlResponse(FakeResponse):
+        def json(self) -> dict:
+            raise ValueError("Expecting value: line 1 column 1 (char 0)")
+
+    class HtmlSession(FakeSession):
+        def post(self, url, json=None, headers=None, timeout=None):
+            return HtmlResponse({})
+
+    client = GraphQLClient("t", session=HtmlSession({}), sleep=lambda s: None)
+    assert client.execute("{ viewer { login } }") is None
+
+
+def test_star_cache_persists_and_fetches_only_newer_stars(tmp_path: Path) -> None:
+    path = tmp_path / "star-cache.json"
+    cutoff = NOW - timedelta(days=1)
+    cache = gts.StarDeltaCache.load(path, NOW)
+    first = FakeSession({"a/one": [[2, 5, 30]]})
+    client = GraphQLClient("t", session=first, sleep=lambda s: None)
+    assert gts.fetch_recent_star_deltas(["a/one"], "t", cutoff, cache, client, now=NOW) == {"a/one": 2}
+    cache.save()
+
+    # Three hours later: one new star on top; the page still carries the old ones,
+    # but the fetch stops at the cached newest starredAt. The 5h-old star is still
+    # inside the window, so the delta is 3 without re-reading older pages.
+    later = NOW + timedelta(hours=3)
+    reloaded = gts.StarDeltaCache.load(path, later)
+    assert reloaded.newest("a/one") == NOW - timedelta(hours=2)
+    second = FakeSession({"a/one": [[-2, 2, 5, 30], [40]]})
+    client = GraphQLClient("t", session=second, sleep=lambda s: None)
+    deltas = gts.fetch_recent_star_deltas(["a/one"], "t", later - timedelta(days=1), reloaded, client, now=later)
+    assert deltas == {"a/one": 3}
+    assert len(second.calls) == 1  # never asked for page 2
+
+    # Past the TTL the entry is dropped and the repo is refetched from scratch.
+    assert gts.StarDeltaCache.load(path, NOW + gts.STAR_CACHE_TTL + timedelta(hours=1)).entries == {}
+
+
+# --------------------------------------------------------------------------- #
+# Compiled SVG templates (shared <style> classes, <symbol>/<use>)
+# --------------------------------------------------------------------------- #
+import pytest  # noqa: E402
+
+from ticker import generate_recently_added_svg as ras  # noqa: E402
+from ticker.svg_template import FONT_STACK, Template  # noqa: E402
+
+
+def test_template_renders_fields_in_one_join_and_rejects_expressions() -> None:
+    tmpl = Template('<text x="{x:g}" y="{y}">{{{label}}}</text>')
+    assert tmpl.render(x=12.50, y=3, label="a&b") == '<text x="12.5" y="3">{a&b}</text>'
+    with pytest.raises(KeyError):
+        tmpl.render(x=1, y=2)
+    with pytest.raises(ValueError):
+        Template("{repo[name]}")
+
+
+def test_generated_svgs_hoist_styles_and_reuse_the_octicon() -> None:
+    cards = [
+        {"Display Name": f"R{i}", "Author Name": "A", "Category": "Tooling", "Description": "d " * 50}
+        for i in range(3)
+    ]
+    carousel = ras.build_svg(cards, "dark")
+    assert carousel.count(FONT_STACK) == 1 and carousel.count("<style>") == 1
+    assert carousel.count(ras.REPO_ICON) == 1  # one <symbol> ...
+    assert carousel.count('href="#raRepo"') == len(cards) + 1  # ... used by every card and the wrap duplicate
+    assert "font-size=" not in carousel and "fill=" not in carousel.split("</defs>", 1)[1]
+
+    # The byte budget holds for the worst valid input, not just typical text.
+    for char in ('"', "&", "😀", "漢"):
+        long = char * 100
+        card = {"Display Name": long, "Author Name": long, "Category": long, "Description": long * 10}
+        worst = minify_svg(ras.build_svg([card] * ras.RECENT_COUNT, "dark"))
+        assert len(worst.encode("utf-8")) <= ras.CAROUSEL_BYTE_BUDGET
+
+    group = gts.generate_repo_group({"full_name": "o/r", "stars": 1500, "stars_delta": 0}, 300, flip=True)
+    assert 'class="repo" x="140" y="132">r<' in group
+    assert 'class="stars" x="174" y="102">| 1.5K ★<' in group
+    assert "font-family" not in group and "<!--" not in group
+
+
+def test_star_deltas_are_fetched_only_when_drawn(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+    monkeypatch.setattr(gts, "apply_recent_star_deltas", lambda repos: calls.append(len(repos)))
+    repos = [{"full_name": f"o/r{i}", "stars": 10, "stars_delta": 3} for i in range(3)]
+    assert "stars up" not in gts.generate_ticker_svg(repos) and calls == []
+
+    monkeypatch.setattr(gts, "SHOW_STAR_DELTAS", True)
+    assert "> +3<" in gts.generate_ticker_svg(repos) and calls == [3]
+
+
+# --------------------------------------------------------------------------- #
+# Minification + byte budget
+# --------------------------------------------------------------------------- #
+import random  # noqa: E402
+
+from ticker.svg_minify import SvgBudgetError, minify_svg, write_svg  # noqa: E402
+
+
+def test_minify_svg_strips_and_rounds_without_touching_text() -> None:
+    svg = """<svg width="900">
+  <!-- Repo: o/r -->
+  <path d="M1.7.75 0.714 2.00.5"/>
+  <rect x="0" y="0.0000" width="12.3456" fill="#111" fill="#222"/>
+  <text x="60" y="3.10"
+        aria-label="v1.2345">  by  a.b 1.2345 </text>
+</svg>"""
+    assert minify_svg(svg) == (
+        '<svg width="900"><path d="M1.7.75 .71 2 .5"/><rect width="12.35" fill="#222"/>'
+        '<text x="60" y="3.1" aria-label="v1.2345">  by  a.b 1.2345 </text></svg>'
+    )
+    assert minify_svg(minify_svg(svg)) == minify_svg(svg)
+
+
+def test_ticker_output_is_deterministic_per_seed_and_budget_blocks_the_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)  # no live star deltas
+    repos = [{"full_name": f"owner{i}/repo-{i}", "stars": i * 100, "stars_delta": 0} for i in range(20)]
+    outputs = []
+    for _ in range(2):
+        random.seed(42)
+        outputs.append(minify_svg(gts.generate_ticker_svg(repos)))
+    assert outputs[0] == outputs[1]
+    assert len(outputs[0].encode("utf-8")) <= gts.TICKER_BYTE_BUDGET
+
+    path = tmp_path / "t.svg"
+    path.write_text("previous", encoding="utf-8")
+    with pytest.raises(SvgBudgetError):
+        write_svg(path, outputs[0], budget=100)
+    assert path.read_text(encoding="utf-8") == "previous"
+    assert write_svg(path, outputs[0], budget=0) == len(outputs[0].encode("utf-8"))
+
+    import resources.safe_io as safe_io
+
+    def boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(safe_io.os, "replace", boom)
+    with pytest.raises(OSError):
+        write_svg(path, "<svg/>", budget=0)
+    assert path.read_text(encoding="utf-8") == outputs[0]  # a failed write leaves the old asset whole
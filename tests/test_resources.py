@@ -4,7 +4,11 @@ and CSV append (new 12-column schema)."""
 from __future__ import annotations
 
 import csv
+import json
+import subprocess
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -12,9 +16,15 @@ import pytest
 BASE = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE))
 
+from resources import add_resource  # noqa: E402
+from resources import categories  # noqa: E402
+from resources import check_links  # noqa: E402
+from resources import dedupe_index  # noqa: E402
+from resources import github_metadata  # noqa: E402
 from resources import move_resource  # noqa: E402
 from resources import parse_issue_form as pif  # noqa: E402
 from resources import resource_utils  # noqa: E402
+from resources import safe_io  # noqa: E402
 from resources import submit_resource_issue  # noqa: E402
 from resources import update_resource  # noqa: E402
 
@@ -132,6 +142,109 @@ def test_append_to_csv_writes_new_schema(tmp_path: Path) -> None:
     assert row["Description"] == "desc, with a comma"  # comma survives quoting
 
 
+def test_append_keeps_existing_bytes_and_mode_and_rolls_back_a_failed_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "t.csv"
+    existing = CSV_HEADER.replace("\n", "\r\n") + "a1,Alpha,Cat,,https://x.dev/a,O,,TRUE,,,d,FALSE\r\n"
+    csv_path.write_bytes(existing.encode("utf-8"))
+    csv_path.chmod(0o640)
+
+    assert resource_utils.append_to_csv({"id": "b2", "link": "https://x.dev/b"}, csv_path=csv_path)
+
+    data = csv_path.read_bytes()
+    assert data.startswith(existing.encode("utf-8"))  # CRLF rows untouched
+    assert data.count(b"\n") == 3
+    assert csv_path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+    def boom(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(resource_utils.os, "fsync", boom)
+    assert not resource_utils.append_to_csv({"id": "c3", "link": "https://x.dev/c"}, csv_path=csv_path)
+    assert csv_path.read_bytes() == data  # the partial append was truncated away
+
+    monkeypatch.undo()
+    csv_path.write_bytes(data.rstrip(b"\r\n"))  # last row without a line ending
+    assert resource_utils.append_to_csv({"id": "c3", "link": "https://x.dev/c"}, csv_path=csv_path)
+    assert [r["ID"] for r in csv.DictReader(csv_path.open(encoding="utf-8", newline=""))] == ["a1", "b2", "c3"]
+
+
+def test_safe_io_lock_is_reentrant_and_failed_write_leaves_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "README.md"
+    target.write_text("old\n", encoding="utf-8")
+    with safe_io.locked(target), safe_io.locked(target):  # nested: must not deadlock
+        safe_io.atomic_write_text(target, "new\n")
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert safe_io.lock_path(target).exists()
+
+    def boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(safe_io.os, "replace", boom)
+    with pytest.raises(OSError):
+        safe_io.locked_write_text(target, "partial")
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".cache", "README.md"]
+
+
+def test_iter_rows_projects_columns_and_filters_active(tmp_path: Path) -> None:
+    csv_path = tmp_path / "t.csv"
+    csv_path.write_text(
+        CSV_HEADER
+        + 'a1,Alpha,Cat,,https://github.com/o/a,O,,TRUE,,,"d, one",FALSE\n'
+        + "\n"  # blank lines are skipped, as csv.DictReader does
+        + "b2,Beta,Cat,,https://github.com/o/b,O,,false,,,d,FALSE\n",
+        encoding="utf-8",
+    )
+    assert list(resource_utils.iter_rows(("Link", "ID"), csv_path=csv_path)) == [
+        ("https://github.com/o/a", "a1"),
+        ("https://github.com/o/b", "b2"),
+    ]
+    assert list(resource_utils.iter_rows(("Description",), active_only=True, csv_path=csv_path)) == [
+        ("d, one",)
+    ]
+    with pytest.raises(KeyError):
+        next(resource_utils.iter_rows(("Nope",), csv_path=csv_path))
+
+
+def test_iter_rows_streams_by_default_and_caches_requested_columns_on_request(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "t.csv"
+    csv_path.write_text(
+        CSV_HEADER + "a1,Alpha,Cat,,https://x.dev/a,O,,TRUE,,,\"has \x1f sep\",FALSE\n", encoding="utf-8"
+    )
+    columns = ("ID", "Description")
+    sidecar = resource_utils.cache_path(csv_path, "columns.json")
+    assert list(resource_utils.iter_rows(columns, csv_path=csv_path)) == [("a1", "has \x1f sep")]
+    assert not sidecar.exists()  # the default path streams and writes nothing
+
+    assert list(resource_utils.iter_rows(columns, csv_path=csv_path, cached=True)) == [("a1", "has \x1f sep")]
+    assert sorted(json.loads(sidecar.read_text(encoding="utf-8"))["columns"]) == ["Description", "ID"]
+
+    real_stream = resource_utils._stream_rows
+
+    def no_stream(path: Path, columns: tuple, active_only: bool) -> None:
+        raise AssertionError("CSV re-read despite a current sidecar")
+
+    monkeypatch.setattr(resource_utils, "_stream_rows", no_stream)
+    assert list(resource_utils.iter_rows(columns, csv_path=csv_path, cached=True)) == [("a1", "has \x1f sep")]
+
+    monkeypatch.setattr(resource_utils, "_stream_rows", real_stream)
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("b2,Beta,Cat,,https://x.dev/b,O,,TRUE,,,short\n")
+    assert list(resource_utils.iter_rows(columns, active_only=True, csv_path=csv_path, cached=True)) == [
+        ("a1", "has \x1f sep"),
+        ("b2", "short"),
+    ]
+    with pytest.raises(KeyError):
+        next(resource_utils.iter_rows(("Nope",), csv_path=csv_path, cached=True))
+
+
 def test_duplicate_check_detects_existing_link(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     csv_path = tmp_path / "t.csv"
     csv_path.write_text(
@@ -144,6 +257,142 @@ def test_duplicate_check_detects_existing_link(tmp_path: Path, monkeypatch: pyte
     assert any("already exists" in w for w in warnings)
 
 
+def test_normalize_link_folds_trivial_url_variants() -> None:
+    canonical = dedupe_index.normalize_link("https://github.com/me/tool")
+    for variant in (
+        "https://github.com/me/tool/",
+        "https://www.github.com/me/tool",
+        "HTTPS://GitHub.com/Me/Tool.git",
+        "  https://github.com/me/tool.git/  ",
+    ):
+        assert dedupe_index.normalize_link(variant) == canonical
+    # Off GitHub too, links differing only in case are duplicates (as before the index).
+    assert dedupe_index.normalize_link("https://Example.com/Doc") == "https://example.com/doc"
+
+
+def test_dedupe_index_is_persisted_and_rebuilt_on_csv_change(tmp_path: Path) -> None:
+    csv_path = tmp_path / "t.csv"
+    csv_path.write_text(
+        CSV_HEADER + "i1,Existing,Status Lines,,https://github.com/me/tool,Me,,TRUE,,,d,FALSE\n",
+        encoding="utf-8",
+    )
+    index = dedupe_index.load_index(csv_path)
+    assert [rid for _, rid, _ in index.by_link("https://www.github.com/me/tool/")] == ["i1"]
+    assert index.by_name("  EXISTING ") and not index.by_name("other")
+    assert resource_utils.cache_path(csv_path, "dedupe.json").is_file()
+
+    dedupe_index._memo.clear()  # force the on-disk path
+    assert dedupe_index.load_index(csv_path).by_link("https://github.com/me/tool")
+
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("i2,Other,Status Lines,,https://gitlab.com/x/y,X,,TRUE,,,d,FALSE\n")
+    assert dedupe_index.load_index(csv_path).by_link("https://gitlab.com/x/y/")
+
+
+def test_config_is_parsed_once_and_cached_on_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "categories:\n"
+        "  - name: Alpha\n"
+        "    description: ' first '\n"
+        "    subcategories: [{name: One}, Two]\n"
+        "  - Beta\n"
+        "  - {prefix: nameless}\n",
+        encoding="utf-8",
+    )
+    loaded = categories.load_config(config)
+    assert loaded.names() == ["Alpha", "Beta"]
+    assert loaded.subcategories("Alpha") == ["One", "Two"] and loaded.subcategories("Nope") == []
+    assert loaded.by_name["Alpha"]["description"] == "first"
+    assert categories.load_config(config) is loaded  # per-process memo
+
+    # A fresh process reads the on-disk cache and never touches YAML...
+    def no_yaml(_text: str) -> None:
+        raise AssertionError("YAML parsed despite a fresh cache")
+
+    categories._memo.clear()
+    monkeypatch.setattr(categories, "parse_yaml", no_yaml)
+    assert categories.load_config(config).categories == loaded.categories
+
+    # ...until config.yaml changes.
+    monkeypatch.undo()
+    config.write_text("categories:\n  - name: Gamma\n", encoding="utf-8")
+    assert categories.load_config(config).names() == ["Gamma"]
+
+
+# --------------------------------------------------------------------------- #
+# Batch import (add_resource --from-file)
+# --------------------------------------------------------------------------- #
+def _batch_csv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    csv_path = tmp_path / "t.csv"
+    csv_path.write_text(
+        CSV_HEADER + "e1,Existing,Cat,,https://github.com/o/existing,O,,TRUE,,,d,FALSE\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(resource_utils, "CSV_PATH", csv_path)
+    monkeypatch.setattr(add_resource, "CSV_PATH", csv_path)
+    monkeypatch.setattr(add_resource, "category_names", lambda: ["Cat"])
+    monkeypatch.setattr(add_resource, "subcategories_for", lambda c: ["Sub"])
+    return csv_path
+
+
+def test_add_resource_batch_reports_every_error_and_writes_nothing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    csv_path = _batch_csv(tmp_path, monkeypatch)
+    before = csv_path.read_text(encoding="utf-8")
+    batch = tmp_path / "b.jsonl"
+    batch.write_text(
+        '{"display_name": "Fine", "category": "Cat", "link": "https://github.com/o/fine"}\n'
+        '{"display_name": "Bad Cat", "category": "Bogus", "link": "https://github.com/o/bad"}\n'
+        '{"display_name": "Dupe", "category": "Cat", "link": "https://github.com/o/existing/"}\n'
+        '{"display_name": "Again", "category": "Cat", "link": "https://github.com/o/fine.git"}\n'
+        '{"category": "Cat"}\n',
+        encoding="utf-8",
+    )
+    assert add_resource.main(["--from-file", str(batch)]) == 1
+    err = capsys.readouterr().err
+    assert "4 problem(s)" in err
+    for fragment in ("'Bogus'", "already exists", "repeats entry 1", "display_name, link"):
+        assert fragment in err
+    assert csv_path.read_text(encoding="utf-8") == before
+
+
+def test_add_resource_batch_appends_all_rows_from_csv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = _batch_csv(tmp_path, monkeypatch)
+    batch = tmp_path / "b.csv"
+    batch.write_text(
+        "Display Name,Category,Sub-Category,Link,Description\n"
+        "One,Cat,Sub,https://github.com/o/one,first\n"
+        'Two,Cat,,https://github.com/o/two,"second, with comma"\n',
+        encoding="utf-8",
+    )
+    assert add_resource.main(["--from-file", str(batch)]) == 0
+    rows = list(csv.DictReader(csv_path.open(encoding="utf-8")))
+    assert [r["Display Name"] for r in rows] == ["Existing", "One", "Two"]
+    assert rows[1]["Sub-Category"] == "Sub" and rows[1]["Active"] == "TRUE"
+    assert rows[2]["Description"] == "second, with comma"
+    assert rows[1]["ID"] and rows[1]["ID"] != rows[2]["ID"]
+
+
+def test_read_batch_keeps_line_breaks_inside_quoted_fields(tmp_path: Path) -> None:
+    batch = tmp_path / "b.csv"
+    batch.write_bytes(
+        'Display Name,Description\r\nOne,"two\r\nlines"\r\nTwo,"odd \x0b and \u2028 breaks"\r\n'.encode("utf-8")
+    )
+    assert resource_utils.read_batch(batch) == [
+        {"display_name": "One", "description": "two\r\nlines"},  # not translated to \n
+        {"display_name": "Two", "description": "odd \x0b and \u2028 breaks"},
+    ]
+    jsonl = tmp_path / "b.jsonl"
+    jsonl.write_text('{"display_name": "A\u2028B"}\r\n', encoding="utf-8")
+    assert resource_utils.read_batch(jsonl) == [{"display_name": "A\u2028B"}]
+
+
 # --- render-layer XSS / injection from foreign issue-form fields ---------------
 import importlib.util  # noqa: E402
 
@@ -273,6 +522,32 @@ def test_move_resource_unknown_category_errors(
     assert move_resource.main(["--id", "m1", "--category", "Bogus"]) == 1
 
 
+def test_move_resource_batch_is_one_transaction(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = _move_csv(tmp_path, monkeypatch)
+    with csv_path.open("a", encoding="utf-8", newline="") as f:
+        f.write("m3,Tool Three,Old Cat,,https://x.dev/three,C,,TRUE,,,d,FALSE\r\n")  # CRLF row
+    before = csv_path.read_text(encoding="utf-8")
+    batch = tmp_path / "moves.jsonl"
+
+    batch.write_text('{"id": "m1", "category": "New Cat"}\n{"id": "nope", "category": "New Cat"}\n')
+    assert move_resource.main(["--from-file", str(batch)]) == 1
+    assert csv_path.read_text(encoding="utf-8") == before  # one bad entry: nothing written
+
+    batch.write_text(
+        '{"id": "m1", "category": "New Cat", "subcategory": "Sub"}\n'
+        '{"link": "https://github.com/b/two", "category": "New Cat"}\n'
+    )
+    assert move_resource.main(["--from-file", str(batch)]) == 0
+    after = csv_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    assert after[0] == before.splitlines(keepends=True)[0]
+    assert after[3] == before.splitlines(keepends=True)[3]  # untouched row, CRLF kept
+    rows = {r["ID"]: r for r in csv.DictReader(csv_path.open(encoding="utf-8"))}
+    assert (rows["m1"]["Category"], rows["m1"]["Sub-Category"]) == ("New Cat", "Sub")
+    assert rows["m2"]["Category"] == "New Cat" and rows["m2"]["Description"] == "desc, two"
+
+
 # --------------------------------------------------------------------------- #
 # Update (edit) an existing resource's content fields
 # --------------------------------------------------------------------------- #
@@ -334,6 +609,253 @@ def test_update_resource_unknown_id_errors(
     assert update_resource.main(["--id", "nope", "--description", "x"]) == 1
 
 
+def test_update_resource_batch_applies_all_or_nothing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = _update_csv(tmp_path, monkeypatch)
+    before = csv_path.read_text(encoding="utf-8")
+    batch = tmp_path / "edits.csv"
+
+    # Two entries claiming the same new link: rejected as a whole.
+    batch.write_text(
+        "ID,New Link\nm1,https://github.com/z/new\nm2,https://www.github.com/z/new/\n", encoding="utf-8"
+    )
+    assert update_resource.main(["--from-file", str(batch)]) == 1
+    assert csv_path.read_text(encoding="utf-8") == before
+
+    batch.write_text(
+        "ID,New Link,Description\nm1,https://github.com/z/new,fresh\nm2,,second\n", encoding="utf-8"
+    )
+    assert update_resource.main(["--from-file", str(batch)]) == 0
+    rows = {r["ID"]: r for r in csv.DictReader(csv_path.open(encoding="utf-8"))}
+    assert (rows["m1"]["Link"], rows["m1"]["Description"]) == ("https://github.com/z/new", "fresh")
+    assert (rows["m2"]["Link"], rows["m2"]["Description"]) == ("https://github.com/b/two", "second")
+
+
+def test_update_resource_link_check_uses_rows_not_ids(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "t.csv"
+    csv_path.write_text(
+        CSV_HEADER
+        + ",Blank One,Cat,,https://github.com/a/one,A,,TRUE,,,d,FALSE\n"
+        + ",Blank Two,Cat,,https://github.com/b/two,B,,TRUE,,,d,FALSE\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(resource_utils, "CSV_PATH", csv_path)
+    # Both IDs are blank: taking the other row's link is still a clash ...
+    assert update_resource.main(["--link", "https://github.com/a/one", "--new-link", "https://github.com/b/two"]) == 1
+    # ... while re-spelling a row's own link is not.
+    respelled = "https://www.github.com/a/one/"
+    assert update_resource.main(["--link", "https://github.com/a/one", "--new-link", respelled]) == 0
+
+    # In a batch, a link freed by an earlier entry can be taken by a later one.
+    batch = tmp_path / "edits.jsonl"
+    batch.write_text(
+        '{"link": "https://github.com/b/two", "new_link": "https://github.com/b/moved"}\n'
+        '{"link": "https://www.github.com/a/one/", "new_link": "https://github.com/b/two"}\n',
+        encoding="utf-8",
+    )
+    assert update_resource.main(["--from-file", str(batch)]) == 0
+    links = [r["Link"] for r in csv.DictReader(csv_path.open(encoding="utf-8"))]
+    assert links == ["https://github.com/b/two", "https://github.com/b/moved"]
+
+
+# --------------------------------------------------------------------------- #
+# Link checks (check_links against a local HTTP stand-in)
+# --------------------------------------------------------------------------- #
+class _LinkHandler(BaseHTTPRequestHandler):
+    seen: list[tuple[str, str, str]] = []  # (method, path, If-None-Match)
+
+    def _answer(self) -> None:
+        self.seen.append((self.command, self.path, self.headers.get("If-None-Match", "")))
+        if self.path == "/ok":
+            status = 304 if self.headers.get("If-None-Match") == '"v1"' else 200
+        elif self.path == "/no-head":
+            status = 405 if self.command == "HEAD" else 200
+        else:
+            status = {"/gone": 404, "/flaky": 503}.get(self.path, 404)
+        self.send_response(status)
+        if self.path == "/ok":
+            self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_HEAD = do_GET = _answer
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def test_check_links_marks_dead_links_and_sends_validators(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    _LinkHandler.seen = []
+    csv_path = tmp_path / "t.csv"
+    inactive = f"i1,Inactive,Cat,,{base}/gone-too,O,,FALSE,,,d,FALSE\n"
+    csv_path.write_text(
+        CSV_HEADER
+        + f"a1,Ok,Cat,,{base}/ok,O,,TRUE,,,d,TRUE\n"
+        + f"a2,Gone,Cat,,{base}/gone,O,,TRUE,,,d,FALSE\n"
+        + f"a3,NoHead,Cat,,{base}/no-head,O,,TRUE,,,d,FALSE\n"
+        + f"a4,Flaky,Cat,,{base}/flaky,O,,TRUE,,2020-01-01:00-00-00,d,FALSE\n"
+        + inactive,
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(resource_utils, "CSV_PATH", csv_path)
+    try:
+        assert check_links.main(["--delay", "0"]) == 0
+        rows = {r["ID"]: r for r in csv.DictReader(csv_path.open(encoding="utf-8"))}
+        assert [rows[rid]["Stale"] for rid in ("a1", "a2", "a3")] == ["FALSE", "TRUE", "FALSE"]
+        assert all(rows[rid]["Last Checked"] for rid in ("a1", "a2", "a3"))
+        assert rows["a4"]["Last Checked"] == "2020-01-01:00-00-00"  # inconclusive: left alone
+        assert csv_path.read_text(encoding="utf-8").endswith(inactive)  # inactive rows aren't checked
+        assert ("GET", "/no-head", "") in _LinkHandler.seen
+
+        _LinkHandler.seen = []
+        assert check_links.main(["--delay", "0", "--dry-run"]) == 0
+        assert ("HEAD", "/ok", '"v1"') in _LinkHandler.seen  # conditional request -> 304
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# --------------------------------------------------------------------------- #
+# GitHub metadata (github_metadata against a fake GraphQL endpoint)
+# --------------------------------------------------------------------------- #
+class _GraphQLHandler(BaseHTTPRequestHandler):
+    queries: list[dict] = []
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.queries.append(body)
+        variables, data, i = body["variables"], {}, 0
+        while f"o{i}" in variables:
+            owner, name = variables[f"o{i}"], variables[f"n{i}"]
+            data[f"r{i}"] = None if name == "gone" else {
+                "nameWithOwner": f"{owner}/{name}",
+                "stargazerCount": 10 + i,
+                "forkCount": 1,
+                "isArchived": False,
+                "createdAt": "2025-01-01T00:00:00Z",
+                "pushedAt": "2026-01-01T00:00:00Z",
+                "licenseInfo": {"spdxId": "MIT", "name": "MIT License"},
+                "defaultBranchRef": {"target": {"committedDate": "2026-01-01T00:00:00Z"}},
+            }
+            i += 1
+        payload = json.dumps({"data": data}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def test_github_metadata_batches_queries_and_honors_ttl(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datetime import UTC, datetime, timedelta
+
+    from ticker.github_graphql import GraphQLClient
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GraphQLHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _GraphQLHandler.queries = []
+    monkeypatch.setattr(github_metadata, "BATCH_SIZE", 2)
+    csv_path = tmp_path / "t.csv"
+    csv_path.write_text(
+        CSV_HEADER
+        + "a,A,Cat,,https://github.com/o/one,O,,TRUE,,,d,FALSE\n"
+        + "b,B,Cat,,https://github.com/O/One/tree/main,O,,TRUE,,,d,FALSE\n"  # same repo
+        + "c,C,Cat,,https://github.com/o/two.git,O,,TRUE,,,d,FALSE\n"
+        + "d,D,Cat,,https://github.com/o/gone,O,,TRUE,,,d,FALSE\n"
+        + "e,E,Cat,,https://example.com/not-github,O,,TRUE,,,d,FALSE\n"
+        + "f,F,Cat,,https://github.com/o/three,O,,TRUE,,,d,FALSE\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(resource_utils, "CSV_PATH", csv_path)
+    now = datetime(2026, 1, 2, tzinfo=UTC)
+    try:
+        client = GraphQLClient("t", endpoint=f"http://127.0.0.1:{server.server_address[1]}/graphql")
+        repos = github_metadata.github_repos(_fmt.parse_github)
+        assert repos == [("o", "one"), ("o", "two"), ("o", "gone"), ("o", "three")]
+
+        cache = github_metadata.MetadataCache.load(tmp_path / "meta.json")
+        assert github_metadata.fetch_metadata(repos, "t", cache, client, now=now) == 4
+        assert len(_GraphQLHandler.queries) == 2  # 4 repos, 2 per query
+        assert "$c0" not in _GraphQLHandler.queries[0]["query"]  # no unused cursor variables
+        cache.save()
+
+        reloaded = github_metadata.MetadataCache.load(tmp_path / "meta.json")
+        assert reloaded.get("O", "ONE")["license"] == "MIT"
+        assert reloaded.get("o", "two")["last_commit"] == "2026-01-01T00:00:00Z"
+        assert reloaded.get("o", "gone") is None  # recorded as missing, not refetched
+        assert github_metadata.fetch_metadata(repos, "t", reloaded, client, now=now + timedelta(hours=1)) == 0
+        assert len(_GraphQLHandler.queries) == 2
+        later = now + github_metadata.METADATA_TTL + timedelta(minutes=1)
+        assert github_metadata.fetch_metadata(repos, "t", reloaded, client, now=later) == 4
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_github_metadata_partial_refresh_succeeds_with_warning(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    repos = [("o", "one"), ("o", "two")]
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setattr(github_metadata, "METADATA_PATH", tmp_path / "data" / "meta.json")
+    monkeypatch.setattr(github_metadata, "BASE", tmp_path)
+    monkeypatch.setattr(github_metadata, "github_repos", lambda: repos)
+
+    def fetch(repos, token, cache, *, now, ttl):  # one of two batches failed
+        cache.entries["o/one"] = {"fetched_at": now.isoformat(), "stars": 1}
+        return 1
+
+    monkeypatch.setattr(github_metadata, "fetch_metadata", fetch)
+    assert github_metadata.main([]) == 0
+    assert "1 due repos were not refreshed" in capsys.readouterr().err
+    assert "o/one" in json.loads(github_metadata.METADATA_PATH.read_text(encoding="utf-8"))["repos"]
+
+    monkeypatch.setattr(github_metadata, "fetch_metadata", lambda *a, **k: 0)
+    assert github_metadata.main(["--force"]) == 1
+
+
+def test_badge_svgs_written_once_per_repo_and_pruned(tmp_path: Path) -> None:
+    from resources import generate_badge_svgs as badges
+
+    entry = {
+        "fetched_at": "2026-01-02T00:00:00Z",
+        "created_at": "2025-03-01T00:00:00Z",
+        "last_commit": "2026-01-01T00:00:00Z",
+        "license": "MIT",
+        "stars": 12345,
+    }
+    cache = github_metadata.MetadataCache({"o/one": entry, "o/gone": {"fetched_at": "x", "missing": True}})
+    badge_dir = tmp_path / "badges"
+    (badge_dir / "old").mkdir(parents=True)
+    (badge_dir / "old" / "repo.svg").write_text("<svg/>", encoding="utf-8")
+    (badge_dir / "assets").mkdir()
+    (badge_dir / "assets" / "repo-ticker.svg").write_text("<svg/>", encoding="utf-8")  # not a badge of ours
+    manifest = {"badges": ["old/repo.svg", "../escape.svg", "assets/../../x.svg"]}
+    (badge_dir / badges.BADGE_MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+    repos = [("O", "One"), ("o", "gone"), ("..", "x")]
+
+    assert badges.write_badges(repos, cache, badge_dir) == (1, 0, 1)
+    svg = (badge_dir / "o" / "one.svg").read_text(encoding="utf-8")
+    assert "created: Mar 2025, last commit: Jan 2026, license: MIT, stars: 12k" in svg
+    assert not (badge_dir / "old").exists()
+    assert (badge_dir / "assets" / "repo-ticker.svg").exists()
+    assert json.loads((badge_dir / badges.BADGE_MANIFEST).read_text(encoding="utf-8")) == {"badges": ["o/one.svg"]}
+    assert badges.write_badges(repos, cache, badge_dir) == (0, 1, 0)  # unchanged bytes aren't rewritten
+
+
 # --------------------------------------------------------------------------- #
 # Submit a resource-submission issue (body composition + guards; no gh calls)
 # --------------------------------------------------------------------------- #
@@ -417,3 +939,31 @@ def test_submit_description_file_is_backtick_safe(
     )
     assert rc == 0
     assert "`--serve --watch`" in capsys.readouterr().out
+
+
+# --------------------------------------------------------------------------- #
+# Startup cost: --help / import must not pull in PyYAML or the formatter
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["-c", "import generate_readme"],
+        ["resources/add_resource.py", "--help"],
+        ["resources/move_resource.py", "--help"],
+        ["resources/update_resource.py", "--help"],
+        ["resources/create_resource_pr.py", "--help"],
+        ["scripts/manage_categories.py", "--help"],
+    ],
+)
+def test_cli_startup_defers_heavy_imports(args: list[str]) -> None:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], cwd=BASE, capture_output=True, text=True, check=True
+    )
+    # -X importtime logs "import time: self | cumulative | <module>" per import.
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert imported, proc.stderr  # sanity: the log was parsed
+    assert not {"yaml", "awesome_formatter"} & imported
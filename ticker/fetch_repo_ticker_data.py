@@ -4,26 +4,42 @@ Fetch GitHub repository data for the stock ticker banner.
 
 This script queries the GitHub Search API for repositories matching
 "claude code" or "claude-code" in their name, readme, or description,
-calculates deltas compared to previous data, and saves the results to CSV.
+calculates deltas against the value each repo had DELTA_WINDOW_HOURS ago (read
+from the append-only history in data/repo-ticker-history.csv), and saves the
+results to CSV.
 """
 
 import csv
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import requests
 
+try:
+    from ticker.snapshot_store import HISTORY_PATH, SnapshotStore
+except ImportError:  # when run directly: `python ticker/fetch_repo_ticker_data.py`
+    from snapshot_store import HISTORY_PATH, SnapshotStore
+
 # This repo is flat (no `scripts` package / pyproject): anchor on the script's
 # own location per project convention. ticker/ -> repo root is parents[1].
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
+# Deltas compare against each repo's value this long ago.
+DELTA_WINDOW_HOURS = 24
+
 
 def load_previous_data(csv_path: Path) -> dict[str, dict[str, int]]:
     """
     Load previous repository data from CSV file.
 
+    Legacy single-snapshot baseline; main() only falls back to it until the
+    history store reaches back a full DELTA_WINDOW_HOURS.
+
     Args:
         csv_path: Path to previous CSV file
 
@@ -47,30 +63,109 @@ def load_previous_data(csv_path: Path) -> dict[str, dict[str, int]]:
     return previous
 
 
-def fetch_repos(token: str) -> list[dict[str, Any]]:
+# The search API serves at most 1000 results (10 pages of 100) per query.
+SEARCH_URL = "https://api.github.com/search/repositories"
+SEARCH_PER_PAGE = 100
+SEARCH_MAX_RESULTS = 1000
+SEARCH_WORKERS = 4
+
+# Per-page ETags + the mapped items they produced. A conditional request for an
+# unchanged page returns 304 (which doesn't count against the rate limit) and the
+# items are replayed from here. Cache only: deleting it just costs full requests.
+SEARCH_CACHE_PATH = REPO_ROOT / ".cache" / "repo-search-pages.json"
+
+# Search query. archived:false drops archived repos at the API level; forks are
+# already excluded from search by default and are also filtered out below.
+SEARCH_QUERY = '"claude code" claude-code in:name,readme,description archived:false'
+
+
+def _map_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    repos = []
+    for item in items:
+        # Skip repos named exactly "claude-code" (too generic)
+        if item["full_name"].split("/")[-1] == "claude-code":
+            continue
+        # Exclude forks and archived repos (safety net alongside the query filter).
+        if item.get("fork") or item.get("archived"):
+            continue
+        repos.append(
+            {
+                "full_name": item["full_name"],
+                "stars": item["stargazers_count"],
+                "watchers": item["watchers_count"],
+                "forks": item["forks_count"],
+                "url": item["html_url"],
+            }
+        )
+    return repos
+
+
+def _load_search_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("pages", {}) if isinstance(data, dict) and data.get("query") == SEARCH_QUERY else {}
+
+
+def _save_search_cache(path: Path, pages: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"query": SEARCH_QUERY, "pages": pages}), encoding="utf-8")
+    except OSError as e:
+        print(f"⚠ Could not write {path.name}: {e}", file=sys.stderr)
+
+
+def _fetch_page(
+    session: requests.Session, headers: dict[str, str], page: int, cached: dict[str, Any] | None
+) -> dict[str, Any]:
+    """One search page as {"etag", "total_count", "repos"}, replaying `cached` on a 304."""
+    params: dict[str, str | int] = {
+        "q": SEARCH_QUERY,
+        "per_page": SEARCH_PER_PAGE,  # Maximum results per page
+        "page": page,
+        "sort": "relevance",  # Sort by relevance (default)
+    }
+    page_headers = dict(headers)
+    if cached and cached.get("etag"):
+        page_headers["If-None-Match"] = cached["etag"]
+    response = session.get(SEARCH_URL, params=params, headers=page_headers, timeout=30)
+    if response.status_code == 304 and cached:
+        return cached
+    response.raise_for_status()
+    data = response.json()
+    return {
+        "etag": response.headers.get("ETag", ""),
+        "total_count": data.get("total_count", 0),
+        "repos": _map_items(data.get("items", [])),
+    }
+
+
+def fetch_repos(
+    token: str,
+    session: requests.Session | None = None,
+    cache_path: Path | None = SEARCH_CACHE_PATH,
+) -> list[dict[str, Any]]:
     """
     Fetch repositories from GitHub Search API.
 
+    Page 1 is fetched first to learn the result count; the remaining pages (up to
+    the API's 1000-result cap) are then fetched concurrently over one shared
+    session. Every page is a conditional request against its cached ETag.
+
     Args:
         token: GitHub authentication token
+        session: HTTP session to reuse (default: a new pooled one)
+        cache_path: ETag cache file (None disables conditional requests)
 
     Returns:
-        List of repository data dictionaries
+        List of repository data dictionaries, deduplicated by full_name in
+        search order
     """
-    # GitHub Search API endpoint
-    url = "https://api.github.com/search/repositories"
-
-    # Search query. archived:false drops archived repos at the API level; forks are
-    # already excluded from search by default and are also filtered out below.
-    query = '"claude code" claude-code in:name,readme,description archived:false'
-
-    # Parameters for the API request
-    params: dict[str, str | int] = {
-        "q": query,
-        "per_page": 100,  # Maximum results per page
-        "page": 1,
-        "sort": "relevance",  # Sort by relevance (default)
-    }
+    if session is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=SEARCH_WORKERS)
+        session.mount("https://", adapter)
 
     # Headers with authentication
     headers = {
@@ -78,37 +173,34 @@ def fetch_repos(token: str) -> list[dict[str, Any]]:
         "Authorization": f"Bearer {token}",
         "X-GitHub-Api-Version": "2026-03-10",
     }
+    cached = _load_search_cache(cache_path) if cache_path else {}
 
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-
-        repos = []
-        for item in data.get("items", []):
-            # Skip repos named exactly "claude-code" (too generic)
-            if item["full_name"].split("/")[-1] == "claude-code":
-                continue
-            # Exclude forks and archived repos (safety net alongside the query filter).
-            if item.get("fork") or item.get("archived"):
-                continue
-            repos.append(
-                {
-                    "full_name": item["full_name"],
-                    "stars": item["stargazers_count"],
-                    "watchers": item["watchers_count"],
-                    "forks": item["forks_count"],
-                    "url": item["html_url"],
-                }
-            )
-
-        print(f"✓ Fetched {len(repos)} repositories from search")
-        return repos
-
+        pages = {1: _fetch_page(session, headers, 1, cached.get("1"))}
+        total = min(pages[1]["total_count"], SEARCH_MAX_RESULTS)
+        rest = range(2, -(-total // SEARCH_PER_PAGE) + 1)
+        with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as pool:
+            for page, result in zip(
+                rest, pool.map(lambda n: _fetch_page(session, headers, n, cached.get(str(n))), rest)
+            ):
+                pages[page] = result
     except requests.exceptions.RequestException as e:
         print(f"✗ Error fetching data from GitHub API: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if cache_path:
+        _save_search_cache(cache_path, {str(n): page for n, page in pages.items()})
+
+    # Merge into one full_name-keyed structure (a repo can shift between pages
+    # while we paginate; keep its first, highest-ranked occurrence).
+    merged: dict[str, dict[str, Any]] = {}
+    for n in sorted(pages):
+        for repo in pages[n]["repos"]:
+            merged.setdefault(repo["full_name"], dict(repo))
+    repos = list(merged.values())
+    print(f"✓ Fetched {len(repos)} repositories from search ({len(pages)} page(s))")
+    return repos
+
 
 def calculate_deltas(
     repos: list[dict[str, Any]],
@@ -195,18 +287,28 @@ def main() -> None:
         print("✗ GITHUB_TOKEN environment variable not set", file=sys.stderr)
         sys.exit(1)
 
-    # Load previous data
-    previous_path = REPO_ROOT / "data" / "repo-ticker-previous.csv"
-    previous_data = load_previous_data(previous_path)
-
     # Fetch repository data
     print("Fetching repository data from GitHub API...")
     repos = fetch_repos(token)
+    now = int(time.time())
+
+    # Baseline: every repo as of DELTA_WINDOW_HOURS ago, from the history store.
+    store = SnapshotStore.load(HISTORY_PATH)
+    cutoff = now - DELTA_WINDOW_HOURS * 3600
+    if store.earliest is not None and store.earliest <= cutoff:
+        previous_data = store.snapshot_as_of(cutoff)
+        print(f"✓ Loaded {len(previous_data)} repositories as of {DELTA_WINDOW_HOURS}h ago")
+    else:
+        previous_data = load_previous_data(REPO_ROOT / "data" / "repo-ticker-previous.csv")
 
     # Calculate deltas
     print("Calculating deltas...")
     repos_with_deltas = calculate_deltas(repos, previous_data)
 
+    # Later runs only look back from later cutoffs, so older rows can go.
+    written = store.record(repos, now, keep_since=cutoff)
+    print(f"✓ Recorded {written} changed repositories in {store.path.name}")
+
     # Save to CSV
     output_path = REPO_ROOT / "data" / "repo-ticker.csv"
     save_to_csv(repos_with_deltas, output_path)
@@ -11,19 +11,28 @@ added active entries (by "Date Added"; blanks sort last). Deterministic selectio
 so output is stable until the list changes.
 
 Filter-free (GitHub renders SVG blur/glow poorly, esp. on mobile). Theme-adaptive:
-emits dark + light variants for a <picture> embed.
+emits dark + light variants for a <picture> embed. Cards are precompiled
+templates (ticker/svg_template.py): theme colors and fonts are classes in one
+<style> block and the octicon is a single <symbol> every card <use>s. Each
+variant is minified and held to CAROUSEL_BYTE_BUDGET (ticker/svg_minify.py).
 
 Run:  python ticker/generate_recently_added_svg.py   (or `make recently-added`)
 """
 
 from __future__ import annotations
 
-import csv
 import os
+import sys
 import textwrap
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from resources.resource_utils import iter_rows  # noqa: E402
+from ticker.svg_minify import SvgBudgetError, byte_budget, write_svg  # noqa: E402
+from ticker.svg_template import FONT_STACK, Template, style_block, symbol  # noqa: E402
+
 CSV_PATH = REPO_ROOT / "data" / "THE_RESOURCES_TABLE_NEW.csv"
 # Source of truth lives at repo root in this dev repo; fall back to it.
 if not CSV_PATH.exists():
@@ -44,7 +53,13 @@ CAT_MAX_CHARS = 30
 DESC_WRAP_CHARS = 74
 DESC_MAX_LINES = 3
 
-# GitHub "repo" octicon (16x16), placed per card.
+# Minified size limit per variant (SVG_BYTE_BUDGET overrides it), in UTF-8 bytes
+# after escaping. The worst valid input — every card at its length limits, all of
+# it '"' (6 bytes each as &quot;) — minifies to ~18.1 KB, so no description can
+# trip it; only a template change that grows every card can.
+CAROUSEL_BYTE_BUDGET = 20_000
+
+# GitHub "repo" octicon (16x16), defined once as a <symbol> and placed per card.
 REPO_ICON = (
     "M2 2.5A2.5 2.5 0 0 1 4.5 0h8.75a.75.75 0 0 1 .75.75v12.5a.75.75 0 0 1-.75.75h-2.5a.75.75 "
     "0 0 1 0-1.5h1.75v-2h-8a1 1 0 0 0-.714 1.7.75.75 0 1 1-1.072 1.05A2.495 2.495 0 0 1 2 11.5Zm"
@@ -102,31 +117,63 @@ def _truncate(text: str, max_chars: int) -> str:
     return text if len(text) <= max_chars else text[: max_chars - 1].rstrip() + "…"
 
 
-def build_card(repo: dict[str, str], colors: dict[str, str], x_offset: int) -> str:
+ICON_SIZE = 16 * 1.4
+
+CARD = Template(
+    """  <g transform="translate({x}, 0)">
+    <rect class="card" x="40" y="24" width="720" height="192" rx="12"/>
+    <use class="icon" href="#raRepo" x="60" y="46" width="{icon:g}" height="{icon:g}"/>
+    <text class="name" x="98" y="66">{name}</text>
+    <rect class="pill" x="{pill_x}" y="46" width="{pill_w}" height="24" rx="12"/>
+    <text class="cat" x="{pill_cx:g}" y="62">{category}</text>
+    <text class="by" x="64" y="106">by {author}</text>
+{desc}  </g>"""
+)
+DESC_LINE = Template('    <text class="desc" x="64" y="{y}">{line}</text>\n')
+
+
+def theme_defs(colors: dict[str, str]) -> str:
+    """The carousel's <defs>: per-theme classes plus the octicon symbol."""
+    style = style_block(
+        {
+            "text": {"font-family": FONT_STACK},
+            ".card": {"fill": colors["card_bg"], "stroke": colors["border"], "stroke-width": 1},
+            ".icon": {"fill": colors["name"]},
+            ".name": {"font-size": "26px", "font-weight": 700, "fill": colors["name"]},
+            ".pill": {"fill": colors["pill_bg"]},
+            ".cat": {"font-size": "12px", "fill": colors["muted"], "text-anchor": "middle"},
+            ".by": {"font-size": "15px", "fill": colors["muted"]},
+            ".desc": {"font-size": "16px", "fill": colors["text"]},
+        }
+    )
+    icon = symbol("raRepo", "0 0 16 16", f'<path d="{REPO_ICON}"/>')
+    return f"<defs>{style}{icon}</defs>"
+
+
+def build_card(repo: dict[str, str], x_offset: int) -> str:
     name = _esc(_truncate(repo["Display Name"], NAME_MAX_CHARS))
     author = _esc(_truncate(repo.get("Author Name", ""), 38))
     category = _esc(_truncate(repo.get("Category", ""), CAT_MAX_CHARS))
-    desc_lines = [_esc(line) for line in wrap_description(repo.get("Description", ""))]
-
-    desc_svg = "\n".join(
-        f'    <text x="64" y="{140 + i * 24}" font-family="-apple-system, BlinkMacSystemFont, '
-        f"'Segoe UI', Helvetica, Arial, sans-serif\" font-size=\"16\" fill=\"{colors['text']}\">{line}</text>"
-        for i, line in enumerate(desc_lines)
+    desc = "".join(
+        DESC_LINE.render(y=140 + i * 24, line=_esc(line))
+        for i, line in enumerate(wrap_description(repo.get("Description", "")))
     )
 
     # Category pill: top-right, aligned with the title row. (No per-card "RECENTLY
     # ADDED" kicker — the section heading above the carousel already says it.)
     pill_w = min(18 + len(category) * 7, 220)
     pill_x = 736 - pill_w
-    return f"""  <g transform="translate({x_offset}, 0)">
-    <rect x="40" y="24" width="720" height="192" rx="12" fill="{colors["card_bg"]}" stroke="{colors["border"]}" stroke-width="1"/>
-    <g transform="translate(60, 46) scale(1.4)" fill="{colors["name"]}"><path d="{REPO_ICON}"/></g>
-    <text x="98" y="66" font-family="-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif" font-size="26" font-weight="700" fill="{colors["name"]}">{name}</text>
-    <rect x="{pill_x}" y="46" width="{pill_w}" height="24" rx="12" fill="{colors["pill_bg"]}"/>
-    <text x="{pill_x + pill_w / 2}" y="62" text-anchor="middle" font-family="-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif" font-size="12" fill="{colors["muted"]}">{category}</text>
-    <text x="64" y="106" font-family="-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif" font-size="15" fill="{colors["muted"]}">by {author}</text>
-{desc_svg}
-  </g>"""
+    return CARD.render(
+        x=x_offset,
+        icon=ICON_SIZE,
+        name=name,
+        pill_x=pill_x,
+        pill_w=pill_w,
+        pill_cx=pill_x + pill_w / 2,
+        category=category,
+        author=author,
+        desc=desc,
+    )
 
 
 def build_animation(n: int, dur: float) -> tuple[str, str, str]:
@@ -162,13 +209,14 @@ def build_svg(repos: list[dict[str, str]], theme: str) -> str:
     dur = n * SECONDS_PER_CARD
 
     # n real cards + a duplicate of the first at the wrap position.
-    cards = [build_card(repo, colors, i * STEP) for i, repo in enumerate(repos)]
-    cards.append(build_card(repos[0], colors, n * STEP))
+    cards = [build_card(repo, i * STEP) for i, repo in enumerate(repos)]
+    cards.append(build_card(repos[0], n * STEP))
     cards_svg = "\n".join(cards)
 
     values, keytimes, keysplines = build_animation(n, dur)
 
     return f"""<svg viewBox="0 0 {VIEW_W} {VIEW_H}" width="100%" xmlns="http://www.w3.org/2000/svg">
+  {theme_defs(colors)}
   <clipPath id="raClip"><rect x="0" y="0" width="{VIEW_W}" height="{VIEW_H}"/></clipPath>
   <g clip-path="url(#raClip)">
     <g id="raSlider">
@@ -183,24 +231,36 @@ def build_svg(repos: list[dict[str, str]], theme: str) -> str:
 </svg>"""
 
 
+# The only columns a card (and select_recent) reads.
+CARD_COLUMNS = ("Display Name", "Author Name", "Category", "Description", "Date Added", "Active")
+
+
 def load_rows(path: Path) -> list[dict[str, str]]:
-    with path.open(encoding="utf-8", newline="") as f:
-        return list(csv.DictReader(f))
+    """Active rows, projected to CARD_COLUMNS while streaming the CSV."""
+    return [
+        dict(zip(CARD_COLUMNS, values))
+        for values in iter_rows(CARD_COLUMNS, active_only=True, csv_path=path)
+    ]
 
 
-def main() -> None:
+def main() -> int:
     rows = load_rows(CSV_PATH)
     repos = select_recent(rows, RECENT_COUNT)
     if not repos:
         print("⚠ No active entries found; nothing to render.")
-        return
+        return 0
 
-    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    budget = byte_budget(CAROUSEL_BYTE_BUDGET)
     for theme, filename in (("dark", "recently-added.svg"), ("light", "recently-added-light.svg")):
-        (ASSETS_DIR / filename).write_text(build_svg(repos, theme), encoding="utf-8")
-        print(f"✓ Generated {theme} theme: {ASSETS_DIR / filename}")
+        try:
+            size = write_svg(ASSETS_DIR / filename, build_svg(repos, theme), budget)
+        except SvgBudgetError as e:
+            print(f"✗ {e}", file=sys.stderr)
+            return 1
+        print(f"✓ Generated {theme} theme: {ASSETS_DIR / filename} ({size:,} bytes)")
     print(f"  Cards: {', '.join(r['Display Name'] for r in repos)}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -3,89 +3,207 @@
 
 Reads the sampled repo data (`data/repo-ticker.csv`) and renders a single
 horizontally-scrolling ticker of Claude-Code-related GitHub projects into
-`assets/repo-ticker.svg`.
+`assets/repo-ticker.svg`. Each repo is a precompiled group template styled by
+classes from one shared <style> block (ticker/svg_template.py); the result is
+minified and held to TICKER_BYTE_BUDGET (ticker/svg_minify.py).
 """
 
+from __future__ import annotations
+
 import csv
+import json
 import os
 import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import requests
-
 try:
+    from ticker.github_graphql import GraphQLClient, aliased_repo_query
+    from ticker.svg_minify import SvgBudgetError, byte_budget, write_svg
+    from ticker.svg_template import FONT_STACK, Template, style_block
     from ticker.ticker_filters import filter_repos
 except ImportError:  # when run directly: `python ticker/generate_ticker_svg.py`
+    from github_graphql import GraphQLClient, aliased_repo_query
+    from svg_minify import SvgBudgetError, byte_budget, write_svg
+    from svg_template import FONT_STACK, Template, style_block
     from ticker_filters import filter_repos
 
 # This repo is flat (no `scripts` package / pyproject): anchor on the script's
 # own location per project convention. ticker/ -> repo root is parents[1].
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
-_STAR_DELTA_CACHE: dict[str, int] = {}
+# Whether repo groups draw the 24h star delta next to the star count. The live
+# delta fetch below only runs when they do: with it off, a run makes no stargazer
+# queries and leaves data/star-delta-cache.json untouched.
+SHOW_STAR_DELTAS = False
 
+# Stargazer timestamps persisted across runs, so each run only fetches stars newer
+# than the last one it saw instead of paging back through a whole day. Committed by
+# the ticker workflow alongside data/repo-ticker.csv.
+STAR_CACHE_PATH = REPO_ROOT / "data" / "star-delta-cache.json"
+# An entry older than this is discarded and its repo refetched from scratch, which
+# also bounds drift from un-stars (the incremental path only ever sees new stars).
+STAR_CACHE_TTL = timedelta(hours=24)
+STAR_CACHE_VERSION = 1
 
-def fetch_recent_star_delta(
-    full_name: str, token: str, since: datetime, cache: dict[str, int]
-) -> int | None:
-    """Fetch the number of stars added since the cutoff time."""
-    if full_name in cache:
-        return cache[full_name]
-
-    owner, repo = full_name.split("/", 1)
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {token}",
-        "X-GitHub-Api-Version": "2026-03-10",
-    }
-    query = """
-    query($owner: String!, $name: String!, $cursor: String) {
-      repository(owner: $owner, name: $name) {
-        stargazers(first: 100, after: $cursor, orderBy: {field: STARRED_AT, direction: DESC}) {
-          edges { starredAt }
-          pageInfo { hasNextPage endCursor }
-        }
-      }
-    }
+# Repos folded into one aliased GraphQL query (each pulls up to 100 stargazers),
+# and how many such queries may be in flight at once.
+STAR_BATCH_SIZE = 20
+STAR_FETCH_WORKERS = 4
+
+_STARGAZERS_SELECTION = (
+    "stargazers(first: 100, after: $cursor, orderBy: {field: STARRED_AT, direction: DESC}) "
+    "{ edges { starredAt } pageInfo { hasNextPage endCursor } }"
+)
+
+
+def _parse_ts(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class StarDeltaCache:
+    """Per-repo `starredAt` timestamps inside the delta window, plus the newest seen.
+
+    {"version": 1, "repos": {"owner/repo": {"fetched_at": iso, "newest": iso | null,
+    "recent": [iso, ...]}}}. `path=None` keeps it in memory only.
     """
 
-    delta = 0
-    cursor: str | None = None
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None, path: Path | None = None) -> None:
+        self.entries = entries or {}
+        self.path = path
+
+    @classmethod
+    def load(cls, path: Path = STAR_CACHE_PATH, now: datetime | None = None) -> StarDeltaCache:
+        """Read the cache, dropping entries past STAR_CACHE_TTL; unreadable = empty."""
+        now = now or datetime.now(UTC)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        entries: dict[str, dict[str, Any]] = {}
+        if isinstance(data, dict) and data.get("version") == STAR_CACHE_VERSION:
+            for name, entry in (data.get("repos") or {}).items():
+                try:
+                    if now - _parse_ts(entry["fetched_at"]) <= STAR_CACHE_TTL:
+                        entries[name] = entry
+                except (KeyError, TypeError, ValueError):
+                    continue
+        return cls(entries, path)
+
+    def newest(self, full_name: str) -> datetime | None:
+        entry = self.entries.get(full_name)
+        return _parse_ts(entry["newest"]) if entry and entry.get("newest") else None
+
+    def record(self, full_name: str, new_stars: list[str], now: datetime, cutoff: datetime) -> int:
+        """Merge newly seen stars, prune ones older than `cutoff`; return the count."""
+        entry = self.entries.get(full_name) or {"newest": None, "recent": []}
+        recent = [ts for ts in [*new_stars, *entry["recent"]] if _parse_ts(ts) >= cutoff]
+        self.entries[full_name] = {
+            "fetched_at": now.isoformat().replace("+00:00", "Z"),
+            "newest": new_stars[0] if new_stars else entry["newest"],
+            "recent": recent,
+        }
+        return len(recent)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        payload = {"version": STAR_CACHE_VERSION, "repos": self.entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        except OSError as e:
+            print(f"⚠ Could not write {self.path.name}: {e}")
+
+
+def _collect_new(stargazers: dict[str, Any], stop_at: datetime) -> tuple[list[str], str | None]:
+    """(starredAt values newer than stop_at on this page, cursor to continue or None)."""
+    found: list[str] = []
+    for edge in stargazers.get("edges") or []:
+        starred_at = edge.get("starredAt")
+        if not starred_at:
+            continue
+        if _parse_ts(starred_at) <= stop_at:
+            return found, None  # newest-first: everything after this is already known/too old
+        found.append(starred_at)
+    page_info = stargazers.get("pageInfo") or {}
+    return found, page_info.get("endCursor") if page_info.get("hasNextPage") else None
+
+
+def _fetch_star_batch(
+    client: GraphQLClient, batch: list[tuple[str, str | None]], stop_at: dict[str, datetime]
+) -> dict[str, tuple[list[str], str | None]] | None:
+    """One aliased query for a batch of (full_name, cursor); None if it failed."""
+    repos: list[tuple[str, str, str | None]] = []
+    for name, cursor in batch:
+        owner, repo = name.split("/", 1)
+        repos.append((owner, repo, cursor))
+    query, variables = aliased_repo_query(_STARGAZERS_SELECTION, repos)
+    data = client.execute(query, variables)
+    if data is None:
+        return None
+    out: dict[str, tuple[list[str], str | None]] = {}
+    for i, (name, _) in enumerate(batch):
+        repository = data.get(f"r{i}")
+        if repository is not None:  # null alias = repo gone / renamed: no delta
+            out[name] = _collect_new(repository.get("stargazers") or {}, stop_at[name])
+    return out
+
+
+def fetch_recent_star_deltas(
+    full_names: list[str],
+    token: str,
+    since: datetime,
+    cache: StarDeltaCache | None = None,
+    client: GraphQLClient | None = None,
+    now: datetime | None = None,
+) -> dict[str, int]:
+    """Stars added since `since` for many repos, keyed by full_name.
+
+    Only stars newer than the cache's last-seen `starredAt` for a repo are fetched
+    (or back to `since` for a repo the cache doesn't know). Repos are batched
+    STAR_BATCH_SIZE to an aliased query and the batches run on a bounded thread
+    pool over one pooled session; each round fetches the next stargazer page only
+    for repos that haven't yet reached known/too-old stars. Repos whose fetch
+    failed are absent from the result (and keep their previous cache entry).
+    """
+    cache = cache if cache is not None else StarDeltaCache()
+    client = client or GraphQLClient(token, pool_size=STAR_FETCH_WORKERS)
+    now = now or datetime.now(UTC)
     cutoff = since.astimezone(UTC)
+    names = [name for name in dict.fromkeys(full_names) if "/" in name]
+    stop_at = {name: max(cutoff, cache.newest(name) or cutoff) for name in names}
+    found: dict[str, list[str]] = {name: [] for name in names}
+    pending: dict[str, str | None] = dict.fromkeys(names)
+    deltas: dict[str, int] = {}
+
+    while pending:
+        items = list(pending.items())
+        batches = [items[i : i + STAR_BATCH_SIZE] for i in range(0, len(items), STAR_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=STAR_FETCH_WORKERS) as pool:
+            results = list(pool.map(lambda b: _fetch_star_batch(client, b, stop_at), batches))
+        pending = {}
+        for batch, result in zip(batches, results):
+            for name, _ in batch:
+                if result is None or name not in result:
+                    continue  # failed: report nothing rather than a partial count
+                stars, cursor = result[name]
+                found[name] += stars
+                if cursor is None:
+                    deltas[name] = cache.record(name, found[name], now, cutoff)
+                else:
+                    pending[name] = cursor
+    return deltas
+
 
-    while True:
-        payload = {"query": query, "variables": {"owner": owner, "name": repo, "cursor": cursor}}
-        response = requests.post(
-            "https://api.github.com/graphql", json=payload, headers=headers, timeout=20
-        )
-        if response.status_code != 200:
-            return None
-        data = response.json()
-        if "errors" in data:
-            return None
-
-        stargazers = data.get("data", {}).get("repository", {}).get("stargazers", {})
-        edges = stargazers.get("edges", [])
-        page_info = stargazers.get("pageInfo", {})
-
-        for edge in edges:
-            starred_at = edge.get("starredAt")
-            if not starred_at:
-                continue
-            starred_dt = datetime.fromisoformat(starred_at.replace("Z", "+00:00"))
-            if starred_dt < cutoff:
-                cache[full_name] = delta
-                return delta
-            delta += 1
-
-        if not page_info.get("hasNextPage"):
-            break
-        cursor = page_info.get("endCursor")
-
-    cache[full_name] = delta
-    return delta
+def fetch_recent_star_delta(
+    full_name: str, token: str, since: datetime, cache: StarDeltaCache | None = None
+) -> int | None:
+    """Fetch the number of stars added since the cutoff time (single repo)."""
+    return fetch_recent_star_deltas([full_name], token, since, cache).get(full_name)
 
 
 def apply_recent_star_deltas(repos: list[dict[str, Any]]) -> None:
@@ -94,11 +212,15 @@ def apply_recent_star_deltas(repos: list[dict[str, Any]]) -> None:
     if not token:
         return
 
-    cutoff = datetime.now(UTC) - timedelta(days=1)
+    now = datetime.now(UTC)
+    cache = StarDeltaCache.load(STAR_CACHE_PATH, now)
+    deltas = fetch_recent_star_deltas(
+        [repo["full_name"] for repo in repos], token, now - timedelta(days=1), cache, now=now
+    )
+    cache.save()
     for repo in repos:
-        delta = fetch_recent_star_delta(repo["full_name"], token, cutoff, _STAR_DELTA_CACHE)
-        if delta is not None:
-            repo["stars_delta"] = delta
+        if repo["full_name"] in deltas:
+            repo["stars_delta"] = deltas[repo["full_name"]]
 
 
 def format_number(num: int) -> str:
@@ -148,72 +270,73 @@ def load_repos(csv_path: Path) -> list[dict[str, Any]]:
     return repos
 
 
+# Minified size limit for assets/repo-ticker.svg (SVG_BYTE_BUDGET overrides it).
+TICKER_BYTE_BUDGET = 6_000
+
+# Clean, minimal palette (GitHub light).
+TEXT_COLOR = "#24292e"
+OWNER_COLOR = "#586069"
+STARS_COLOR = "#6a737d"
+BORDER_COLOR = "#e1e4e8"
+
+TICKER_STYLE = style_block(
+    {
+        "text": {"font-family": FONT_STACK},
+        ".repo": {"font-size": "34px", "font-weight": 600, "fill": TEXT_COLOR},
+        ".owner": {"font-size": "24px", "font-weight": 400, "fill": OWNER_COLOR},
+        ".stars": {"font-size": "16px", "font-weight": 500, "fill": STARS_COLOR},
+        ".up": {"fill": "#22863a"},
+        ".down": {"fill": "#cb2431"},
+        ".label": {"font-size": "14px", "font-weight": 600, "text-anchor": "middle", "fill": OWNER_COLOR},
+        ".title": {"fill": TEXT_COLOR},
+        ".note": {"font-size": "12px", "font-weight": 500},
+    }
+)
+
+OWNER_START_X = 140
+APPROX_CHAR_WIDTH = 12
+
+REPO_GROUP = Template(
+    """      <g transform="translate({x}, 0)">
+        <text class="repo" x="140" y="{repo_y}">{name}</text>
+        <text class="owner" x="140" y="{owner_y}">{owner}</text>
+        <text class="stars" x="{star_x}" y="{owner_y}">| {stars}</text>{delta}
+      </g>"""
+)
+DELTA = Template('\n        <text class="stars {sign}" x="{x}" y="{y}"> {text}</text>')
+
+
 def generate_repo_group(repo: dict[str, Any], x_offset: int, flip: bool) -> str:
-    """Generate the SVG group for a single repository (clean, minimal styling)."""
+    """Generate the SVG group for a single repository (clean, minimal styling).
+
+    Repo name on top with the owner just below, or (flip) owner on top with the
+    repo name in the lower half.
+    """
     parts = repo["full_name"].split("/", 1)
     owner = parts[0] if len(parts) > 0 else ""
     repo_name = parts[1] if len(parts) > 1 else ""
 
-    truncated_repo_name = truncate_repo_name(repo_name, max_length=24)
-
-    delta_text = format_delta(repo["stars_delta"])
-    # show_delta = delta_text != "0"
-    show_delta = False
-    approx_char_width = 12
-    owner_start_x = 140
-    owner_font_size = 24
-
-    text_color = "#24292e"  # GitHub dark
-    owner_color = "#586069"  # GitHub secondary
-    stars_color = "#6a737d"  # muted gray
-    delta_positive = "#22863a"
-    delta_negative = "#cb2431"
-
-    if repo["stars_delta"] > 0:
-        delta_color = delta_positive
-    elif repo["stars_delta"] < 0:
-        delta_color = delta_negative
-    else:
-        delta_color = stars_color
-
-    font_family = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif"
-
-    def star_snippet(y_pos: int) -> str:
-        star_str = f"{format_number(repo['stars'])} ★"
-        delta_str = f" {delta_text}" if show_delta else ""
-        star_x = owner_start_x + (len(owner) * approx_char_width) + 22
-        result = f"""
-        <text x="{star_x}" y="{y_pos}" font-family="{font_family}" font-size="16" font-weight="500"
-              fill="{stars_color}">| {star_str}</text>"""
-        if show_delta:
-            delta_x = star_x + (len(f"| {star_str}") * 9) + 5
-            result += f"""
-        <text x="{delta_x}" y="{y_pos}" font-family="{font_family}" font-size="16" font-weight="500"
-              fill="{delta_color}">{delta_str}</text>"""
-        return result
-
-    if not flip:
-        # Repo name on top, owner just below.
-        return f"""      <!-- Repo: {repo["full_name"]} -->
-      <g transform="translate({x_offset}, 0)">
-        <!-- Repo name -->
-        <text x="140" y="32" font-family="{font_family}" font-size="34" font-weight="600"
-              fill="{text_color}">{truncated_repo_name}</text>
-        <!-- Owner name -->
-        <text x="{owner_start_x}" y="64" font-family="{font_family}" font-size="{owner_font_size}" font-weight="400"
-              fill="{owner_color}">{owner}</text>{star_snippet(64)}
-      </g>"""
-    else:
-        # Owner on top, repo name just below (lower half).
-        return f"""      <!-- Repo: {repo["full_name"]} -->
-      <g transform="translate({x_offset}, 0)">
-        <!-- Owner name -->
-        <text x="{owner_start_x}" y="102" font-family="{font_family}" font-size="{owner_font_size}" font-weight="400"
-              fill="{owner_color}">{owner}</text>{star_snippet(102)}
-        <!-- Repo name -->
-        <text x="140" y="132" font-family="{font_family}" font-size="34" font-weight="600"
-              fill="{text_color}">{truncated_repo_name}</text>
-      </g>"""
+    repo_y, owner_y = (132, 102) if flip else (32, 64)
+    star_str = f"{format_number(repo['stars'])} ★"
+    star_x = OWNER_START_X + (len(owner) * APPROX_CHAR_WIDTH) + 22
+
+    show_delta = SHOW_STAR_DELTAS and repo["stars_delta"] != 0
+    delta = ""
+    if show_delta:
+        sign = "up" if repo["stars_delta"] > 0 else "down" if repo["stars_delta"] < 0 else ""
+        delta_x = star_x + (len(f"| {star_str}") * 9) + 5
+        delta = DELTA.render(sign=sign, x=delta_x, y=owner_y, text=format_delta(repo["stars_delta"]))
+
+    return REPO_GROUP.render(
+        x=x_offset,
+        repo_y=repo_y,
+        name=truncate_repo_name(repo_name, max_length=24),
+        owner_y=owner_y,
+        owner=owner,
+        star_x=star_x,
+        stars=star_str,
+        delta=delta,
+    )
 
 
 def generate_ticker_svg(repos: list[dict[str, Any]]) -> str:
@@ -221,7 +344,10 @@ def generate_ticker_svg(repos: list[dict[str, Any]]) -> str:
     # Apply the declarative exclusion filters (ticker/ticker_filters.py), then sample.
     filtered_repos = filter_repos(repos)
     sampled = random.sample(filtered_repos, min(10, len(filtered_repos)))
-    # apply_recent_star_deltas(sampled)
+    # Real 24h star counts for the sample (no-op without GITHUB_TOKEN), fetched only
+    # when they're drawn: batched GraphQL queries for all sampled repos.
+    if SHOW_STAR_DELTAS:
+        apply_recent_star_deltas(sampled)
 
     repo_groups = []
     x_pos = 0
@@ -239,14 +365,13 @@ def generate_ticker_svg(repos: list[dict[str, Any]]) -> str:
     duration = max(28, primary_width // 55)  # slightly slower for mobile legibility
 
     bg_color = "#ffffff"
-    border_color = "#e1e4e8"
+    border_color = BORDER_COLOR
     label_bg = "#f6f8fa"
-    label_title = "#24292e"
-    label_subtitle = "#586069"
     fade_color = "#ffffff"
 
     return f"""<svg width="900" height="150" xmlns="http://www.w3.org/2000/svg">
   <defs>
+    {TICKER_STYLE}
     <!-- Edge fade effects -->
     <linearGradient id="leftFade" x1="0%" y1="0%" x2="100%" y2="0%">
       <stop offset="0%" style="stop-color:{fade_color};stop-opacity:1"/>
@@ -272,12 +397,9 @@ def generate_ticker_svg(repos: list[dict[str, Any]]) -> str:
 
   <!-- Ticker label on left -->
   <rect x="0" y="0" width="120" height="150" fill="{label_bg}" rx="8"/>
-  <text x="60" y="50" font-family="-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif" font-size="14" font-weight="600"
-        fill="{label_title}" text-anchor="middle">CLAUDE CODE</text>
-  <text x="60" y="72" font-family="-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif" font-size="14" font-weight="600"
-        fill="{label_subtitle}" text-anchor="middle">PROJECTS</text>
-  <text x="60" y="100" font-family="-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif" font-size="12" font-weight="500"
-        fill="{label_subtitle}" text-anchor="middle">Daily Δ</text>
+  <text class="label title" x="60" y="50">CLAUDE CODE</text>
+  <text class="label" x="60" y="72">PROJECTS</text>
+  <text class="label note" x="60" y="100">Daily Δ</text>
 
   <!-- Simple indicator dot -->
   <circle cx="60" cy="122" r="4" fill="#22863a" opacity="0.8"/>
@@ -312,26 +434,30 @@ def generate_ticker_svg(repos: list[dict[str, Any]]) -> str:
 </svg>"""
 
 
-def main() -> None:
+def main() -> int:
     """Regenerate the ticker SVG from the sampled repo data."""
     csv_path = REPO_ROOT / "data" / "repo-ticker.csv"
     output_path = REPO_ROOT / "assets" / "repo-ticker.svg"
 
     if not csv_path.exists():
         print(f"⚠ CSV not found at {csv_path}; keeping the existing ticker SVG")
-        return
+        return 0
 
     print(f"Loading repository data from {csv_path}...")
     repos = load_repos(csv_path)
     print(f"✓ Loaded {len(repos)} repositories")
     if not repos:
         print("⚠ No repositories in CSV; keeping the existing ticker SVG")
-        return
+        return 0
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(generate_ticker_svg(repos), encoding="utf-8")
-    print(f"✓ Generated ticker: {output_path}")
+    try:
+        size = write_svg(output_path, generate_ticker_svg(repos), byte_budget(TICKER_BYTE_BUDGET))
+    except SvgBudgetError as e:
+        print(f"✗ {e}; keeping the existing ticker SVG", file=sys.stderr)
+        return 1
+    print(f"✓ Generated ticker: {output_path} ({size:,} bytes)")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
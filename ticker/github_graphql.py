@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Small GitHub GraphQL client for the ticker scripts.
+
+One pooled `requests.Session` shared by every call (and every worker thread),
+retries that honor `Retry-After` and the `X-RateLimit-Remaining` / `-Reset`
+headers, and a helper that folds many per-repository selections into a single
+aliased query, so N repos cost one round-trip instead of N.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import requests
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Never sleep longer than this for a rate-limit reset; past it the call gives up
+# (returns None) so a scheduled job fails soft instead of idling for an hour.
+MAX_RATE_LIMIT_WAIT = 60.0
+RETRY_STATUSES = {403, 429, 502, 503, 504}
+
+
+class GraphQLClient:
+    """POSTs GraphQL queries over a pooled session; thread-safe for concurrent use."""
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        endpoint: str = GRAPHQL_URL,
+        session: requests.Session | None = None,
+        pool_size: int = 8,
+        max_retries: int = 3,
+        timeout: float = 20,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.endpoint = endpoint
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.sleep = sleep
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "X-GitHub-Api-Version": "2026-03-10",
+        }
+
+    def _wait_seconds(self, response: Any) -> float | None:
+        """How long the server asked us to back off, or None if it didn't say."""
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                return None
+        if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+            try:
+                return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+            except ValueError:
+                return None
+        return None
+
+    def execute(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """Run one query; return its `data` object, or None on failure.
+
+        Partial results (GraphQL `errors` alongside `data`, e.g. one aliased repo
+        that no longer exists) are returned as-is; missing aliases read as null.
+        """
+        payload = {"query": query, "variables": variables or {}}
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(
+                    self.endpoint, json=payload, headers=self.headers, timeout=self.timeout
+                )
+            except requests.exceptions.RequestException:
+                return None
+            wait = self._wait_seconds(response)
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                wait = 2.0**attempt if wait is None else wait
+                if wait > MAX_RATE_LIMIT_WAIT:
+                    return None
+                self.sleep(wait)
+                continue
+            if response.status_code != 200:
+                return None
+            try:
+                data = response.json()
+            except ValueError:  # a 200 that isn't JSON (proxy / error page)
+                return None
+            if not isinstance(data, dict) or not data.get("data"):
+                return None
+            # Budget spent: pause before handing control back so the *next* call
+            # (possibly from another worker) doesn't burn a request on a 403.
+            if wait and response.headers.get("X-RateLimit-Remaining") == "0":
+                self.sleep(min(wait, MAX_RATE_LIMIT_WAIT))
+            return data["data"]
+        return None
+
+
+def aliased_repo_query(
+    selection: str, repos: Sequence[tuple[str, str, str | None]], cursor_type: str = "String"
+) -> tuple[str, dict[str, Any]]:
+    """One query selecting `selection` on each of `repos` ((owner, name, cursor)).
+
+    Repo i is aliased `r{i}` and gets variables `$o{i}`/`$n{i}`/`$c{i}`; inside
+    `selection`, `$cursor` refers to that repo's cursor. A selection without
+    `$cursor` declares no cursor variables (GraphQL rejects unused ones). Values
+    travel as variables, never interpolated, so a hostile repo name can't alter
+    the query.
+    """
+    uses_cursor = "$cursor" in selection
+    params: list[str] = []
+    fields: list[str] = []
+    variables: dict[str, Any] = {}
+    for i, (owner, name, cursor) in enumerate(repos):
+        params += [f"$o{i}: String!", f"$n{i}: String!"]
+        variables.update({f"o{i}": owner, f"n{i}": name})
+        if uses_cursor:
+            params.append(f"$c{i}: {cursor_type}")
+            variables[f"c{i}"] = cursor
+        fields.append(
+            f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {selection.replace('$cursor', f'$c{i}')} }}"
+        )
+    return f"query({', '.join(params)}) {{\n  " + "\n  ".join(fields) + "\n}", variables
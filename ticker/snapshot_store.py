@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Append-only time series of repo-ticker metrics.
+
+Every fetch appends (timestamp, full_name, stars, watchers, forks) rows to
+`data/repo-ticker-history.csv`, but only for repos whose metrics changed since
+their last recorded row. A repo's value at any moment is therefore its latest
+row at or before that moment, so the file grows with the number of *changes*,
+not with a full copy of the table per run.
+
+On load, rows are indexed per repo (sorted timestamps + values), which makes
+"value N hours ago" a bisect, so 24h / 7d deltas need no extra API calls.
+
+Retention: record(..., keep_since=T) drops every row older than T except each
+repo's last one before T (its value at T), so the file stays bounded by the
+longest window a reader asks about. Pass the oldest timestamp any reader will
+look up. A run that drops rows rewrites the file atomically; otherwise it only
+appends.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from resources.safe_io import atomic_write_text  # noqa: E402
+
+HISTORY_PATH = REPO_ROOT / "data" / "repo-ticker-history.csv"
+
+FIELDNAMES = ["timestamp", "full_name", "stars", "watchers", "forks"]
+METRICS = ("stars", "watchers", "forks")
+
+Metrics = tuple[int, int, int]
+
+
+class SnapshotStore:
+    """Per-repo index over the history file: full_name -> (timestamps, values)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._times: dict[str, list[int]] = {}
+        self._values: dict[str, list[Metrics]] = {}
+
+    @classmethod
+    def load(cls, path: Path = HISTORY_PATH) -> SnapshotStore:
+        store = cls(path)
+        if not path.exists():
+            return store
+        rows: list[tuple[int, str, Metrics]] = []
+        with path.open("r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                metrics = (int(row["stars"]), int(row["watchers"]), int(row["forks"]))
+                rows.append((int(row["timestamp"]), row["full_name"], metrics))
+        # Appends are chronological already; sorting makes a hand-merged file safe.
+        rows.sort(key=lambda r: r[0])
+        for ts, name, metrics in rows:
+            store._times.setdefault(name, []).append(ts)
+            store._values.setdefault(name, []).append(metrics)
+        return store
+
+    @property
+    def earliest(self) -> int | None:
+        """Timestamp of the oldest recorded row (None for an empty store)."""
+        firsts = [times[0] for times in self._times.values()]
+        return min(firsts) if firsts else None
+
+    def as_of(self, full_name: str, timestamp: int) -> Metrics | None:
+        """A repo's (stars, watchers, forks) at `timestamp`, or None if not yet seen."""
+        times = self._times.get(full_name)
+        if not times:
+            return None
+        i = bisect_right(times, timestamp)
+        return self._values[full_name][i - 1] if i else None
+
+    def snapshot_as_of(self, timestamp: int) -> dict[str, dict[str, int]]:
+        """Every repo known at `timestamp`, in load_previous_data's shape."""
+        snapshot = {}
+        for name in self._times:
+            metrics = self.as_of(name, timestamp)
+            if metrics is not None:
+                snapshot[name] = dict(zip(METRICS, metrics))
+        return snapshot
+
+    def record(self, repos: list[dict[str, Any]], timestamp: int, keep_since: int | None = None) -> int:
+        """Append a row for each repo whose metrics changed; returns rows written.
+
+        With `keep_since`, rows no lookup at or after it can reach are dropped
+        first (see the module docstring).
+        """
+        new_rows = []
+        for repo in repos:
+            name = repo["full_name"]
+            metrics: Metrics = (repo["stars"], repo["watchers"], repo["forks"])
+            if self.as_of(name, timestamp) == metrics:
+                continue
+            self._times.setdefault(name, []).append(timestamp)
+            self._values.setdefault(name, []).append(metrics)
+            new_rows.append({"timestamp": timestamp, "full_name": name, **dict(zip(METRICS, metrics))})
+
+        if keep_since is not None and self._prune(keep_since):
+            self._rewrite()
+        elif new_rows:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_header = not self.path.exists() or self.path.stat().st_size == 0
+            with self.path.open("a", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=FIELDNAMES, lineterminator="\n")
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(new_rows)
+        return len(new_rows)
+
+    def _prune(self, keep_since: int) -> int:
+        """Drop each repo's rows before `keep_since` but its last one; returns rows dropped."""
+        dropped = 0
+        for name, times in self._times.items():
+            stale = bisect_left(times, keep_since) - 1  # rows before the newest pre-window one
+            if stale > 0:
+                del times[:stale]
+                del self._values[name][:stale]
+                dropped += stale
+        return dropped
+
+    def _rewrite(self) -> None:
+        rows = sorted(
+            (ts, name, metrics)
+            for name, times in self._times.items()
+            for ts, metrics in zip(times, self._values[name])
+        )
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(FIELDNAMES)
+        writer.writerows((ts, name, *metrics) for ts, name, metrics in rows)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, buf.getvalue())
@@ -0,0 +1,104 @@
+"""Minify generated SVG assets and hold them to a byte budget.
+
+Shared post-processing for every SVG the generators write (repo ticker,
+"Recently Added" carousel, static badges). These files are fetched on every
+README view, so before writing, minify_svg():
+
+  * strips comments,
+  * drops whitespace-only text between tags and collapses whitespace inside tags,
+  * rounds decimals in attribute values to `precision` places (no trailing zeros),
+  * removes duplicated attributes (the last one wins — a duplicate would make the
+    document ill-formed) and x/y attributes that just restate the default 0.
+
+Text content is left alone. minify_svg() is a pure function of its input, so a
+generator's output stays deterministic for a given seed and input.
+
+write_svg() refuses to write an asset whose minified size exceeds its byte
+budget (raising SvgBudgetError and leaving the previous file in place), so a
+template change that bloats an asset fails the build instead of shipping. Writes
+are atomic (resources/safe_io.py), so a reader never sees a half-written asset.
+SVG_BYTE_BUDGET=<bytes> overrides every budget for one run; 0 disables them.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from resources.safe_io import atomic_write_bytes  # noqa: E402
+
+DEFAULT_PRECISION = 2
+
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_TAG = re.compile(r"<([A-Za-z][\w:.-]*)((?:\s+[\w:.-]+\s*=\s*\"[^\"]*\")*)\s*(/?)>")
+_ATTR = re.compile(r"([\w:.-]+)\s*=\s*\"([^\"]*)\"")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_DECIMAL = re.compile(r"-?\d*\.\d+")
+# Attributes holding prose rather than geometry: never rounded.
+_PROSE_ATTRS = {"aria-label", "alt", "title", "id", "href", "class"}
+# Elements whose x / y default to 0.
+_XY_DEFAULT_ZERO = {"rect", "use", "text", "image"}
+
+
+class SvgBudgetError(ValueError):
+    """A minified SVG is larger than its byte budget."""
+
+
+def _round(match: re.Match[str], precision: int) -> str:
+    # Leading zeros go too (".75"), as in path data. A number that loses its point
+    # and runs into a following ".5" ("1.00.5") keeps a separating space.
+    text = f"{float(match.group()):.{precision}f}".rstrip("0").rstrip(".")
+    text = re.sub(r"^(-?)0(?=\.)", r"\1", text)
+    if text in ("", "-", "-0"):
+        text = "0"
+    following = match.string[match.end() : match.end() + 1]
+    return text + " " if following == "." and "." not in text else text
+
+
+def _minify_tag(match: re.Match[str], precision: int) -> str:
+    name, attrs, self_closing = match.groups()
+    values: dict[str, str] = {}
+    for attr, value in _ATTR.findall(attrs):
+        values.pop(attr, None)  # a repeated attribute: keep the last, in its position
+        if attr not in _PROSE_ATTRS:
+            value = " ".join(value.split())
+            value = _DECIMAL.sub(lambda m: _round(m, precision), value)
+        values[attr] = value
+    if name in _XY_DEFAULT_ZERO:
+        for attr in ("x", "y"):
+            if values.get(attr) == "0":
+                del values[attr]
+    rendered = "".join(f' {attr}="{value}"' for attr, value in values.items())
+    return f"<{name}{rendered}{self_closing}>"
+
+
+def minify_svg(svg: str, precision: int = DEFAULT_PRECISION) -> str:
+    """The same drawing in fewer bytes (see the module docstring)."""
+    svg = _COMMENT.sub("", svg)
+    svg = _BETWEEN_TAGS.sub("><", svg.strip())
+    return _TAG.sub(lambda m: _minify_tag(m, precision), svg)
+
+
+def byte_budget(default: int) -> int:
+    """`default`, unless SVG_BYTE_BUDGET overrides it (0 = no budget)."""
+    override = os.environ.get("SVG_BYTE_BUDGET", "").strip()
+    return int(override) if override else default
+
+
+def write_svg(path: Path, svg: str, budget: int, precision: int = DEFAULT_PRECISION) -> int:
+    """Minify `svg` and write it to `path` if it fits `budget` bytes (0 = unbounded).
+
+    Returns the number of bytes written; raises SvgBudgetError (writing nothing)
+    when the budget is exceeded.
+    """
+    data = minify_svg(svg, precision).encode("utf-8")
+    if budget and len(data) > budget:
+        raise SvgBudgetError(f"{path.name} is {len(data):,} bytes minified, over its {budget:,}-byte budget")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, data)
+    return len(data)
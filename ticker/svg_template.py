@@ -0,0 +1,65 @@
+"""Precompiled SVG fragments shared by the ticker and carousel generators.
+
+Both generators emit the same few elements over and over (one group per repo,
+one card per resource). Instead of rebuilding a large f-string per item, each
+repeated fragment is a Template parsed once at import into its literal pieces
+and field names; rendering is a single join of those pieces with the item's
+values. Styling that used to be repeated on every element (font stack, sizes,
+colors) lives in one <style> block as classes built by style_block(), and a
+repeated shape (the repo octicon) is defined once as a <symbol> and placed with
+<use>. Output is smaller and cheaper to produce; it is still plain SVG that
+GitHub's image proxy serves unchanged.
+"""
+
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any
+
+FONT_STACK = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif"
+
+
+class Template:
+    """A fragment with `{name}` / `{name:spec}` fields, compiled once.
+
+    `render(**values)` joins the literal pieces with the formatted values; every
+    field must be supplied. `{{` / `}}` are literal braces, as in str.format.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.literals: list[str] = []
+        self.fields: list[tuple[str, str]] = []
+        literal = ""
+        for text, name, spec, conversion in Formatter().parse(source):
+            literal += text
+            if name is None:
+                continue
+            if not name.isidentifier() or conversion:
+                raise ValueError(f"unsupported template field {{{name}}} in {source[:40]!r}")
+            self.literals.append(literal)
+            self.fields.append((name, spec or ""))
+            literal = ""
+        self.tail = literal
+
+    def render(self, **values: Any) -> str:
+        parts: list[str] = []
+        for literal, (name, spec) in zip(self.literals, self.fields):
+            parts.append(literal)
+            value = values[name]
+            parts.append(format(value, spec) if spec else str(value))
+        parts.append(self.tail)
+        return "".join(parts)
+
+
+def style_block(rules: dict[str, dict[str, Any]]) -> str:
+    """`<style>` with one rule per selector, properties in the given order."""
+    body = "".join(
+        selector + "{" + ";".join(f"{prop}:{value}" for prop, value in props.items()) + "}"
+        for selector, props in rules.items()
+    )
+    return f"<style>{body}</style>"
+
+
+def symbol(symbol_id: str, view_box: str, body: str) -> str:
+    """A reusable shape for <defs>; place it with `<use href="#{symbol_id}" .../>`."""
+    return f'<symbol id="{symbol_id}" viewBox="{view_box}">{body}</symbol>'